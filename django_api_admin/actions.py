@@ -1,3 +1,7 @@
+import logging
+from collections import Counter
+
+from django.db import DatabaseError, router, transaction
 from django.utils.translation import gettext_lazy, gettext as _
 
 from rest_framework import status
@@ -8,6 +12,8 @@ from django_api_admin.utils.model_ngettext import model_ngettext
 from django_api_admin.utils.get_deleted_objects import get_deleted_objects
 from django_api_admin.decorators import action
 
+logger = logging.getLogger("django_api_admin.actions")
+
 
 @action(permissions=["delete"], description=gettext_lazy("Delete selected %(verbose_name_plural)s"))
 def delete_selected(modeladmin, request, queryset):
@@ -15,7 +21,12 @@ def delete_selected(modeladmin, request, queryset):
     default api_admin action deletes the selected objects
     no confirmation page
     """
-    _deletable_objects, _model_count, perms_needed, _protected = get_deleted_objects(queryset, request, modeladmin.admin_site)
+    if modeladmin.delete_selected_chunk_size:
+        return delete_selected_in_chunks(modeladmin, request, queryset)
+
+    _deletable_objects, _model_count, perms_needed, _protected = get_deleted_objects(
+        queryset, request, modeladmin.admin_site, summary=True
+    )
 
     # Check the permissions
     if perms_needed:
@@ -32,3 +43,82 @@ def delete_selected(modeladmin, request, queryset):
     modeladmin.delete_queryset(request, queryset)
     msg = _("Successfully deleted %s %s.") % (n, model_ngettext(modeladmin.opts, n))
     return Response({"detail": msg}, status=status.HTTP_200_OK)
+
+
+def delete_selected_in_chunks(modeladmin, request, queryset):
+    """
+    Delete the selected objects ``delete_selected_chunk_size`` objects at a
+    time, in the order of their primary keys. Each chunk is checked, logged
+    and deleted in its own transaction, and the deletion stops at the first
+    chunk with protected related objects or related objects the user can't
+    delete. Return a summary of the deleted objects instead of the nested
+    list of the related objects.
+
+    The deletion isn't atomic: the chunks deleted before a chunk stops or
+    fails stay deleted. The summary reports their number in ``deleted``, and
+    the positions of the chunks whose deletion failed with a database error,
+    which are rolled back and skipped, in ``failed``.
+    """
+    chunk_size = modeladmin.delete_selected_chunk_size
+    using = router.db_for_write(modeladmin.model)
+    queryset = queryset.order_by("pk")
+
+    deleted, model_count, failed = 0, Counter(), []
+    perms_needed, protected = set(), []
+    last_pk = None
+    start = 0
+    while True:
+        chunk_queryset = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+        chunk = list(chunk_queryset[:chunk_size])
+        if not chunk:
+            break
+        last_pk = chunk[-1].pk
+
+        try:
+            with transaction.atomic(using=using):
+                _deletable_objects, chunk_model_count, perms_needed, protected = modeladmin.get_deleted_objects(
+                    chunk, request, summary=True
+                )
+                if perms_needed or protected:
+                    break
+                modeladmin.log_deletion(request, chunk)
+                modeladmin.delete_queryset(request, queryset.filter(pk__in=[obj.pk for obj in chunk]))
+        except DatabaseError as e:
+            logger.exception("Failed to delete the objects %d to %d.", start, start + len(chunk))
+            failed.append({"start": start, "stop": start + len(chunk), "message": str(e)})
+        else:
+            deleted += len(chunk)
+            model_count.update({str(name): count for name, count in chunk_model_count.items()})
+        start += len(chunk)
+
+    summary = {
+        "deleted": deleted,
+        "model_count": dict(model_count),
+        "perms_needed": sorted(str(name) for name in perms_needed),
+        "protected": protected,
+        "failed": failed,
+    }
+    # The name is counted from the chunk the deletion stopped at, without
+    # counting the rest of the selection.
+    if perms_needed:
+        msg = _("Cannot delete %(name)s") % {"name": model_ngettext(modeladmin.opts, len(chunk))}
+        if not deleted:
+            raise PermissionDenied(detail=msg)
+        return Response({"detail": msg, "data": summary}, status=status.HTTP_403_FORBIDDEN)
+    if protected:
+        msg = _("Cannot delete %(name)s because they have protected related objects.") % {
+            "name": model_ngettext(modeladmin.opts, len(chunk))
+        }
+        return Response({"detail": msg, "data": summary}, status=status.HTTP_409_CONFLICT)
+    if failed:
+        count = sum(chunk["stop"] - chunk["start"] for chunk in failed)
+        msg = _("Deleted %(deleted)s %(deleted_name)s, failed to delete %(count)s %(name)s.") % {
+            "deleted": deleted,
+            "deleted_name": model_ngettext(modeladmin.opts, deleted),
+            "count": count,
+            "name": model_ngettext(modeladmin.opts, count),
+        }
+        return Response({"detail": msg, "data": summary}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+    msg = _("Successfully deleted %s %s.") % (deleted, model_ngettext(modeladmin.opts, deleted))
+    return Response({"detail": msg, "data": summary}, status=status.HTTP_200_OK)
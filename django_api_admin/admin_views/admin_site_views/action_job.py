@@ -0,0 +1,57 @@
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework import status
+from rest_framework.exceptions import NotFound
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from drf_spectacular.utils import extend_schema, OpenApiResponse, OpenApiParameter
+
+from django_api_admin.models import ActionJob
+from django_api_admin.openapi import CommonAPIResponses
+from django_api_admin.serializers import ActionJobResponseSerializer
+from django_api_admin.mixins import APIAdminErrorViewMixin
+
+
+class ActionJobView(APIAdminErrorViewMixin, APIView):
+    """
+    Retrieve the status and progress of a background admin action.
+
+    Actions decorated with `@action(background=True)` respond with the URL of
+    this endpoint, which reports how many of the selected objects the action
+    ran on and the errors of the chunks it failed on. Users can only see
+    their own jobs, unless they are superusers.
+    """
+
+    serializer_class = None
+    permission_classes = []
+    admin_site = None
+
+    @extend_schema(
+        operation_id="Retrieve an admin action job",
+        parameters=[
+            OpenApiParameter(name="job_id", type=int, location=OpenApiParameter.PATH, description=_("The ID of the job.")),
+        ],
+        responses={
+            200: OpenApiResponse(
+                description=_("The job of the background action"),
+                response=ActionJobResponseSerializer,
+            ),
+            401: CommonAPIResponses.unauthorized(),
+            403: CommonAPIResponses.permission_denied(),
+            404: CommonAPIResponses.not_found(_("There is no job with this ID.")),
+        },
+        tags=["admin-jobs"],
+    )
+    def get(self, request, job_id):
+        try:
+            job = ActionJob.objects.get(pk=job_id, site_name=self.admin_site.name)
+        except ActionJob.DoesNotExist:
+            raise NotFound
+        if job.user_id != request.user.pk and not request.user.is_superuser:
+            raise NotFound
+
+        return Response(
+            {"status": status.HTTP_200_OK, "data": self.serializer_class(job).data},
+            status=status.HTTP_200_OK,
+        )
@@ -98,11 +98,11 @@ class AutoCompleteView(APIAdminErrorViewMixin, APIView):
 
     def get_queryset(self, request):
         """Return queryset based on model_admin.get_search_results()."""
-        qs = self.model_admin.get_queryset(request)
-        qs = qs.complex_filter(self.source_field.get_limit_choices_to())
-        qs, search_use_distinct = self.model_admin.get_search_results(request, qs, self.term)
-        if search_use_distinct:
-            qs = qs.distinct()
+        root_queryset = self.model_admin.get_queryset(request)
+        qs = root_queryset.complex_filter(self.source_field.get_limit_choices_to())
+        qs, search_may_have_duplicates = self.model_admin.get_search_results(request, qs, self.term)
+        if search_may_have_duplicates:
+            qs = self.model_admin.remove_duplicates(request, qs, root_queryset)
         return qs
 
     def process_request(self, request):
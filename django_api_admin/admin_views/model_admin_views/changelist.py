@@ -1,7 +1,8 @@
-from django.db.models import Model
 from django.db import router, transaction
+from django.db.models import QuerySet
+from django.http import StreamingHttpResponse
 from django.utils.translation import gettext_lazy as _
-from django.core.exceptions import FieldDoesNotExist, ObjectDoesNotExist
+from django.core.exceptions import FieldDoesNotExist
 
 from rest_framework import status
 from rest_framework.views import APIView
@@ -11,13 +12,21 @@ from rest_framework.exceptions import ValidationError, PermissionDenied
 from drf_spectacular.utils import extend_schema, OpenApiResponse
 
 from django_api_admin.mixins import APIAdminErrorViewMixin
-from django_api_admin.exceptions import IncorrectLookupParameters
-from django_api_admin.serializers import ChangeListSerializer, ChangelistResponseSerializer, ChangelistErrorResponseSerializer
+from django_api_admin.exceptions import IncorrectLookupParameters, FieldIsAForeignKeyColumnName
+from django_api_admin.changelist import OBJECTS_LAYOUT, COLUMNS_LAYOUT
+from django_api_admin.serializers import (
+    ActionJobQueuedResponseSerializer,
+    ChangeListSerializer,
+    ChangelistResponseSerializer,
+    ChangelistErrorResponseSerializer,
+)
 from django_api_admin.openapi import CommonAPIResponses
 from django_api_admin.bulk import ChangelistBulkOperation
+from django_api_admin.renderers import StreamingJSONRenderer
+from django_api_admin.utils._get_non_gfk_field import _get_non_gfk_field
+from django_api_admin.utils.compile_column_plan import get_cell_values
 from django_api_admin.utils.get_form_fields import get_form_fields_description
 from django_api_admin.utils.label_for_field import label_for_field
-from django_api_admin.utils.lookup_field import lookup_field
 
 
 class ChangelistView(APIAdminErrorViewMixin, APIView):
@@ -49,8 +58,8 @@ class ChangelistView(APIAdminErrorViewMixin, APIView):
             raise PermissionDenied
 
         cl = self.get_changelist_instance(request)
+        streaming = self.model_admin.changelist_streaming and request.accepted_renderer.format == "json"
         columns = self.get_columns(request, cl)
-        rows = self.get_rows(request, cl)
         config = self.get_config(request, cl)
 
         serializer_class = self.get_action_serializer_class(request)
@@ -59,13 +68,24 @@ class ChangelistView(APIAdminErrorViewMixin, APIView):
 
         data = {
             "status": status.HTTP_200_OK,
-            "data": {"columns": columns, "rows": rows, "config": config, "action_form": action_form},
+            "data": {"columns": columns, "config": config, "action_form": action_form},
         }
 
         if cl.list_editable:
             list_editing_formset = self.get_list_editing_formset(request, cl)
             data["data"]["list_editing_formset"] = list_editing_formset
 
+        # The rows come last, so that streamed responses can be read before
+        # all the rows arrive.
+        if cl.layout != OBJECTS_LAYOUT:
+            data["data"].update(self.get_compact_rows(request, cl))
+        elif streaming:
+            data["data"]["rows"] = self.stream_rows(request, cl)
+            renderer = StreamingJSONRenderer()
+            return StreamingHttpResponse(renderer.stream(data), content_type=renderer.media_type)
+        else:
+            data["data"]["rows"] = self.get_rows(request, cl)
+
         return Response(
             data,
             status=status.HTTP_200_OK,
@@ -74,6 +94,10 @@ class ChangelistView(APIAdminErrorViewMixin, APIView):
     @extend_schema(
         responses={
             200: CommonAPIResponses.ok("Action was executed on selected objects"),
+            202: OpenApiResponse(
+                description=_("Background action was queued to run on selected objects"),
+                response=ActionJobQueuedResponseSerializer,
+            ),
             400: CommonAPIResponses.bad_request(),
             401: CommonAPIResponses.unauthorized(),
             403: CommonAPIResponses.permission_denied(),
@@ -123,15 +147,7 @@ class ChangelistView(APIAdminErrorViewMixin, APIView):
         )
         if cl.bulk_operation.is_valid():
             with transaction.atomic(using=router.db_for_write(self.model_admin.model)):
-                for serializer, changed_data in cl.bulk_operation.result.values():
-                    if changed_data:
-                        updated_object = self.model_admin.save_serializer(request, serializer, change=True)
-                        self.model_admin.save_model(request, updated_object, serializer, change=True)
-                        serializer.save_m2m()
-                        change_message = self.model_admin.construct_change_message(
-                            request, (serializer, changed_data), None, False
-                        )
-                        self.model_admin.log_change(request, updated_object, change_message)
+                self.model_admin.save_changelist(request, cl.bulk_operation)
 
             return Response(
                 {"status": status.HTTP_200_OK, "data": cl.bulk_operation.validated_data},
@@ -154,46 +170,81 @@ class ChangelistView(APIAdminErrorViewMixin, APIView):
         """
         Return changelist rows actual list of data.
         """
-        rows = []
-        # Generate changelist attributes (e.g result_list, paginator, result_count)
+        # The changelist attributes (e.g result_list, paginator, result_count) are
+        # generated once when the changelist is created
         cl.get_results(request)
-        empty_value_display = cl.model_admin.get_empty_value_display()
-
-        for result in cl.result_list:
-            row = {"id": result.pk, "cells": {}}
+        return list(self.iter_rows(request, cl, cl.result_list))
 
-            # Construct the `cells` dictionary
-            for field_name in self.get_fields_list(request, cl):
-                try:
-                    # Get the field value
-                    _, _, value = lookup_field(field_name, result, cl.model_admin)
-
-                    # If the value is a Model instance get the string representation
-                    if value and isinstance(value, Model):
-                        result_repr = str(value)
-                    else:
-                        result_repr = value
-
-                    # If there are choices display the choice description string instead of the value
-                    try:
-                        model_field = result._meta.get_field(field_name)
-                        choices = getattr(model_field, "choices", None)
-                        if choices:
-                            result_repr = next((choice[1] for choice in choices if choice[0] == value), None)
-                    except FieldDoesNotExist:
-                        pass
+    def stream_rows(self, request, cl):
+        """
+        Return an iterator of the changelist rows that reads the results in
+        chunks of `export_chunk_size` objects instead of all at once.
+        """
+        cl.get_results(request)
+        results = cl.result_list
+        if isinstance(results, QuerySet):
+            results = results.iterator(chunk_size=cl.model_admin.export_chunk_size)
+        return self.iter_rows(request, cl, results)
 
-                    # If the value is null set result_repr to empty_value_display
-                    if value is None:
-                        result_repr = empty_value_display
-                except ObjectDoesNotExist:
-                    result_repr = empty_value_display
+    def get_compact_rows(self, request, cl):
+        """
+        Return the changelist rows in the compact `arrays` or `columns`
+        layout, which don't repeat the field names in every row:
+
+        - `ids`: the primary key of each row.
+        - `rows`: with the `arrays` layout a list of the cell values of each
+          row ordered like the columns, with the `columns` layout a list of
+          the values of each column ordered like the rows.
+        - `dictionaries`: the columns of foreign keys and fields with choices
+          repeat few distinct values, their cells are indices into a table of
+          the distinct values of the column.
+        """
+        cl.get_results(request)
+        fields_list = self.get_fields_list(request, cl)
+        tables = {index: {} for index, field_name in enumerate(fields_list) if self.is_dictionary_column(cl, field_name)}
+
+        ids, rows = [], []
+        for pk, values in self.iter_values(request, cl, cl.result_list):
+            for index, table in tables.items():
+                values[index] = table.setdefault(values[index], len(table))
+            ids.append(pk)
+            rows.append(values)
+
+        if cl.layout == COLUMNS_LAYOUT:
+            rows = [[values[index] for values in rows] for index in range(len(fields_list))]
+        dictionaries = {fields_list[index]: list(table) for index, table in tables.items()}
+        return {"ids": ids, "rows": rows, "dictionaries": dictionaries}
+
+    def is_dictionary_column(self, cl, field_name):
+        """
+        Return True if the cells of the column are dictionary encoded in the
+        compact layouts, i.e the column displays a foreign key or a field
+        with choices.
+        """
+        try:
+            field = _get_non_gfk_field(cl.opts, field_name)
+        except (FieldDoesNotExist, FieldIsAForeignKeyColumnName):
+            return False
+        return field.many_to_one or field.one_to_one or bool(field.flatchoices)
 
-                row["cells"][field_name] = result_repr
+    def iter_rows(self, request, cl, results):
+        """
+        Yield the changelist row of each result.
+        """
+        fields_list = self.get_fields_list(request, cl)
+        for pk, values in self.iter_values(request, cl, results):
+            yield {"id": pk, "cells": dict(zip(fields_list, values))}
 
-            rows.append(row)
+    def iter_values(self, request, cl, results):
+        """
+        Yield the primary key of each result and the list of its cell values,
+        ordered like the columns.
+        """
+        empty_value_display = cl.model_admin.get_empty_value_display()
+        column_plan = cl.model_admin.get_column_plan(self.get_fields_list(request, cl))
 
-        return rows
+        for result in results:
+            yield result.pk, get_cell_values(column_plan, result, empty_value_display)
 
     def get_config(self, request, cl):
         config = {}
@@ -205,18 +256,34 @@ class ChangelistView(APIAdminErrorViewMixin, APIView):
         # Changelist pagination attributes
         config["full_count"] = cl.full_result_count
         config["result_count"] = cl.result_count
-        config["page_count"] = cl.paginator.num_pages
+        config["count_strategy"] = {
+            "full_count": cl.full_result_count_strategy,
+            "result_count": cl.result_count_strategy,
+        }
+        config["page_count"] = cl.paginator.num_pages if cl.paginator else None
+        config["next_cursor"] = cl.next_cursor
+        config["prev_cursor"] = cl.prev_cursor
 
         # A list of action names and choices
         config["action_choices"] = cl.model_admin.get_action_choices(request, [])
+        # The actions that run in the background and respond with a job
+        config["background_actions"] = [
+            name
+            for func, name, description in cl.model_admin.get_actions(request).values()
+            if getattr(func, "background", False)
+        ]
 
         # A list of filters titles and choices
-        filter_specs, _, _, _, _ = cl.get_filters(request)
+        filter_specs = cl.filter_specs
         if filter_specs:
             config["filters"] = [
                 {
                     "title": s.title,
                     "choices": list(s.choices(cl)),
+                    # Evaluated after the choices, which count the facets
+                    "facets_stale": s in cl.stale_facets,
+                    "more": s.has_more_choices,
+                    "field_path": getattr(s, "field_path", None),
                 }
                 for s in filter_specs
             ]
@@ -252,7 +319,8 @@ class ChangelistView(APIAdminErrorViewMixin, APIView):
         return formset
 
     def get_fields_list(self, request, cl):
-        list_display = cl.model_admin.list_display
+        # The list_display of the changelist is narrowed to the requested fields.
+        list_display = cl.list_display
         exclude = cl.model_admin.exclude or tuple()
         fields_list = tuple(filter(lambda item: item not in exclude, list_display))
         return fields_list
@@ -10,7 +10,7 @@ from drf_spectacular.utils import extend_schema, OpenApiResponse
 
 from django_api_admin.admins.model_admin import TO_FIELD_VAR
 from django_api_admin.openapi import CommonAPIResponses, CommonAPIPathParams, CommonAPIQueryParams
-from django_api_admin.serializers import ResponseMessageSerializer
+from django_api_admin.serializers import DeletePreviewResponseSerializer, ResponseMessageSerializer
 from django_api_admin.utils.quote import unquote
 from django_api_admin.mixins import APIAdminErrorViewMixin
 
@@ -18,7 +18,8 @@ from django_api_admin.mixins import APIAdminErrorViewMixin
 class DeleteView(APIAdminErrorViewMixin, APIView):
     """
     Deletes a single instance of the model identified by the provided object ID,
-    performing permission checks and handling related object cleanup.
+    performing permission checks and handling related object cleanup. A GET
+    request previews the related objects the deletion would delete.
     """
 
     serializer_class = ResponseMessageSerializer
@@ -26,6 +27,47 @@ class DeleteView(APIAdminErrorViewMixin, APIView):
     model_admin = None
     admin_site = None
 
+    @extend_schema(
+        parameters=[CommonAPIPathParams.object_id, CommonAPIQueryParams.to_field],
+        responses={
+            200: OpenApiResponse(
+                description=_("The objects that deleting the instance would delete"),
+                response=DeletePreviewResponseSerializer,
+            ),
+            400: CommonAPIResponses.bad_request(_("_to_field value is not allowed")),
+            401: CommonAPIResponses.unauthorized(),
+            403: CommonAPIResponses.permission_denied(),
+            404: CommonAPIResponses.not_found(_("Model instance with the given id not found")),
+        },
+    )
+    def get(self, request, object_id):
+        """
+        Preview the deletion of the instance: the nested list of the related
+        objects that would be deleted with it, their number per model, the
+        protected objects that prevent the deletion and the models the user
+        lacks the delete permission of.
+        """
+        to_field = request.query_params.get(TO_FIELD_VAR)
+        if to_field and not self.model_admin.to_field_allowed(request, to_field):
+            raise ValidationError([{"message": "The field '%s' cannot be referenced." % to_field, "param": "_to_field"}])
+
+        obj = self.model_admin.get_object(request, unquote(object_id), to_field)
+
+        if not self.model_admin.has_delete_permission(request):
+            raise PermissionDenied
+
+        if obj is None:
+            return Response({"status": status.HTTP_404_NOT_FOUND}, status=status.HTTP_404_NOT_FOUND)
+
+        deleted_objects, model_count, perms_needed, protected = self.model_admin.get_deleted_objects([obj], request)
+        data = {
+            "deleted_objects": deleted_objects,
+            "model_count": {str(name): count for name, count in model_count.items()},
+            "perms_needed": sorted(str(name) for name in perms_needed),
+            "protected": protected,
+        }
+        return Response({"status": status.HTTP_200_OK, "data": data}, status=status.HTTP_200_OK)
+
     @extend_schema(
         parameters=[CommonAPIPathParams.object_id, CommonAPIQueryParams.to_field],
         responses={
@@ -55,14 +97,14 @@ class DeleteView(APIAdminErrorViewMixin, APIView):
             if obj is None:
                 return Response({"status": status.HTTP_404_NOT_FOUND}, status=status.HTTP_404_NOT_FOUND)
 
-            # Populate deleted_objects, a data structure of all related objects
-            # that will also be deleted.
+            # Check the related objects that will also be deleted, the nested
+            # list of them is only built by the preview.
             (
                 deleted_objects,
                 model_count,
                 perms_needed,
                 protected,
-            ) = self.model_admin.get_deleted_objects([obj], request)
+            ) = self.model_admin.get_deleted_objects([obj], request, summary=True)
 
             if not protected:
                 if perms_needed:
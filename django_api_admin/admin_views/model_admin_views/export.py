@@ -0,0 +1,105 @@
+from django.http import StreamingHttpResponse
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.exceptions import ValidationError, PermissionDenied
+
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema, OpenApiResponse
+
+from django_api_admin.mixins import APIAdminErrorViewMixin
+from django_api_admin.exceptions import IncorrectLookupParameters
+from django_api_admin.serializers import ChangeListSerializer
+from django_api_admin.openapi import CommonAPIResponses
+from django_api_admin.renderers import CSVRenderer, NDJSONRenderer
+from django_api_admin.utils.compile_column_plan import get_cell_values
+from django_api_admin.utils.label_for_field import label_for_field
+
+
+class ExportView(APIAdminErrorViewMixin, APIView):
+    """
+    Streams the changelist, filtered, searched and ordered the same way, as
+    CSV or NDJSON. The format is negotiated from the `format` query parameter
+    or the Accept header.
+    """
+
+    permission_classes = []
+    model_admin = None
+    admin_site = None
+    renderer_classes = [CSVRenderer, NDJSONRenderer]
+
+    @extend_schema(
+        parameters=[ChangeListSerializer],
+        responses={
+            (200, "text/csv"): OpenApiResponse(
+                response=OpenApiTypes.STR, description=_("A header of the columns, and a record per row")
+            ),
+            (200, "application/x-ndjson"): OpenApiResponse(response=OpenApiTypes.STR, description=_("A JSON object per row")),
+            400: CommonAPIResponses.bad_request(),
+            401: CommonAPIResponses.unauthorized(),
+            403: CommonAPIResponses.permission_denied(),
+        },
+    )
+    def get(self, request):
+        """
+        Export the changelist rows.
+
+        Streams every row matching the changelist filters and search, the
+        columns are the model admin's `export_fields`.
+        """
+        if not self.model_admin.has_view_or_change_permission(request):
+            raise PermissionDenied
+
+        cl = self.get_changelist_instance(request)
+        fields_list = self.model_admin.get_export_fields(request)
+        columns = self.get_columns(request, cl, fields_list)
+        rows = self.get_rows(request, cl, fields_list)
+
+        renderer = request.accepted_renderer
+        response = StreamingHttpResponse(
+            renderer.stream(columns, rows),
+            content_type="%s; charset=%s" % (renderer.media_type, renderer.charset),
+        )
+        response["Content-Disposition"] = 'attachment; filename="%s.%s"' % (cl.opts.model_name, renderer.format)
+        return response
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        # Errors aren't rows, render them with the admin site renderers.
+        if isinstance(response, Response):
+            renderer = self.admin_site.renderer_classes[0]()
+            request.accepted_renderer, request.accepted_media_type = renderer, renderer.media_type
+        return super().finalize_response(request, response, *args, **kwargs)
+
+    def get_columns(self, request, cl, fields_list):
+        """
+        Return the exported columns.
+        """
+        columns = []
+        for field_name in fields_list:
+            text = label_for_field(field_name, cl.model, model_admin=cl.model_admin)
+            columns.append({"field": field_name, "headerName": text})
+        return columns
+
+    def get_rows(self, request, cl, fields_list):
+        """
+        Yield the exported rows, lists of the cell values of each column.
+        The results are read in chunks of `export_chunk_size` objects, so
+        memory use doesn't depend on the number of rows.
+        """
+        # The displayed page only loads the columns of list_display.
+        if set(fields_list) <= set(cl.list_display):
+            queryset = cl.get_results_queryset()
+        else:
+            queryset = cl.queryset
+        empty_value_display = cl.model_admin.get_empty_value_display()
+        column_plan = cl.model_admin.get_column_plan(fields_list)
+
+        for result in queryset.iterator(chunk_size=cl.model_admin.export_chunk_size):
+            yield get_cell_values(column_plan, result, empty_value_display)
+
+    def get_changelist_instance(self, request):
+        try:
+            return self.model_admin.get_changelist_instance(request, load_results=False)
+        except IncorrectLookupParameters as e:
+            raise ValidationError([{"message": [str(e)], "param": "non_field_errors"}])
@@ -0,0 +1,118 @@
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.exceptions import ValidationError, PermissionDenied, NotFound
+
+from drf_spectacular.utils import extend_schema, OpenApiResponse
+
+from django_api_admin.admin_views.admin_site_views.autocomplete import AutoCompleteView
+from django_api_admin.changelist import FILTER_FIELD_VAR, FILTER_TERM_VAR, FILTER_PAGE_VAR
+from django_api_admin.exceptions import IncorrectLookupParameters, MissingSearchFields, NotRegistered
+from django_api_admin.filters import RelatedFieldListFilter
+from django_api_admin.serializers import FilterChoicesSerializer, FilterChoicesResponseSerializer
+from django_api_admin.openapi import CommonAPIResponses
+
+
+class FilterChoicesView(AutoCompleteView):
+    """
+    Pages through the choices of a related field list filter of the
+    changelist, which only returns its first choices. The choices are
+    searched with the related model admin's search_fields, like the
+    autocomplete view, and counted for the current changelist filters.
+    """
+
+    model_admin = None
+    page_kwarg = FILTER_PAGE_VAR
+
+    @extend_schema(
+        parameters=[FilterChoicesSerializer],
+        responses={
+            200: OpenApiResponse(
+                description=_("A page of the filter choices"),
+                response=FilterChoicesResponseSerializer,
+            ),
+            400: CommonAPIResponses.bad_request(),
+            401: CommonAPIResponses.unauthorized(),
+            403: CommonAPIResponses.permission_denied(),
+            404: CommonAPIResponses.not_found(_("The changelist has no related field filter for this field path.")),
+            409: CommonAPIResponses.conflict(_("related model_admin missing search_fields.")),
+        },
+    )
+    def get(self, request):
+        """
+        Retrieve a page of the choices of a related field filter.
+        """
+        if not self.model_admin.has_view_or_change_permission(request):
+            raise PermissionDenied
+
+        cl = self.get_changelist_instance(request)
+        self.filter_spec = self.get_filter_spec(request, cl)
+        self.term = request.GET.get(FILTER_TERM_VAR, "")
+        if self.filter_spec.choices_limit is not None:
+            self.paginate_by = self.filter_spec.choices_limit
+        try:
+            self.object_list = self.get_queryset(request)
+        except MissingSearchFields:
+            return Response(
+                {"status": status.HTTP_409_CONFLICT},
+                status=status.HTTP_409_CONFLICT,
+            )
+        context = self.get_context_data()
+
+        # Only the choices of the page are counted.
+        self.filter_spec.lookup_choices = [self.filter_spec.field_choice(obj) for obj in context["object_list"]]
+        facet_counts = self.get_facet_counts(request, cl) if cl.add_facets else None
+
+        return Response(
+            {
+                "status": status.HTTP_200_OK,
+                "data": {
+                    "choices": list(self.filter_spec.lookup_choices_display(cl, facet_counts)),
+                    "pagination": {"more": context["page_obj"].has_next()},
+                },
+            },
+            status=status.HTTP_200_OK,
+        )
+
+    def get_queryset(self, request):
+        """
+        Return the filter's choices queryset, searched with the related model
+        admin's get_search_results() when there is a search term.
+        """
+        spec = self.filter_spec
+        root_queryset = spec.field_choices_queryset(spec.field, request, self.model_admin)
+        if not self.term:
+            return root_queryset
+
+        try:
+            related_admin = self.admin_site.get_model_admin(root_queryset.model)
+        except NotRegistered:
+            raise MissingSearchFields
+        if not related_admin.search_fields:
+            raise MissingSearchFields
+        qs, search_may_have_duplicates = related_admin.get_search_results(request, root_queryset, self.term)
+        if search_may_have_duplicates:
+            qs = related_admin.remove_duplicates(request, qs, root_queryset)
+        return qs
+
+    def get_filter_spec(self, request, cl):
+        try:
+            field_path = request.GET[FILTER_FIELD_VAR]
+        except KeyError:
+            raise ValidationError([{"message": [_("This field is required.")], "param": FILTER_FIELD_VAR}])
+        for filter_spec in cl.filter_specs:
+            if isinstance(filter_spec, RelatedFieldListFilter) and filter_spec.field_path == field_path:
+                return filter_spec
+        raise NotFound
+
+    def get_facet_counts(self, request, cl):
+        spec = self.filter_spec
+        filtered_qs = cl.get_queryset(request, exclude_parameters=spec.expected_parameters())
+        return filtered_qs.aggregate(**spec.get_facet_counts(cl.pk_attname, filtered_qs))
+
+    def get_changelist_instance(self, request):
+        try:
+            return self.model_admin.get_changelist_instance(request, load_results=False)
+        except IncorrectLookupParameters as e:
+            raise ValidationError([{"message": [str(e)], "param": "non_field_errors"}])
@@ -31,6 +31,7 @@ class InlineAPIModelAdmin(BaseAPIModelAdmin):
     verbose_name_plural = None
     can_delete = True
     show_change_link = False
+    bulk_save = False
     checks_class = InlineAPIModelAdminChecks
 
     def __init__(self, parent_model, admin_site):
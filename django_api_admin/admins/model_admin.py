@@ -11,32 +11,50 @@
 # -----------------------------------------------------------------------------
 
 import enum
+import hashlib
 import traceback
+from collections import OrderedDict, defaultdict
 from functools import partial
 
-from django.db import models
-from django.urls import path
+from django.db import models, router
+from django.db.models.deletion import Collector
+from django.core.cache import caches
+from django.urls import path, reverse
 from django.core.paginator import Paginator
 from django.utils.translation import gettext_lazy as _
-from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.exceptions import ValidationError
+from django.utils.http import urlencode
+from django.utils.module_loading import import_string
 from django.utils.text import capfirst, smart_split, unescape_string_literal
 from django.forms.models import _get_foreign_key
 
 from rest_framework import status
 from rest_framework import serializers
 from rest_framework.utils import model_meta
+from rest_framework.utils.field_mapping import ClassLookupDict
 from rest_framework.response import Response
 
-from django.db.models.constants import LOOKUP_SEP
 from django_api_admin.checks import APIModelAdminChecks
 from django_api_admin.admins.base_admin import BaseAPIModelAdmin
 from django_api_admin.utils.model_format_dict import model_format_dict
 from django_api_admin.utils.model_serializer_factory import model_serializer_factory
-from django_api_admin.utils.lookup_spawns_duplicates import lookup_spawns_duplicates
 from django_api_admin.utils.construct_change_message import construct_change_message
 from django_api_admin.utils.get_form_fields import get_form_fields_description
 from django_api_admin.utils.get_deleted_objects import get_deleted_objects
+from django_api_admin.utils.get_content_type_for_model import get_content_type_for_model
 from django_api_admin.utils.format_error import format_error
+from django_api_admin.utils.estimate_count import estimate_count
+from django_api_admin.utils.compile_column_plan import compile_column_plan
+from django_api_admin.utils.compile_search_plan import compile_search_plan
+from django_api_admin.utils.split_multivalued_conditions import split_multivalued_conditions
+from django_api_admin.utils.bulk_save_serializers import (
+    bulk_create_serializers,
+    bulk_set_m2m_values,
+    bulk_update_objects,
+    bulk_update_serializers,
+    can_bulk_save,
+    get_update_fields,
+)
 
 
 IS_POPUP_VAR = "_popup"
@@ -44,6 +62,8 @@ SOURCE_MODEL_VAR = "_source_model"
 TO_FIELD_VAR = "_to_field"
 IS_FACETS_VAR = "_facets"
 EMPTY_VALUE_STRING = "-"
+# The number of column plans kept per ModelAdmin, see get_column_plan().
+COLUMN_PLAN_CACHE_SIZE = 32
 
 
 class ShowFacets(enum.Enum):
@@ -65,14 +85,26 @@ class APIModelAdmin(BaseAPIModelAdmin):
     list_per_page = 100
     list_max_show_all = 200
     list_editable = ()
+    list_editable_bulk_save = False
+    list_only = True
     search_fields = ()
     search_help_text = None
+    search_backend = None
+    use_distinct = False
     date_hierarchy = None
     save_as = False
     save_as_continue = True
     save_on_top = False
     paginator = None
+    changelist_pagination = "offset"
+    changelist_streaming = False
+    count_strategy = "exact"
+    count_estimate_threshold = 1000
+    count_cache_alias = "default"
+    count_cache_timeout = 60
     show_facets = ShowFacets.ALLOW
+    export_fields = None
+    export_chunk_size = 2000
     inlines = ()
 
     # Actions
@@ -81,6 +113,9 @@ class APIModelAdmin(BaseAPIModelAdmin):
     actions_on_top = True
     actions_on_bottom = False
     actions_selection_counter = True
+    actions_max_selected = 1000
+    actions_chunk_size = 1000
+    delete_selected_chunk_size = None
     checks_class = APIModelAdminChecks
 
     # These are the admin options used to customize the change list page UI
@@ -89,6 +124,7 @@ class APIModelAdmin(BaseAPIModelAdmin):
         "actions_on_top",
         "actions_on_bottom",
         "actions_selection_counter",
+        "actions_max_selected",
         "empty_value_display",
         "list_display",
         "list_display_links",
@@ -97,6 +133,7 @@ class APIModelAdmin(BaseAPIModelAdmin):
         "show_full_result_count",
         "list_per_page",
         "list_max_show_all",
+        "changelist_pagination",
         "date_hierarchy",
         "search_help_text",
         "sortable_by",
@@ -109,7 +146,15 @@ class APIModelAdmin(BaseAPIModelAdmin):
         self.opts = model._meta
         self.admin_site = admin_site
         self.paginator = self.paginator or admin_site.paginator or Paginator
+        # Column plans are compiled once per list of fields, registering the
+        # model again creates a new ModelAdmin and therefore new plans
+        self._column_plan_cache = OrderedDict()
+        self._search_backend = None
+        self._search_plan = (None, None)
         super().__init__()
+        search_backend = self.get_search_backend()
+        if search_backend is not None:
+            search_backend.connect_signals()
 
     def __str__(self):
         return "%s.%s" % (self.opts.app_label, self.__class__.__name__)
@@ -139,6 +184,8 @@ class APIModelAdmin(BaseAPIModelAdmin):
         prefix = f"{self.model._meta.app_label}/{self.model._meta.model_name}"
         urlpatterns = [
             path(f"{prefix}/changelist/", self.get_changelist_view(), name=f"{info}_changelist"),
+            path(f"{prefix}/export/", self.get_export_view(), name=f"{info}_export"),
+            path(f"{prefix}/filter_choices/", self.get_filter_choices_view(), name=f"{info}_filter_choices"),
             path(f"{prefix}/add/", self.get_add_view(), name=f"{info}_add"),
             path(f"{prefix}/<path:object_id>/detail/", self.get_detail_view(), name=f"{info}_detail"),
             path(f"{prefix}/<path:object_id>/delete/", self.get_delete_view(), name=f"{info}_delete"),
@@ -172,7 +219,7 @@ class APIModelAdmin(BaseAPIModelAdmin):
 
         return Changelist
 
-    def get_changelist_instance(self, request):
+    def get_changelist_instance(self, request, **kwargs):
         """
         Return a `Changelist` instance based on `request`.
         May raise `IncorrectLookupParameters`.
@@ -196,6 +243,7 @@ class APIModelAdmin(BaseAPIModelAdmin):
             self,
             sortable_by,
             self.search_help_text,
+            **kwargs,
         )
 
     def get_object(self, request, object_id, from_field=None):
@@ -242,6 +290,46 @@ class APIModelAdmin(BaseAPIModelAdmin):
     def get_paginator(self, request, queryset, per_page, orphans=0, allow_empty_first_page=True):
         return self.paginator(queryset, per_page, orphans, allow_empty_first_page)
 
+    def get_result_count(self, request, queryset, params=None, kind="result"):
+        """
+        Count the objects in ``queryset`` using ``count_strategy`` and return a
+        tuple of (count, strategy) where strategy names the strategy that
+        produced the count. ``params`` are the normalized filter and search
+        parameters that produced ``queryset`` and ``kind`` is either "result"
+        for the filtered count or "full" for the unfiltered one.
+
+        - "exact" runs ``queryset.count()``.
+        - "estimated" uses the database planner statistics, falling back to
+          an exact count when there are none or the estimate is below
+          ``count_estimate_threshold``.
+        - "cached" caches the exact count for ``count_cache_timeout`` seconds.
+        """
+        if self.count_strategy == "estimated":
+            count = estimate_count(queryset)
+            if count is not None and count >= self.count_estimate_threshold:
+                return count, "estimated"
+        elif self.count_strategy == "cached":
+            cache = caches[self.count_cache_alias]
+            key = self.get_count_cache_key(request, params or {}, kind)
+            count = cache.get(key)
+            if count is None:
+                count = queryset.count()
+                cache.set(key, count, self.count_cache_timeout)
+            return count, "cached"
+        return queryset.count(), "exact"
+
+    def get_count_cache_key(self, request, params, kind="result"):
+        """
+        Return the cache key of the ``kind`` count of the changelist filtered
+        by ``params``. The full count and the result count are keyed apart as
+        list filters may filter the results by default without any params.
+        Override this to add the user to the key if ``get_queryset()`` returns
+        different objects for different users.
+        """
+        query_string = urlencode(sorted(params.items()), doseq=True)
+        digest = hashlib.md5(query_string.encode(), usedforsecurity=False).hexdigest()
+        return "django_api_admin.count.%s.%s.%s" % (self.opts.label_lower, kind, digest)
+
     def log_addition(self, request, obj, message):
         """
         Log that an object has been successfully added.
@@ -269,6 +357,20 @@ class APIModelAdmin(BaseAPIModelAdmin):
             single_object=True,
         )
 
+    def log_changes(self, request, messages):
+        """
+        Log that several objects have been successfully changed, messages is
+        a list of ``(obj, message)`` pairs.
+
+        The default implementation creates the admin LogEntry objects with a
+        single query, or calls log_change() for each object if it's overridden.
+        """
+        from django_api_admin.models import CHANGE, LogEntry
+
+        if type(self).log_change is not APIModelAdmin.log_change:
+            return [self.log_change(request, obj, message) for obj, message in messages]
+        return LogEntry.objects.log_messages(user_id=request.user.pk, messages=messages, action_flag=CHANGE)
+
     def log_deletion(self, request, queryset):
         """
         Log that an object will be deleted. Note that this method must be
@@ -377,26 +479,36 @@ class APIModelAdmin(BaseAPIModelAdmin):
     def get_action_serializer_class(self, request):
         """
         Get the Serializer class used to validate actions. Populate it with the
-        action, and  selected_ids choices based on the model
+        action choices, and a selected_ids field that checks the submitted
+        primary keys against `self.get_queryset`.
         """
-        from django_api_admin.serializers import ActionSerializer
+        from django_api_admin.serializers import ActionSerializer, SelectedIdsField
 
         action_serializer = self.action_serializer or ActionSerializer
 
-        # Set the instances returned by `self.get_queryset` by of this model as choices
-        choices = []
-        queryset = self.get_queryset(request)
-        for item in queryset:
-            choices.append((f"{item.pk}", f"{str(item)}"))
+        # Build the child field from the primary key so the action form can
+        # advertise its type, fall back to ModelField for unmapped fields
+        # (i.e the OneToOneField of multi-table inheritance)
+        pk_field = self.opts.pk
+        try:
+            child = ClassLookupDict(serializers.ModelSerializer.serializer_field_mapping)[pk_field]()
+        except KeyError:
+            child = serializers.ModelField(model_field=pk_field)
 
         # Dynamically create an instance of the self.action_serializer with the `action` choices
-        # being the actions defined in the model_admin and the `selected_ids` being the `choices`
+        # being the actions defined in the model_admin, the queryset isn't evaluated until
+        # `selected_ids` are validated
         return type(
             f"{self.model.__name__}ActionSerializer",
             (action_serializer,),
             {
                 "action": serializers.ChoiceField(choices=[*self.get_action_choices(request)]),
-                "selected_ids": serializers.MultipleChoiceField(required=False, choices=[*choices]),
+                "selected_ids": SelectedIdsField(
+                    queryset=self.get_queryset(request),
+                    child=child,
+                    required=False,
+                    max_length=self.actions_max_selected,
+                ),
             },
         )
 
@@ -407,6 +519,34 @@ class APIModelAdmin(BaseAPIModelAdmin):
         """
         return self.list_display
 
+    def get_export_fields(self, request):
+        """
+        Return a sequence containing the fields of the changelist export,
+        `export_fields` or the changelist columns by default.
+        """
+        if self.export_fields is not None:
+            return self.export_fields
+        exclude = self.exclude or ()
+        return tuple(field_name for field_name in self.get_list_display(request) if field_name not in exclude)
+
+    def get_column_plan(self, fields_list):
+        """
+        Return the compiled plan used to read the changelist columns in
+        `fields_list` from each result. Clients may pick any subset of the
+        columns, so only the `COLUMN_PLAN_CACHE_SIZE` most recently used
+        plans are kept.
+        """
+        fields_list = tuple(fields_list)
+        try:
+            self._column_plan_cache.move_to_end(fields_list)
+            return self._column_plan_cache[fields_list]
+        except KeyError:
+            plan = compile_column_plan(self.model, fields_list, self)
+            self._column_plan_cache[fields_list] = plan
+            while len(self._column_plan_cache) > COLUMN_PLAN_CACHE_SIZE:
+                self._column_plan_cache.popitem(last=False)
+            return plan
+
     def get_list_display_links(self, request, list_display):
         """
         Return a sequence containing the fields to be displayed as links
@@ -440,57 +580,46 @@ class APIModelAdmin(BaseAPIModelAdmin):
         """
         return self.search_fields
 
+    def get_search_backend(self):
+        """
+        Return the instance of the `search_backend` class (or dotted path to
+        it) used for searches, or None to use `icontains` lookups.
+        """
+        if self.search_backend is None:
+            return None
+        if self._search_backend is None:
+            search_backend = self.search_backend
+            if isinstance(search_backend, str):
+                search_backend = import_string(search_backend)
+            self._search_backend = search_backend(self)
+        return self._search_backend
+
+    def get_search_plan(self, search_fields):
+        """
+        Return the compiled plan of the lookups searching `search_fields`,
+        see `compile_search_plan`. The plan is compiled again only when
+        `search_fields` changes.
+        """
+        search_fields = tuple(search_fields)
+        cached_search_fields, plan = self._search_plan
+        if cached_search_fields != search_fields:
+            plan = compile_search_plan(self.model, search_fields)
+            self._search_plan = (search_fields, plan)
+        return plan
+
     def get_search_results(self, request, queryset, search_term):
         """
         Return a tuple containing a queryset to implement the search
         and a boolean indicating if the results may contain duplicates.
         """
-
-        # Apply keyword searches.
-        def construct_search(field_name):
-            """
-            Return a tuple of (lookup, field_to_validate).
-
-            field_to_validate is set for non-text exact lookups so that
-            invalid search terms can be skipped (preserving index usage).
-            """
-            if field_name.startswith("^"):
-                return "%s__istartswith" % field_name.removeprefix("^"), None
-            elif field_name.startswith("="):
-                return "%s__iexact" % field_name.removeprefix("="), None
-            elif field_name.startswith("@"):
-                return "%s__search" % field_name.removeprefix("@"), None
-            # Use field_name if it includes a lookup.
-            opts = queryset.model._meta
-            lookup_fields = field_name.split(LOOKUP_SEP)
-            # Go through the fields, following all relations.
-            prev_field = None
-            for path_part in lookup_fields:
-                if path_part == "pk":
-                    path_part = opts.pk.name
-                try:
-                    field = opts.get_field(path_part)
-                except FieldDoesNotExist:
-                    # Use valid query lookups.
-                    if prev_field and prev_field.get_lookup(path_part):
-                        if path_part == "exact" and not isinstance(prev_field, (models.CharField, models.TextField)):
-                            # Use prev_field to validate the search term.
-                            return field_name, prev_field
-                        return field_name, None
-                else:
-                    prev_field = field
-                    if hasattr(field, "path_infos"):
-                        # Update opts to follow the relation.
-                        opts = field.path_infos[-1].to_opts
-            # Otherwise, use the field with icontains.
-            return "%s__icontains" % field_name, None
+        search_backend = self.get_search_backend()
+        if search_term and search_backend is not None and search_backend.is_available(queryset.db):
+            return search_backend.search(request, queryset, search_term)
 
         may_have_duplicates = False
         search_fields = self.get_search_fields(request)
         if search_fields and search_term:
-            orm_lookups = []
-            for field in search_fields:
-                orm_lookups.append(construct_search(str(field)))
+            orm_lookups, may_have_duplicates = self.get_search_plan(search_fields)
 
             term_queries = []
             for bit in smart_split(search_term):
@@ -498,15 +627,10 @@ class APIModelAdmin(BaseAPIModelAdmin):
                     bit = unescape_string_literal(bit)
                 # Build term lookups, skipping values invalid for their field.
                 bit_lookups = []
-                for orm_lookup, validate_field in orm_lookups:
-                    if validate_field is not None:
-                        formfield = validate_field.formfield()
+                for orm_lookup, to_python in orm_lookups:
+                    if to_python is not None:
                         try:
-                            if formfield is not None:
-                                value = formfield.to_python(bit)
-                            else:
-                                # Fields like AutoField lack a form field.
-                                value = validate_field.to_python(bit)
+                            value = to_python(bit)
                         except ValidationError:
                             # Skip this lookup for invalid values.
                             continue
@@ -521,9 +645,36 @@ class APIModelAdmin(BaseAPIModelAdmin):
                     term_queries.append(models.Q(pk__in=[]))
             if term_queries:
                 queryset = queryset.filter(models.Q.create(term_queries))
-            may_have_duplicates |= any(lookup_spawns_duplicates(self.opts, search_spec) for search_spec, _ in orm_lookups)
         return queryset, may_have_duplicates
 
+    def remove_duplicates(self, request, queryset, root_queryset=None):
+        """
+        Return `queryset` without the duplicate rows spawned by lookups that
+        span multi-valued relations. The conditions that span multi-valued
+        relations are moved to a correlated EXISTS subquery, so the query
+        doesn't need DISTINCT, and the other conditions stay on the outer
+        query. When the conditions can't be split (i.e they're ORed), the
+        rows of `root_queryset` (defaults to `get_queryset()`) are filtered
+        with an EXISTS subquery of the whole `queryset`. Set `use_distinct`
+        to use DISTINCT instead.
+        """
+        if self.use_distinct:
+            return queryset.distinct()
+        split = split_multivalued_conditions(queryset)
+        if split is None:
+            if root_queryset is None:
+                root_queryset = self.get_queryset(request)
+            outer_queryset, multivalued_queryset = root_queryset, queryset
+        else:
+            outer_queryset, multivalued_queryset = split
+            if multivalued_queryset is None:
+                return queryset
+        subquery = multivalued_queryset.order_by().filter(pk=models.OuterRef("pk"))
+        queryset_without_duplicates = outer_queryset.filter(models.Exists(subquery))
+        if queryset.query.order_by:
+            queryset_without_duplicates = queryset_without_duplicates.order_by(*queryset.query.order_by)
+        return queryset_without_duplicates
+
     def construct_change_message(self, request, serializer, serializers, add=False):
         """
         Construct a JSON structure describing changes from a changed object.
@@ -621,6 +772,61 @@ class APIModelAdmin(BaseAPIModelAdmin):
         obj.save()
         serializer.instance = obj
 
+    def save_changelist(self, request, bulk_operation):
+        """
+        Save the list_editable changes validated by the changelist
+        ``bulk_operation``. The rows are saved one at a time unless
+        ``list_editable_bulk_save`` is True and save_model() isn't overridden.
+        """
+        changed = [(serializer, changed_data) for serializer, changed_data in bulk_operation.result.values() if changed_data]
+        if self.list_editable_bulk_save and type(self).save_model is APIModelAdmin.save_model:
+            return self.bulk_save_changelist(request, changed)
+
+        for serializer, changed_data in changed:
+            updated_object = self.save_serializer(request, serializer, change=True)
+            self.save_model(request, updated_object, serializer, change=True)
+            serializer.save_m2m()
+            change_message = self.construct_change_message(request, (serializer, changed_data), None, False)
+            self.log_change(request, updated_object, change_message)
+
+    def bulk_save_changelist(self, request, changed):
+        """
+        Save the ``(serializer, changed_data)`` pairs of the changed rows with
+        a bulk_update() of the changed fields per group of rows that changed
+        the same fields, the many-to-many fields with a few queries per field
+        and the LogEntry objects with a single query. The fields with
+        ``auto_now`` are set like save() does. Like bulk_update(), this
+        doesn't call the save() method of the objects nor send the pre_save
+        and post_save signals, so the SQLiteFTS5SearchBackend index, which
+        follows post_save, isn't updated; rebuild it with the
+        build_search_index command. Rows that can't be saved in bulk, i.e
+        their model overrides save() or they change attributes that aren't
+        concrete fields of the model, are saved with save_model().
+        """
+        update_groups = defaultdict(list)
+        m2m_values = defaultdict(dict)
+        messages = []
+        for serializer, changed_data in changed:
+            obj = self.save_serializer(request, serializer, change=True)
+            messages.append((obj, self.construct_change_message(request, (serializer, changed_data), None, False)))
+            fields = get_update_fields(serializer, changed_data) if can_bulk_save(serializer) else None
+            if fields is None:
+                self.save_model(request, obj, serializer, change=True)
+                serializer.save_m2m()
+                continue
+
+            update_fields, row_m2m_values = fields
+            if update_fields:
+                update_groups[frozenset(update_fields)].append(obj)
+            for field_name, values in row_m2m_values.items():
+                m2m_values[field_name][obj] = values
+
+        for update_fields, objs in update_groups.items():
+            bulk_update_objects(self.model, objs, update_fields)
+        bulk_set_m2m_values(self.model, m2m_values)
+        if messages:
+            self.log_changes(request, messages)
+
     def delete_model(self, request, obj):
         """
         Given a model instance delete it from the database.
@@ -631,18 +837,44 @@ class APIModelAdmin(BaseAPIModelAdmin):
         """Given a queryset, delete it from the database."""
         queryset.delete()
 
-    def save_inline_operation(self, request, serializer, inline_operation, change):
+    def save_inline_operation(self, request, serializer, inline_operation, change, inline=None):
         """
-        Given an inline serializer save it to the database.
+        Given the validated operations of an inline save them to the database.
+        With the ``bulk_save`` option of the ``inline``, the additions are
+        created with a single query and the changes are saved with a query
+        per group of changed fields. The deletions are collected and deleted
+        at once.
         """
-        for operation, inline_serializers in inline_operation.items():
-            for inline_serializer in inline_serializers:
-                if operation == "add":
-                    inline_serializer.save()
-                elif operation == "change":
-                    inline_serializer[0].save()
-                elif operation == "delete":
-                    inline_serializer.instance.delete()
+        if inline is not None and inline.bulk_save:
+            bulk_create_serializers(inline.model, inline_operation["add"])
+            bulk_update_serializers(inline.model, inline_operation["change"])
+            self.delete_inline_objects(
+                request, [inline_serializer.instance for inline_serializer in inline_operation["delete"]]
+            )
+        else:
+            for inline_serializer in inline_operation["add"]:
+                inline_serializer.save()
+            for inline_serializer, changed_data in inline_operation["change"]:
+                inline_serializer.save()
+            for inline_serializer in inline_operation["delete"]:
+                inline_serializer.instance.delete()
+
+    def delete_inline_objects(self, request, objs):
+        """
+        Delete the inline objects ``objs`` of a model saved with the
+        ``bulk_save`` option from the database with a single collector, or one
+        at a time if the model overrides delete().
+        """
+        if not objs:
+            return
+        model = type(objs[0])
+        if model.delete is not models.Model.delete:
+            for obj in objs:
+                obj.delete()
+            return
+        collector = Collector(using=router.db_for_write(model))
+        collector.collect(objs)
+        collector.delete()
 
     def save_related(self, request, obj, serializer, bulk_operation, change):
         """
@@ -653,8 +885,9 @@ class APIModelAdmin(BaseAPIModelAdmin):
         already been called.
         """
         serializer.save_m2m()
-        for inline_operation in bulk_operation.result.values():
-            self.save_inline_operation(request, serializer, inline_operation, change)
+        for model_id, inline_operation in bulk_operation.result.items():
+            inline = bulk_operation.get_inline_by_model_id(model_id)
+            self.save_inline_operation(request, serializer, inline_operation, change, inline=inline)
 
     def response_add(self, request, obj, serializer, bulk_operation):
         """
@@ -699,7 +932,7 @@ class APIModelAdmin(BaseAPIModelAdmin):
             func = self.get_actions(request)[action][0]
 
             # Get a list of pks of selected changelist items
-            selected = request.data.get("selected_ids", None)
+            selected = serializer.validated_data.get("selected_ids")
             if not selected and not select_across:
                 msg = _("Items must be selected in order to perform actions on them. No items have been changed.")
                 return Response(
@@ -712,6 +945,9 @@ class APIModelAdmin(BaseAPIModelAdmin):
             if selected and not select_across:
                 queryset = queryset.filter(pk__in=selected)
 
+            if getattr(func, "background", False):
+                return self.queue_action_job(request, queryset, action, selected, select_across)
+
             response = func(self, request, queryset)
 
             # If the action returns a response
@@ -725,6 +961,38 @@ class APIModelAdmin(BaseAPIModelAdmin):
 
         raise ValidationError(format_error(serializer.errors))
 
+    def queue_action_job(self, request, queryset, action, selected, select_across):
+        """
+        Queue the background ``action`` to run over the objects of
+        ``queryset`` and return the URL of the status of its job. Instead of
+        the primary keys of ``queryset``, the job keeps the changelist
+        parameters of the request, the ``selected`` primary keys unless
+        ``select_across`` is set, and the greatest primary key of
+        ``queryset`` so that the objects added later aren't selected. The
+        objects that match the parameters when the job runs are processed.
+        """
+        from django_api_admin.jobs import enqueue_job, get_job_request_meta
+        from django_api_admin.models import ActionJob
+
+        job = ActionJob.objects.create(
+            user=request.user,
+            site_name=self.admin_site.name,
+            content_type=get_content_type_for_model(self.model),
+            action=action,
+            query_params=dict(request.query_params.lists()),
+            request_meta=get_job_request_meta(request),
+            select_across=bool(select_across),
+            selected_ids=[] if select_across else list(selected),
+            max_pk=queryset.order_by("-pk").values_list("pk", flat=True).first(),
+            total=queryset.count(),
+        )
+        enqueue_job(job, self.admin_site)
+        url = reverse("%s:action_job" % self.admin_site.name, kwargs={"job_id": job.pk})
+        return Response(
+            {"status": status.HTTP_202_ACCEPTED, "data": {"job_id": job.pk, "url": url}},
+            status=status.HTTP_202_ACCEPTED,
+        )
+
     def response_delete(self, request, obj_display, obj_id):
         """
         Determine the Response for the delete_view stage.
@@ -935,12 +1203,36 @@ class APIModelAdmin(BaseAPIModelAdmin):
         }
         return ChangelistView.as_view(**defaults)
 
-    def get_deleted_objects(self, objs, request):
+    def get_export_view(self):
+        from django_api_admin.admin_views.model_admin_views.export import ExportView
+
+        defaults = {
+            "authentication_classes": self.admin_site.get_authentication_classes(),
+            "permission_classes": self.admin_site.get_permission_classes(),
+            "model_admin": self,
+            "admin_site": self.admin_site,
+        }
+        return ExportView.as_view(**defaults)
+
+    def get_filter_choices_view(self):
+        from django_api_admin.admin_views.model_admin_views.filter_choices import FilterChoicesView
+
+        defaults = {
+            "authentication_classes": self.admin_site.get_authentication_classes(),
+            "permission_classes": self.admin_site.get_permission_classes(),
+            "model_admin": self,
+            "admin_site": self.admin_site,
+            "renderer_classes": self.admin_site.renderer_classes,
+        }
+        return FilterChoicesView.as_view(**defaults)
+
+    def get_deleted_objects(self, objs, request, summary=False):
         """
         Hook for customizing the delete process for the delete view and the
-        "delete selected" action.
+        "delete selected" action. With ``summary=True`` the nested list of the
+        deleted objects isn't built, see get_deleted_objects().
         """
-        return get_deleted_objects(objs, request, self.admin_site)
+        return get_deleted_objects(objs, request, self.admin_site, summary=summary)
 
     def get_delete_view(self):
         from django_api_admin.admin_views.model_admin_views.delete import DeleteView
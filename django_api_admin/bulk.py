@@ -9,19 +9,28 @@ from django_api_admin.utils.get_related_name import get_related_name
 from django_api_admin.utils.get_changed_data import get_changed_data
 from django_api_admin.utils.format_error import format_error
 from django_api_admin.utils.nested_objects import NestedObjects
+from django_api_admin.utils.prefetch_related_fields import prefetch_related_fields
 
 
 class InlineBulkOperation:
-    errors = {}
-    result = {}
+    """
+    Validate the add, change and delete operations of the inlines of `obj`
+    in a request. The `errors` and `result` of the validation belong to the
+    instance, which lives as long as the request.
+    """
 
     def __init__(self, request, model_admin, obj, data):
         self.request = request
         self.model_admin = model_admin
         self.obj = obj
         self.data = data
+        self.errors = {}
+        self.result = {}
 
     def is_valid(self):
+        self.errors = {}
+        self.result = {}
+
         if not self.keys_are_valid_inline_names():
             return False
 
@@ -78,7 +87,15 @@ class InlineBulkOperation:
             delete_errors = {}
 
             if "add" in value:
-                for idx, data in enumerate(value["add"]):
+                add_serializers = []
+                for data in value["add"]:
+                    # Add the object pk to the fk field to create the relationship
+                    data[fk.name] = self.obj.pk
+                    serializer_params = self.model_admin.get_inline_serializer_kwargs(self.request, "add", inline, data=data)
+                    add_serializers.append(serializer_class(**serializer_params))
+                prefetch_related_fields(add_serializers)
+
+                for idx, serializer in enumerate(add_serializers):
                     # Validate the number of related instances does not exceed the
                     # `max_num` set at the inline model
                     if inline.max_num is not None and related_instances_count >= inline.max_num:
@@ -90,11 +107,6 @@ class InlineBulkOperation:
                             }
                         ]
 
-                    # Add the object pk to the fk field to create the relationship
-                    data[fk.name] = self.obj.pk
-                    serializer_params = self.model_admin.get_inline_serializer_kwargs(self.request, "add", inline, data=data)
-                    serializer = serializer_class(**serializer_params)
-
                     # Validate the add data using the inline serializer
                     if serializer.is_valid():
                         self.result[key]["add"].append(serializer)
@@ -108,13 +120,14 @@ class InlineBulkOperation:
             if "change" in value:
                 fk_field = getattr(self.obj, get_related_name(fk), None)
                 primary_keys = [data.get("pk") for data in value["change"]]
-                instances = fk_field.filter(pk__in=primary_keys)
+                instances = {instance.pk: instance for instance in fk_field.filter(pk__in=primary_keys)}
 
+                change_serializers = {}
                 for idx, data in enumerate(value["change"]):
                     # Add the object pk to the fk field to create the relationship
                     data[fk.name] = self.obj.pk
                     # Find the item to be updated in the queryset
-                    instance = next((i for i in instances if i.pk == data.get("pk")), None)
+                    instance = self.get_instance(instances, data.get("pk"))
 
                     # Validate that all primary_keys are valid instances
                     if not instance:
@@ -134,26 +147,29 @@ class InlineBulkOperation:
                             }
                         ]
 
-                    # Validate the change data using the inline serializer
                     if idx not in change_errors:
                         serializer_params = self.model_admin.get_inline_serializer_kwargs(
                             self.request, "change", inline, instance=instance, data=data
                         )
-                        serializer = serializer_class(**serializer_params)
+                        change_serializers[idx] = serializer_class(**serializer_params)
+                prefetch_related_fields(list(change_serializers.values()))
 
-                        if serializer.is_valid():
-                            changed_data = get_changed_data(serializer)
-                            self.result[key]["change"].append((serializer, changed_data))
-                        else:
-                            change_errors[idx] = format_error(serializer.errors)
+                # Validate the change data using the inline serializer
+                for idx, serializer in change_serializers.items():
+                    if serializer.is_valid():
+                        changed_data = get_changed_data(serializer)
+                        self.result[key]["change"].append((serializer, changed_data))
+                    else:
+                        change_errors[idx] = format_error(serializer.errors)
 
             if "delete" in value:
                 primary_keys = [pk for pk in value["delete"]]
-                instances = list(inline.model.objects.filter(pk__in=primary_keys))
+                instances = {instance.pk: instance for instance in inline.model.objects.filter(pk__in=primary_keys)}
+                protected = self.get_protected_objects(inline, list(instances.values()))
 
                 # Validate the primary keys, and instances
                 for idx, pk in enumerate(value["delete"]):
-                    instance = next((i for i in instances if i.pk == pk), None)
+                    instance = self.get_instance(instances, pk)
 
                     # Validate the number of instances is not less than the `min_num`
                     # set at the inline model
@@ -189,12 +205,9 @@ class InlineBulkOperation:
                         continue
 
                     # Ensure no related "protected" records are going to be deleted
-                    using = router.db_for_write(inline.model)
-                    collector = NestedObjects(using=using)
-                    collector.collect([instance])
-                    if collector.protected:
+                    if instance.pk in protected:
                         objs = []
-                        for p in collector.protected:
+                        for p in protected[instance.pk]:
                             objs.append(_("%(class_name)s %(instance)s") % {"class_name": p._meta.verbose_name, "instance": p})
                         params = {
                             "class_name": inline.model._meta.verbose_name,
@@ -233,6 +246,38 @@ class InlineBulkOperation:
 
         return valid
 
+    def get_instance(self, instances, pk):
+        """
+        Return the instance of `instances`, a dictionary of instances by pk,
+        with the given `pk`, or None.
+        """
+        try:
+            return instances.get(pk)
+        except TypeError:
+            # The pk is unhashable, i.e a list.
+            return None
+
+    def get_protected_objects(self, inline, instances):
+        """
+        Return a dictionary mapping the pks of the `instances` whose deletion
+        would delete protected related objects to these objects. All the
+        instances are collected at once, they are only collected one at a
+        time to tell which instances the protected objects belong to.
+        """
+        using = router.db_for_write(inline.model)
+        collector = NestedObjects(using=using, summary=True)
+        collector.collect(instances)
+        if not collector.protected:
+            return {}
+
+        protected = {}
+        for instance in instances:
+            collector = NestedObjects(using=using, summary=True)
+            collector.collect([instance])
+            if collector.protected:
+                protected[instance.pk] = collector.protected
+        return protected
+
     def get_inline_by_model_id(self, model_id):
         """
         Get the inline instance that match the given model_id
@@ -260,8 +305,11 @@ class InlineBulkOperation:
 
 
 class ChangelistBulkOperation:
-    errors = {}
-    result = {}
+    """
+    Validate the list_editable changes of the changelist rows in a request.
+    The `errors` and `result` of the validation belong to the instance,
+    which lives as long as the request.
+    """
 
     def __init__(self, request, model_admin, instances, data, serializer_class):
         self.request = request
@@ -269,21 +317,30 @@ class ChangelistBulkOperation:
         self.instances = instances
         self.data = data
         self.serializer_class = serializer_class
+        self.errors = {}
+        self.result = {}
 
     def is_valid(self):
         """
         Ensure all data is validated by the serializer correctly
         """
+        self.errors = {}
+        self.result = {}
 
         if not self.data:
             self.errors["non_field_errors"] = ["Change data cannot be empty"]
             return False
 
+        instances = {instance.pk: instance for instance in self.instances}
         for idx, data in enumerate(self.data):
             pk = data["pk"]
             # Get the object we're editing
-            instance = next((i for i in self.instances if i.pk == pk), None)
-            if not instance:
+            try:
+                instance = instances.get(pk)
+            except TypeError:
+                # The pk is unhashable, i.e a list.
+                instance = None
+            if instance is None:
                 verbose_name = self.model_admin.model._meta.verbose_name
                 self.errors[idx] = [
                     {
@@ -11,27 +11,41 @@
 # -----------------------------------------------------------------------------
 
 import warnings
-from datetime import datetime, timedelta
+from collections import Counter
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from uuid import UUID
 
 from django.conf import settings
+from django.core import signing
 from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured, SuspiciousOperation
+from django.core.exceptions import ValidationError as DjangoValidationError
 from django.core.paginator import InvalidPage
-from django.db.models import F, Field, ManyToOneRel, OrderBy
+from django.db.models import F, Field, ManyToOneRel, OrderBy, Q
 from django.db.models.constants import LOOKUP_SEP
 from django.db.models.expressions import Combinable
 from django.utils.timezone import make_aware
 from django.utils.http import urlencode
+from django.utils.translation import gettext
 from django.utils.inspect import func_supports_parameter
 from django.utils.deprecation import RemovedInDjango60Warning
 
 from rest_framework.exceptions import ValidationError
 from rest_framework.reverse import reverse
 
-from django_api_admin.exceptions import DisallowedModelAdminLookup, IncorrectLookupParameters
-from django_api_admin.filters import FieldListFilter
+from django_api_admin.exceptions import (
+    DisallowedModelAdminLookup,
+    FieldIsAForeignKeyColumnName,
+    IncorrectLookupParameters,
+    NotRelationField,
+)
+from django_api_admin.filters import FacetsMixin, FieldListFilter
 from django_api_admin.serializers import ChangeListSerializer
 from django_api_admin.admins.model_admin import SOURCE_MODEL_VAR, IS_FACETS_VAR, IS_POPUP_VAR, ShowFacets
+from django_api_admin.utils._get_non_gfk_field import _get_non_gfk_field
+from django_api_admin.utils.get_display_attr import get_display_attr
 from django_api_admin.utils.get_fields_from_path import get_fields_from_path
+from django_api_admin.utils.model_data_version import get_model_data_version
 from django_api_admin.utils.lookup_spawns_duplicates import lookup_spawns_duplicates
 from django_api_admin.utils.prepare_lookup_value import prepare_lookup_value
 from django_api_admin.utils.build_q_object_from_lookup_parameters import build_q_object_from_lookup_parameters
@@ -42,8 +56,26 @@ ORDER_VAR = "o"
 PAGE_VAR = "p"
 PER_PAGE_VAR = "pp"
 SEARCH_VAR = "q"
+CURSOR_VAR = "cursor"
+FORMAT_VAR = "format"
+LAYOUT_VAR = "layout"
+FIELDS_VAR = "fields"
+# The parameters of the filter choices view
+FILTER_FIELD_VAR = "_field_path"
+FILTER_TERM_VAR = "_term"
+FILTER_PAGE_VAR = "_page"
 ERROR_FLAG = "e"
 
+# Changelist pagination modes
+OFFSET_PAGINATION = "offset"
+CURSOR_PAGINATION = "cursor"
+CURSOR_SALT = "django_api_admin.changelist.cursor"
+
+# Changelist row layouts
+OBJECTS_LAYOUT = "objects"
+ARRAYS_LAYOUT = "arrays"
+COLUMNS_LAYOUT = "columns"
+
 IGNORED_PARAMS = (
     ALL_VAR,
     ORDER_VAR,
@@ -54,6 +86,24 @@ IGNORED_PARAMS = (
 )
 
 
+class ChangelistState:
+    """
+    Request scoped results of the changelist stages (filters, queryset,
+    counts and page). Each stage runs once per request, and `runs` records
+    how many times each stage actually ran.
+    """
+
+    def __init__(self):
+        self.runs = Counter()
+        self._results = {}
+
+    def run(self, stage, func, *args, **kwargs):
+        if stage not in self._results:
+            self.runs[stage] += 1
+            self._results[stage] = func(*args, **kwargs)
+        return self._results[stage]
+
+
 class Changelist:
     search_serializer_class = ChangeListSerializer
 
@@ -73,6 +123,7 @@ class Changelist:
         model_admin,
         sortable_by,
         search_help_text,
+        load_results=True,
     ):
         self.model = model
         self.opts = model._meta
@@ -92,6 +143,8 @@ class Changelist:
         self.sortable_by = sortable_by
         self.search_help_text = search_help_text
         self.bulk_operation = None
+        self.state = ChangelistState()
+        self.stale_facets = set()
         # Get search parameters from the query string.
         _search_serializer = self.search_serializer_class(data=request.GET)
         if not _search_serializer.is_valid():
@@ -100,6 +153,16 @@ class Changelist:
                 errors.append({"detail": ", ".join(error)})
             raise ValidationError(errors)
         self.query = _search_serializer.validated_data.get(SEARCH_VAR) or ""
+        self.layout = _search_serializer.validated_data.get(LAYOUT_VAR) or OBJECTS_LAYOUT
+        # Narrow the columns to the requested fields, the ordering indices,
+        # display annotations and loaded columns follow list_display.
+        fields = _search_serializer.validated_data.get(FIELDS_VAR)
+        if fields is not None:
+            self.list_display = self.get_requested_list_display(fields)
+            if self.list_display_links:
+                self.list_display_links = tuple(
+                    field_name for field_name in self.list_display_links if field_name in self.list_display
+                )
         try:
             self.page_num = int(request.GET.get(PAGE_VAR, 1))
         except ValueError:
@@ -109,6 +172,7 @@ class Changelist:
         except ValueError:
             self.list_per_page = list_per_page
         self.show_all = ALL_VAR in request.GET
+        self.cursor = request.GET.get(CURSOR_VAR)
         self.add_facets = model_admin.show_facets is ShowFacets.ALWAYS or (
             model_admin.show_facets is ShowFacets.ALLOW and IS_FACETS_VAR in request.GET
         )
@@ -124,11 +188,31 @@ class Changelist:
         if PER_PAGE_VAR in self.params:
             del self.params[PER_PAGE_VAR]
             del self.filter_params[PER_PAGE_VAR]
+        if CURSOR_VAR in self.params:
+            del self.params[CURSOR_VAR]
+            del self.filter_params[CURSOR_VAR]
+        # The format of the response is negotiated by the view.
+        if FORMAT_VAR in self.params:
+            del self.params[FORMAT_VAR]
+            del self.filter_params[FORMAT_VAR]
+        if LAYOUT_VAR in self.params:
+            del self.params[LAYOUT_VAR]
+            del self.filter_params[LAYOUT_VAR]
+        if FIELDS_VAR in self.params:
+            del self.params[FIELDS_VAR]
+            del self.filter_params[FIELDS_VAR]
+        for filter_choices_var in (FILTER_FIELD_VAR, FILTER_TERM_VAR, FILTER_PAGE_VAR):
+            if filter_choices_var in self.params:
+                del self.params[filter_choices_var]
+                del self.filter_params[filter_choices_var]
         self.remove_facet_link = self.get_query_string(remove=[IS_FACETS_VAR])
         self.add_facet_link = self.get_query_string({IS_FACETS_VAR: True})
         self.list_editable = list_editable
         self.queryset = self.get_queryset(request)
-        self.get_results(request)
+        # Views that read the whole queryset (i.e the export view) don't need
+        # the displayed page nor its counts.
+        if load_results:
+            self.get_results(request)
         self.pk_attname = self.lookup_opts.pk.attname
 
     def __repr__(self):
@@ -138,6 +222,27 @@ class Changelist:
             self.model_admin.__class__.__qualname__,
         )
 
+    def get_requested_list_display(self, fields):
+        """
+        Return the items of list_display named in `fields`, a comma separated
+        list of field names, in the order of list_display. Raise
+        ValidationError if a name isn't in list_display.
+        """
+        names = {name.strip() for name in fields.split(",") if name.strip()}
+        list_display = tuple(
+            field_name
+            for field_name in self.list_display
+            if (field_name if isinstance(field_name, str) else field_name.__name__) in names
+        )
+        unknown = names.difference(
+            field_name if isinstance(field_name, str) else field_name.__name__ for field_name in list_display
+        )
+        if unknown:
+            raise ValidationError(
+                [{"detail": gettext("Unknown fields: %(fields)s.") % {"fields": ", ".join(sorted(unknown))}}]
+            )
+        return list_display
+
     def get_filters_params(self, params=None):
         """
         Return all params except IGNORED_PARAMS.
@@ -152,6 +257,9 @@ class Changelist:
         return lookup_params
 
     def get_filters(self, request):
+        return self.state.run("filters", self._get_filters, request)
+
+    def _get_filters(self, request):
         lookup_params = self.get_filters_params()
         may_have_duplicates = False
         has_active_filters = False
@@ -262,6 +370,76 @@ class Changelist:
         except FieldDoesNotExist as e:
             raise IncorrectLookupParameters(e) from e
 
+    def get_facet_counts(self, request):
+        """
+        Return the facet counts of every filter spec, keyed by filter spec.
+        Filters whose facets are counted over the same queryset share a
+        single aggregate query.
+        """
+        return self.state.run("facets", self._get_facet_counts, request)
+
+    def _get_facet_counts(self, request):
+        groups = {}
+        for filter_spec in self.filter_specs:
+            if isinstance(filter_spec, FacetsMixin):
+                groups.setdefault(self.get_facet_group_key(filter_spec), []).append(filter_spec)
+
+        # The version is read before counting so that counts aren't cached
+        # under a version that was bumped while they were being counted.
+        cached_filter_specs = [
+            filter_spec for filter_specs in groups.values() for filter_spec in filter_specs if filter_spec.facet_cache
+        ]
+        if cached_filter_specs:
+            for filter_spec in cached_filter_specs:
+                filter_spec.watch_data_version(self)
+            version = get_model_data_version(self.model)
+        else:
+            version = None
+
+        facet_counts = {}
+        for key, filter_specs in groups.items():
+            pending = []
+            for filter_spec in filter_specs:
+                cached = filter_spec.get_cached_facet_counts(self, version) if filter_spec.facet_cache else None
+                if cached is None:
+                    pending.append(filter_spec)
+                    continue
+                facet_counts[filter_spec], stale = cached
+                if stale:
+                    self.stale_facets.add(filter_spec)
+            if not pending:
+                continue
+
+            if key:
+                filtered_qs = self.get_queryset(request, exclude_parameters=list(key))
+            else:
+                filtered_qs = self.queryset
+            aggregates = {}
+            for i, filter_spec in enumerate(pending):
+                for name, aggregate in filter_spec.get_facet_counts(self.pk_attname, filtered_qs).items():
+                    aggregates["f%d_%s" % (i, name)] = aggregate
+            counts = filtered_qs.aggregate(**aggregates) if aggregates else {}
+            for i, filter_spec in enumerate(pending):
+                prefix = "f%d_" % i
+                facet_counts[filter_spec] = {
+                    name.removeprefix(prefix): count for name, count in counts.items() if name.startswith(prefix)
+                }
+                if filter_spec.facet_cache:
+                    filter_spec.set_cached_facet_counts(self, version, facet_counts[filter_spec])
+        return facet_counts
+
+    def get_facet_group_key(self, filter_spec):
+        """
+        Return the parameters excluded from the queryset the facets of
+        `filter_spec` are counted over. Field filters that aren't in use
+        don't change the changelist queryset, so their facets are counted
+        over it directly. Other filters may filter the queryset even when
+        they aren't in use, so they exclude their own parameters.
+        """
+        if isinstance(filter_spec, FieldListFilter) and not filter_spec.used_parameters:
+            return ()
+        return tuple(filter_spec.expected_parameters())
+
     def get_query_string(self, new_params=None, remove=None):
         if new_params is None:
             new_params = {}
@@ -281,24 +459,37 @@ class Changelist:
         return "?%s" % urlencode(sorted(p.items()), doseq=True)
 
     def get_results(self, request):
-        paginator = self.model_admin.get_paginator(request, self.queryset, self.list_per_page)
-        # Get the number of objects, with admin filters applied.
-        result_count = paginator.count
+        self.state.run("results", self._get_results, request)
+
+    def _get_results(self, request):
+        if self.model_admin.changelist_pagination == CURSOR_PAGINATION:
+            return self.get_cursor_results(request)
+
+        queryset = self.get_results_queryset()
+        paginator = self.model_admin.get_paginator(request, queryset, self.list_per_page)
+        # Get the number of objects, with admin filters applied. The paginator
+        # is handed the count so it doesn't run its own COUNT query.
+        result_count, result_count_strategy = self.state.run(
+            "result_count", self.model_admin.get_result_count, request, self.queryset, self.get_count_params()
+        )
+        paginator.count = result_count
 
         # Get the total number of objects, with no admin filters applied.
         # Note this isn't necessarily the same as result_count in the case of
         # no filtering. Filters defined in list_filters may still apply some
         # default filtering which may be removed with query parameters.
         if self.model_admin.show_full_result_count:
-            full_result_count = self.root_queryset.count()
+            full_result_count, full_result_count_strategy = self.state.run(
+                "full_result_count", self.model_admin.get_result_count, request, self.root_queryset, {}, "full"
+            )
         else:
-            full_result_count = None
+            full_result_count = full_result_count_strategy = None
         can_show_all = result_count <= self.list_max_show_all
         multi_page = result_count > self.list_per_page
 
         # Get the list of objects to display on this page.
         if (self.show_all and can_show_all) or not multi_page:
-            result_list = self.queryset._clone()
+            result_list = queryset._clone()
         else:
             try:
                 result_list = paginator.page(self.page_num).object_list
@@ -312,10 +503,165 @@ class Changelist:
         # disabled
         self.show_admin_actions = not self.show_full_result_count or bool(full_result_count)
         self.full_result_count = full_result_count
+        self.result_count_strategy = result_count_strategy
+        self.full_result_count_strategy = full_result_count_strategy
         self.result_list = result_list
         self.can_show_all = can_show_all
         self.multi_page = multi_page
         self.paginator = paginator
+        self.next_cursor = None
+        self.prev_cursor = None
+
+    def get_count_params(self):
+        """
+        Return the normalized filter and search parameters that determine
+        the number of objects in the changelist, used to key cached counts.
+        """
+        params = self.get_filters_params()
+        if self.query:
+            params[SEARCH_VAR] = [self.query]
+        return params
+
+    def get_cursor_results(self, request):
+        """
+        Seek to the page described by the `cursor` query parameter using the
+        changelist ordering as a keyset. Unlike get_results() this never runs
+        a COUNT query nor uses an OFFSET, so `result_count` and
+        `full_result_count` are left as None.
+        """
+        keys = self.get_cursor_keys(self.queryset, self.ordering)
+        aliases = {"_cursor_%d" % i: F(name) for i, (name, _, _, _) in enumerate(keys)}
+        queryset = self.get_results_queryset().annotate(**aliases)
+
+        direction = "n"
+        if self.cursor:
+            direction, values = self.decode_cursor(self.cursor, keys)
+            queryset = queryset.filter(self.get_cursor_filter(keys, values, reverse=direction == "p"))
+
+        if direction == "p":
+            ordering = [OrderBy(F(name), descending=not descending, nulls_first=True) for name, descending, _, _ in keys]
+        else:
+            ordering = [OrderBy(F(name), descending=descending, nulls_last=True) for name, descending, _, _ in keys]
+
+        result_list = list(queryset.order_by(*ordering)[: self.list_per_page + 1])
+        has_more = len(result_list) > self.list_per_page
+        result_list = result_list[: self.list_per_page]
+        if direction == "p":
+            result_list.reverse()
+            has_next, has_previous = True, has_more
+        else:
+            has_next, has_previous = has_more, bool(self.cursor)
+
+        self.result_count = None
+        self.full_result_count = None
+        self.result_count_strategy = None
+        self.full_result_count_strategy = None
+        self.show_full_result_count = False
+        self.show_admin_actions = True
+        self.result_list = result_list
+        self.can_show_all = False
+        self.multi_page = has_next or has_previous
+        self.paginator = None
+        self.next_cursor = self.encode_cursor("n", keys, result_list[-1]) if has_next and result_list else None
+        self.prev_cursor = self.encode_cursor("p", keys, result_list[0]) if has_previous and result_list else None
+
+    def get_cursor_keys(self, queryset, ordering):
+        """
+        Normalize `ordering` into seek keys, a list of
+        ``(lookup, descending, nullable, to_python)`` tuples. Relations are
+        ordered by their key rather than the related model's ordering, and
+        expressions other than plain field references aren't supported.
+        """
+        keys = []
+        seen = set()
+        for part in ordering:
+            if isinstance(part, str):
+                if part == "?":
+                    raise IncorrectLookupParameters("Cursor pagination doesn't support random ordering.")
+                descending, name = part.startswith("-"), part.lstrip("-")
+            elif isinstance(part, F):
+                descending, name = False, part.name
+            elif isinstance(part, OrderBy) and isinstance(part.expression, F):
+                descending, name = part.descending, part.expression.name
+            else:
+                raise IncorrectLookupParameters("Cursor pagination only supports ordering by fields.")
+
+            if name in queryset.query.annotations:
+                output_field = queryset.query.annotations[name].output_field
+                nullable, to_python = True, output_field.to_python
+            else:
+                if name == "pk":
+                    name = self.lookup_opts.pk.name
+                try:
+                    fields = get_fields_from_path(self.model, name)
+                except (FieldDoesNotExist, NotRelationField) as e:
+                    raise IncorrectLookupParameters(e) from e
+                field = fields[-1]
+                if field.is_relation:
+                    if field.many_to_many or field.one_to_many:
+                        raise IncorrectLookupParameters("Cursor pagination doesn't support ordering by %s." % name)
+                    fields.append(field.target_field)
+                    name = "%s%s%s" % (name, LOOKUP_SEP, field.target_field.name)
+                nullable = any(getattr(f, "null", True) for f in fields)
+                to_python = fields[-1].to_python
+
+            if name not in seen:
+                seen.add(name)
+                keys.append((name, descending, nullable, to_python))
+        return keys
+
+    def get_cursor_filter(self, keys, values, reverse=False):
+        """
+        Return a Q object selecting the rows that come after (or before when
+        `reverse` is True) the row whose seek keys are `values`. NULLs are
+        always sorted last.
+        """
+        condition = Q(pk__in=[])
+        equal = Q()
+        for (name, descending, nullable, _), value in zip(keys, values):
+            if value is None:
+                seek = Q(**{"%s__isnull" % name: False}) if reverse else None
+                match = Q(**{"%s__isnull" % name: True})
+            else:
+                lookup = "lt" if descending ^ reverse else "gt"
+                seek = Q(**{"%s__%s" % (name, lookup): value})
+                if nullable and not reverse:
+                    seek |= Q(**{"%s__isnull" % name: True})
+                match = Q(**{name: value})
+            if seek is not None:
+                condition |= equal & seek
+            equal &= match
+        return condition
+
+    def encode_cursor(self, direction, keys, obj):
+        values = []
+        for i in range(len(keys)):
+            value = getattr(obj, "_cursor_%d" % i)
+            if isinstance(value, (datetime, date, time)):
+                value = value.isoformat()
+            elif isinstance(value, (Decimal, UUID)):
+                value = str(value)
+            values.append(value)
+        payload = {"d": direction, "k": [[name, descending] for name, descending, _, _ in keys], "v": values}
+        return signing.dumps(payload, salt=CURSOR_SALT, compress=True)
+
+    def decode_cursor(self, cursor, keys):
+        """
+        Return the direction and seek values stored in `cursor`. Raise
+        IncorrectLookupParameters if the cursor was tampered with or was
+        created for a different ordering.
+        """
+        try:
+            payload = signing.loads(cursor, salt=CURSOR_SALT)
+            if payload["d"] not in ("n", "p") or payload["k"] != [[name, descending] for name, descending, _, _ in keys]:
+                raise IncorrectLookupParameters("Invalid cursor.")
+            values = [
+                value if value is None else to_python(value)
+                for (_, _, _, to_python), value in zip(keys, payload["v"], strict=True)
+            ]
+        except (signing.BadSignature, KeyError, TypeError, ValueError, DjangoValidationError) as e:
+            raise IncorrectLookupParameters("Invalid cursor.") from e
+        return payload["d"], values
 
     def _get_default_ordering(self):
         ordering = []
@@ -496,6 +842,13 @@ class Changelist:
         return ordering_fields
 
     def get_queryset(self, request, exclude_parameters=None):
+        # The changelist queryset is built once per request, facets build
+        # their own querysets without the parameters of their filter.
+        if exclude_parameters is None:
+            return self.state.run("queryset", self._get_queryset, request)
+        return self._get_queryset(request, exclude_parameters)
+
+    def _get_queryset(self, request, exclude_parameters=None):
         # First, we collect all the declared list filters.
         (
             self.filter_specs,
@@ -530,13 +883,6 @@ class Changelist:
             # ValueError, ValidationError, or ?.
             raise IncorrectLookupParameters(e)
 
-        if not qs.query.select_related:
-            qs = self.apply_select_related(qs)
-
-        # Set ordering.
-        ordering = self.get_ordering(request, qs)
-        qs = qs.order_by(*ordering)
-
         # Apply search results
         qs, search_may_have_duplicates = self.model_admin.get_search_results(
             request,
@@ -544,16 +890,134 @@ class Changelist:
             self.query,
         )
 
+        # Remove duplicates from results, if necessary. This happens before
+        # the select_related, annotations and ordering are added, so that they
+        # apply to the outer query.
+        if filters_may_have_duplicates | search_may_have_duplicates:
+            qs = self.model_admin.remove_duplicates(request, qs, self.root_queryset)
+
+        if not qs.query.select_related:
+            qs = self.apply_select_related(qs)
+
+        # Set ordering. The values displayed by @display(annotate=...)
+        # callables are annotated on the displayed page only, unless the
+        # ordering sorts by them (see get_results_queryset()).
+        ordering = self.get_ordering(request, qs)
+        qs = self.apply_display_annotations(qs, self.get_ordering_names(ordering))
+        qs = qs.order_by(*ordering)
+        self.ordering = ordering
+
         # Set query string for clearing all filters.
         self.clear_all_filters_qs = self.get_query_string(
             new_params=remaining_lookup_params,
             remove=self.get_filters_params(),
         )
-        # Remove duplicates from results, if necessary
-        if filters_may_have_duplicates | search_may_have_duplicates:
-            return qs.distinct()
-        else:
+        return qs
+
+    def get_results_queryset(self):
+        """
+        Return the queryset the displayed page is read from.
+        """
+        return self.apply_display_prefetches(self.apply_only(self.apply_display_annotations(self.queryset)))
+
+    def get_display_attrs(self):
+        """
+        Return the functions displaying the list_display items that aren't
+        model fields.
+        """
+        attrs = (get_display_attr(field_name, self.model, self.model_admin) for field_name in self.list_display)
+        return [attr for attr in attrs if attr is not None]
+
+    def apply_display_annotations(self, qs, names=None):
+        """
+        Annotate `qs` with the values of the @display(annotate=...) callables
+        it isn't annotated with yet, or only with the ones in `names`.
+        """
+        annotations = {
+            attr.annotation_name: attr.annotation
+            for attr in self.get_display_attrs()
+            if hasattr(attr, "annotation")
+            and attr.annotation_name not in qs.query.annotations
+            and (names is None or attr.annotation_name in names)
+        }
+        return qs.annotate(**annotations) if annotations else qs
+
+    def get_ordering_names(self, ordering):
+        """
+        Return the names of the fields and annotations `ordering` refers to.
+        """
+        names = set()
+        for part in ordering:
+            if isinstance(part, str):
+                names.add(part.lstrip("-").split(LOOKUP_SEP)[0])
+            elif hasattr(part, "flatten"):
+                names.update(node.name.split(LOOKUP_SEP)[0] for node in part.flatten() if isinstance(node, F))
+        return names
+
+    def apply_display_prefetches(self, qs):
+        lookups = [lookup for attr in self.get_display_attrs() for lookup in getattr(attr, "prefetch_lookups", ())]
+        return qs.prefetch_related(*lookups) if lookups else qs
+
+    def apply_only(self, qs):
+        """
+        Load only the columns the changelist displays, see get_only_fields().
+        """
+        fields = self.get_only_fields(qs)
+        if fields is None:
             return qs
+        return qs.only(*fields)
+
+    def get_only_fields(self, qs):
+        """
+        Return the names of the fields the changelist rows read, derived
+        from list_display, list_display_links, list_editable, the ordering
+        and the select_related relations of `qs`. Return None to load every
+        column, when list_only is disabled or a list_display callable doesn't
+        declare the fields it reads with `@display(fields=[...])`.
+        """
+        if not self.model_admin.list_only:
+            return None
+
+        fields = {self.lookup_opts.pk.name}
+        for field_name in {*self.list_display, *(self.list_display_links or ()), *self.list_editable}:
+            try:
+                fields.add(_get_non_gfk_field(self.lookup_opts, field_name).name)
+                continue
+            except FieldIsAForeignKeyColumnName:
+                fields.add(self.lookup_opts.get_field(field_name).name)
+                continue
+            except FieldDoesNotExist:
+                pass
+            attr = get_display_attr(field_name, self.model, self.model_admin)
+            required_fields = getattr(attr, "required_fields", None)
+            # Callables displaying annotated or prefetched values are assumed
+            # to only need the relations they prefetch, unless they say otherwise.
+            if required_fields is None and (hasattr(attr, "annotation") or hasattr(attr, "prefetch_lookups")):
+                required_fields = [
+                    getattr(lookup, "prefetch_through", lookup) for lookup in getattr(attr, "prefetch_lookups", ())
+                ]
+            if required_fields is None:
+                return None
+            fields.update(name.split(LOOKUP_SEP)[0] for name in required_fields)
+
+        for part in self.ordering:
+            if isinstance(part, str):
+                fields.add(part.lstrip("-").split(LOOKUP_SEP)[0])
+            elif isinstance(part, F):
+                fields.add(part.name.split(LOOKUP_SEP)[0])
+            elif isinstance(part, OrderBy) and isinstance(part.expression, F):
+                fields.add(part.expression.name.split(LOOKUP_SEP)[0])
+
+        # Relations followed with select_related can't be deferred.
+        if qs.query.select_related is True:
+            fields.update(field.name for field in self.lookup_opts.fields if field.is_relation)
+        elif qs.query.select_related:
+            fields.update(qs.query.select_related)
+
+        # Keep the names of concrete fields (i.e the ordering may use "?",
+        # "pk" or annotations), "pk" is always loaded.
+        concrete_fields = {field.name for field in self.lookup_opts.concrete_fields}
+        return {name for name in fields if name in concrete_fields}
 
     def apply_select_related(self, qs):
         if self.list_select_related is True:
@@ -651,10 +651,22 @@ class APIModelAdminChecks(BaseAPIModelAdminChecks):
             *self._check_list_select_related(admin_obj),
             *self._check_list_per_page(admin_obj),
             *self._check_list_max_show_all(admin_obj),
+            *self._check_list_only(admin_obj),
+            *self._check_changelist_pagination(admin_obj),
+            *self._check_changelist_streaming(admin_obj),
+            *self._check_count_strategy(admin_obj),
             *self._check_list_editable(admin_obj),
+            *self._check_list_editable_bulk_save(admin_obj),
             *self._check_search_fields(admin_obj),
+            *self._check_search_backend(admin_obj),
+            *self._check_use_distinct(admin_obj),
+            *self._check_export_fields(admin_obj),
+            *self._check_export_chunk_size(admin_obj),
             *self._check_date_hierarchy(admin_obj),
             *self._check_actions(admin_obj),
+            *self._check_actions_max_selected(admin_obj),
+            *self._check_actions_chunk_size(admin_obj),
+            *self._check_delete_selected_chunk_size(admin_obj),
         ]
 
     def _check_save_as(self, obj):
@@ -900,6 +912,40 @@ class APIModelAdminChecks(BaseAPIModelAdminChecks):
         else:
             return []
 
+    def _check_list_only(self, obj):
+        """Check that list_only is a boolean."""
+
+        if not isinstance(obj.list_only, bool):
+            return must_be("a boolean", option="list_only", obj=obj, id="api_admin.E134")
+        else:
+            return []
+
+    def _check_changelist_pagination(self, obj):
+        """Check that changelist_pagination is a known pagination mode."""
+
+        if obj.changelist_pagination not in ("offset", "cursor"):
+            return must_be("one of 'offset' or 'cursor'", option="changelist_pagination", obj=obj, id="api_admin.E131")
+        else:
+            return []
+
+    def _check_changelist_streaming(self, obj):
+        """Check that changelist_streaming is a boolean."""
+
+        if not isinstance(obj.changelist_streaming, bool):
+            return must_be("a boolean", option="changelist_streaming", obj=obj, id="api_admin.E139")
+        else:
+            return []
+
+    def _check_count_strategy(self, obj):
+        """Check that count_strategy is a known count strategy."""
+
+        if obj.count_strategy not in ("exact", "estimated", "cached"):
+            return must_be(
+                "one of 'exact', 'estimated' or 'cached'", option="count_strategy", obj=obj, id="api_admin.E132"
+            )
+        else:
+            return []
+
     def _check_list_editable(self, obj):
         """Check that list_editable is a sequence of editable fields from
         list_display without first element."""
@@ -914,6 +960,14 @@ class APIModelAdminChecks(BaseAPIModelAdminChecks):
                 )
             )
 
+    def _check_list_editable_bulk_save(self, obj):
+        """Check that list_editable_bulk_save is a boolean."""
+
+        if not isinstance(obj.list_editable_bulk_save, bool):
+            return must_be("a boolean", option="list_editable_bulk_save", obj=obj, id="api_admin.E140")
+        else:
+            return []
+
     def _check_list_editable_item(self, obj, field_name, label):
         try:
             field = obj.model._meta.get_field(field_name)
@@ -967,6 +1021,49 @@ class APIModelAdminChecks(BaseAPIModelAdminChecks):
         else:
             return []
 
+    def _check_search_backend(self, obj):
+        """Check that search_backend is a SearchBackend subclass or a dotted path to one."""
+        from django_api_admin.search import SearchBackend
+
+        search_backend = obj.search_backend
+        if search_backend is None:
+            return []
+        if isinstance(search_backend, str):
+            try:
+                search_backend = import_string(search_backend)
+            except ImportError:
+                search_backend = None
+        if not (isinstance(search_backend, type) and issubclass(search_backend, SearchBackend)):
+            return must_be(
+                "a SearchBackend subclass or a dotted path to one", option="search_backend", obj=obj, id="api_admin.E135"
+            )
+        else:
+            return []
+
+    def _check_use_distinct(self, obj):
+        """Check that use_distinct is a boolean."""
+
+        if not isinstance(obj.use_distinct, bool):
+            return must_be("a boolean", option="use_distinct", obj=obj, id="api_admin.E136")
+        else:
+            return []
+
+    def _check_export_fields(self, obj):
+        """Check that export_fields is None or a sequence."""
+
+        if obj.export_fields is not None and not isinstance(obj.export_fields, (list, tuple)):
+            return must_be("a list or tuple", option="export_fields", obj=obj, id="api_admin.E137")
+        else:
+            return []
+
+    def _check_export_chunk_size(self, obj):
+        """Check that export_chunk_size is a positive integer."""
+
+        if not isinstance(obj.export_chunk_size, int) or obj.export_chunk_size < 1:
+            return must_be("a positive integer", option="export_chunk_size", obj=obj, id="api_admin.E138")
+        else:
+            return []
+
     def _check_date_hierarchy(self, obj):
         """Check that date_hierarchy refers to DateField or DateTimeField."""
 
@@ -994,6 +1091,32 @@ class APIModelAdminChecks(BaseAPIModelAdminChecks):
                 else:
                     return []
 
+    def _check_actions_max_selected(self, obj):
+        """Check that actions_max_selected is a positive integer."""
+
+        max_selected = obj.actions_max_selected
+        if not isinstance(max_selected, int) or isinstance(max_selected, bool) or max_selected < 1:
+            return must_be("a positive integer", option="actions_max_selected", obj=obj, id="api_admin.E133")
+        else:
+            return []
+
+    def _check_actions_chunk_size(self, obj):
+        """Check that actions_chunk_size is a positive integer."""
+
+        if not isinstance(obj.actions_chunk_size, int) or obj.actions_chunk_size < 1:
+            return must_be("a positive integer", option="actions_chunk_size", obj=obj, id="api_admin.E141")
+        else:
+            return []
+
+    def _check_delete_selected_chunk_size(self, obj):
+        """Check that delete_selected_chunk_size is None or a positive integer."""
+
+        chunk_size = obj.delete_selected_chunk_size
+        if chunk_size is not None and (not isinstance(chunk_size, int) or chunk_size < 1):
+            return must_be("None or a positive integer", option="delete_selected_chunk_size", obj=obj, id="api_admin.E142")
+        else:
+            return []
+
     def _check_actions(self, obj):
         errors = []
         actions = obj._get_base_actions()
@@ -1047,6 +1170,7 @@ class InlineAPIModelAdminChecks(BaseAPIModelAdminChecks):
             *self._check_extra(inline_obj),
             *self._check_max_num(inline_obj),
             *self._check_min_num(inline_obj),
+            *self._check_bulk_save(inline_obj),
         ]
 
     def _check_exclude_of_parent_model(self, obj, parent_model):
@@ -1116,6 +1240,14 @@ class InlineAPIModelAdminChecks(BaseAPIModelAdminChecks):
         else:
             return []
 
+    def _check_bulk_save(self, obj):
+        """Check that bulk_save is a boolean."""
+
+        if not isinstance(obj.bulk_save, bool):
+            return must_be("a boolean", option="bulk_save", obj=obj, id="api_admin.E206")
+        else:
+            return []
+
 
 def must_be(type, option, obj, id):
     return [
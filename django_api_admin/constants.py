@@ -69,6 +69,7 @@ SERIALIZER_FIELD_ATTRIBUTES = {
     "ListField": [*CORE_FIELD_ATTRIBUTES, *COMPOSITE_FIELDS_ATTRIBUTES, "min_length", "max_length"],
     "DictField": [*CORE_FIELD_ATTRIBUTES, *COMPOSITE_FIELDS_ATTRIBUTES],
     "HStoreField": [*CORE_FIELD_ATTRIBUTES, *COMPOSITE_FIELDS_ATTRIBUTES],
+    "SelectedIdsField": [*CORE_FIELD_ATTRIBUTES, "allow_empty", "max_length", "pk_type"],
     "JSONField": [*CORE_FIELD_ATTRIBUTES, "binary"],
     # Miscellaneous fields
     "ReadOnlyField": [*CORE_FIELD_ATTRIBUTES],
@@ -11,7 +11,7 @@
 # -----------------------------------------------------------------------------
 
 
-def action(function=None, *, permissions=None, description=None):
+def action(function=None, *, permissions=None, description=None, background=None):
     """
     Conveniently add attributes to an action function::
 
@@ -29,6 +29,10 @@ def action(function=None, *, permissions=None, description=None):
             queryset.update(status='p')
         make_published.allowed_permissions = ['publish']
         make_published.short_description = 'Mark selected stories as published'
+
+    `background=True` queues the action to run in the background over the
+    selected objects instead of running it in the request (see
+    `django_api_admin.jobs`).
     """
 
     def decorator(func):
@@ -36,6 +40,8 @@ def action(function=None, *, permissions=None, description=None):
             func.allowed_permissions = permissions
         if description is not None:
             func.short_description = description
+        if background is not None:
+            func.background = background
         return func
 
     if function is None:
@@ -44,7 +50,17 @@ def action(function=None, *, permissions=None, description=None):
         return decorator(function)
 
 
-def display(function=None, *, boolean=None, ordering=None, description=None, empty_value=None):
+def display(
+    function=None,
+    *,
+    boolean=None,
+    ordering=None,
+    description=None,
+    empty_value=None,
+    fields=None,
+    annotate=None,
+    prefetch=None,
+):
     """
     Conveniently add attributes to a display function::
 
@@ -64,6 +80,18 @@ def display(function=None, *, boolean=None, ordering=None, description=None, emp
         is_published.boolean = True
         is_published.admin_order_field = '-publish_date'
         is_published.short_description = 'Is Published?'
+
+    `fields` lists the model fields the function reads, so the changelist
+    can still load only the columns it displays (see `list_only`).
+
+    `annotate` is an expression the changelist annotates its queryset with,
+    the annotated value is displayed instead of calling the function and
+    the column is sortable by it unless `ordering` is given. `prefetch` is
+    a list of lookups the changelist passes to prefetch_related()::
+
+        @admin.display(annotate=Avg('reviews__rating'))
+        def average_rating(self, obj):
+            return obj.reviews.aggregate(Avg('rating'))['rating__avg']
     """
 
     def decorator(func):
@@ -77,6 +105,15 @@ def display(function=None, *, boolean=None, ordering=None, description=None, emp
             func.short_description = description
         if empty_value is not None:
             func.empty_value_display = empty_value
+        if fields is not None:
+            func.required_fields = fields
+        if annotate is not None:
+            func.annotation = annotate
+            func.annotation_name = "_%s" % func.__name__
+            if ordering is None:
+                func.admin_order_field = func.annotation_name
+        if prefetch is not None:
+            func.prefetch_lookups = prefetch
         return func
 
     if function is None:
@@ -14,16 +14,22 @@ certain test -- e.g. being a DateField or ForeignKey.
 """
 
 import datetime
+import hashlib
 
+from django.core.cache import caches
 from django.core.exceptions import ImproperlyConfigured, ValidationError
 from django.db import models
 from django.utils import timezone
+from django.utils.http import urlencode
 from django.utils.translation import gettext_lazy as _
 
 from django_api_admin.exceptions import NotRegistered, IncorrectLookupParameters
+from django_api_admin.signals import watch_data_version
 from django_api_admin.utils.build_q_object_from_lookup_parameters import build_q_object_from_lookup_parameters
+from django_api_admin.utils.get_fields_from_path import get_fields_from_path
 from django_api_admin.utils.get_last_value_from_parameters import get_last_value_from_parameters
 from django_api_admin.utils.get_model_from_relation import get_model_from_relation
+from django_api_admin.utils.model_data_version import get_model_data_version
 from django_api_admin.utils.prepare_lookup_value import prepare_lookup_value
 from django_api_admin.utils.reverse_field_path import reverse_field_path
 
@@ -31,6 +37,8 @@ from django_api_admin.utils.reverse_field_path import reverse_field_path
 class ListFilter:
     title = None  # Human-readable title to appear in the right sidebar.
     template = "admin/filter.html"
+    # True when the filter only returns some of its choices.
+    has_more_choices = False
 
     def __init__(self, request, params, model, model_admin):
         self.request = request
@@ -69,10 +77,77 @@ class ListFilter:
 
 
 class FacetsMixin:
+    # Set facet_cache to True to cache the facet counts in the
+    # facet_cache_alias cache. Cached counts are discarded when the data of
+    # the model changes, unless facet_cache_serve_stale is True in which case
+    # they are served, flagged as stale, until they expire.
+    facet_cache = False
+    facet_cache_alias = "default"
+    facet_cache_timeout = 300
+    facet_cache_serve_stale = False
+
+    def get_facet_cache_key(self, changelist):
+        """
+        Return the cache key of the facet counts of this filter. The counts
+        depend on the filter and search parameters except the ones of this
+        filter. Override this to add the user to the key if the ModelAdmin's
+        get_queryset() returns different objects for different users.
+        """
+        params = changelist.get_count_params()
+        for parameter in self.expected_parameters():
+            params.pop(parameter, None)
+        query_string = "%s?%s" % (
+            ",".join(self.expected_parameters()),
+            urlencode(sorted(params.items()), doseq=True),
+        )
+        digest = hashlib.md5(query_string.encode(), usedforsecurity=False).hexdigest()
+        return "django_api_admin.facets.%s.%s.%s" % (changelist.opts.label_lower, self.__class__.__qualname__, digest)
+
+    def watch_data_version(self, changelist):
+        """
+        Bump the data version the cached counts are checked against whenever
+        the data of the changelist model, or of the related models on the
+        field path of this filter, changes.
+        """
+        watch_data_version(changelist.model)
+        field_path = getattr(self, "field_path", None)
+        if field_path:
+            for field in get_fields_from_path(changelist.model, field_path):
+                if field.related_model is not None:
+                    watch_data_version(field.related_model, dependents=[changelist.model])
+
+    def get_cached_facet_counts(self, changelist, version):
+        """
+        Return a tuple of (counts, stale) from the cache, or None if there
+        are no usable counts for the current choices of this filter.
+        """
+        entry = caches[self.facet_cache_alias].get(self.get_facet_cache_key(changelist))
+        if entry is None:
+            return None
+        cached_version, counts = entry
+        stale = cached_version != version
+        if stale and not self.facet_cache_serve_stale:
+            return None
+        # The choices may have changed since the counts were cached (i.e a
+        # related object was added).
+        if counts.keys() != self.get_facet_counts(changelist.pk_attname, changelist.queryset).keys():
+            return None
+        return counts, stale
+
+    def set_cached_facet_counts(self, changelist, version, counts):
+        caches[self.facet_cache_alias].set(
+            self.get_facet_cache_key(changelist), (version, counts), self.facet_cache_timeout
+        )
+
     def get_facet_counts(self, pk_attname, filtered_qs):
         raise NotImplementedError("subclasses of FacetsMixin must provide a get_facet_counts() method.")
 
     def get_facet_queryset(self, changelist):
+        # Use the facet counts the changelist computed for all of its filters
+        # at once, unless this filter isn't one of them.
+        facet_counts = changelist.get_facet_counts(self.request)
+        if self in facet_counts:
+            return facet_counts[self]
         filtered_qs = changelist.get_queryset(self.request, exclude_parameters=self.expected_parameters())
         return filtered_qs.aggregate(**self.get_facet_counts(changelist.pk_attname, filtered_qs))
 
@@ -196,6 +271,10 @@ class FieldListFilter(FacetsMixin, ListFilter):
 
 
 class RelatedFieldListFilter(FieldListFilter):
+    # The number of choices returned with the changelist, the selected
+    # choices are always returned. Set to None to return every choice.
+    choices_limit = 100
+
     def __init__(self, field, request, params, model, model_admin, field_path):
         other_model = get_model_from_relation(field)
         self.lookup_kwarg = "%s__%s__exact" % (field_path, field.target_field.name)
@@ -224,7 +303,7 @@ class RelatedFieldListFilter(FieldListFilter):
             extra = 1
         else:
             extra = 0
-        return len(self.lookup_choices) + extra > 1
+        return self.has_more_choices or len(self.lookup_choices) + extra > 1
 
     def expected_parameters(self):
         return [self.lookup_kwarg, self.lookup_kwarg_isnull]
@@ -240,9 +319,51 @@ class RelatedFieldListFilter(FieldListFilter):
         else:
             return related_admin.get_ordering(request)
 
-    def field_choices(self, field, request, model_admin):
+    def field_choices_queryset(self, field, request, model_admin):
+        """
+        Return the queryset of the related objects the filter chooses from,
+        in the related model admin's ordering.
+        """
+        queryset = get_model_from_relation(field)._default_manager.all()
+        # Forward relations obey limit_choices_to, like field.get_choices().
+        if hasattr(field, "get_limit_choices_to"):
+            queryset = queryset.complex_filter(field.get_limit_choices_to())
         ordering = self.field_admin_ordering(field, request, model_admin)
-        return field.get_choices(include_blank=False, ordering=ordering)
+        if ordering:
+            queryset = queryset.order_by(*ordering)
+        elif not queryset.ordered:
+            # The choices are sliced, which requires a consistent order.
+            queryset = queryset.order_by("pk")
+        return queryset
+
+    def field_choice(self, obj):
+        """
+        Return the (value, label) choice of a related object.
+        """
+        return getattr(obj, self.field.target_field.attname), str(obj)
+
+    def field_choices(self, field, request, model_admin):
+        """
+        Return the first `choices_limit` choices, preceded by the selected
+        choices that aren't among them. has_more_choices is set when there
+        are more choices.
+        """
+        queryset = self.field_choices_queryset(field, request, model_admin)
+        if self.choices_limit is None:
+            return [self.field_choice(obj) for obj in queryset]
+
+        choices = [self.field_choice(obj) for obj in queryset[: self.choices_limit + 1]]
+        self.has_more_choices = len(choices) > self.choices_limit
+        choices = choices[: self.choices_limit]
+        if self.lookup_val:
+            missing = set(self.lookup_val).difference(str(value) for value, _ in choices)
+            if missing:
+                try:
+                    selected = queryset.filter(**{"%s__in" % field.target_field.name: missing})
+                    choices[:0] = [self.field_choice(obj) for obj in selected]
+                except (ValueError, ValidationError) as e:
+                    raise IncorrectLookupParameters(e)
+        return choices
 
     def get_facet_counts(self, pk_attname, filtered_qs):
         counts = {
@@ -263,17 +384,8 @@ class RelatedFieldListFilter(FieldListFilter):
             "display": _("All"),
             "count": count,
         }
+        yield from self.lookup_choices_display(changelist, facet_counts)
         count = None
-        for pk_val, val in self.lookup_choices:
-            if add_facets:
-                count = facet_counts[f"{pk_val}__c"]
-                val = f"{val} ({count})"
-            yield {
-                "selected": self.lookup_val is not None and str(pk_val) in self.lookup_val,
-                "query_string": changelist.get_query_string({self.lookup_kwarg: pk_val}, [self.lookup_kwarg_isnull]),
-                "display": val,
-                "count": count,
-            }
         empty_title = self.empty_value_display
         if self.include_empty_choice:
             if add_facets:
@@ -286,6 +398,23 @@ class RelatedFieldListFilter(FieldListFilter):
                 "count": count,
             }
 
+    def lookup_choices_display(self, changelist, facet_counts=None):
+        """
+        Yield the choices of `lookup_choices`, with their facet counts when
+        `facet_counts` is given.
+        """
+        count = None
+        for pk_val, val in self.lookup_choices:
+            if facet_counts is not None:
+                count = facet_counts[f"{pk_val}__c"]
+                val = f"{val} ({count})"
+            yield {
+                "selected": self.lookup_val is not None and str(pk_val) in self.lookup_val,
+                "query_string": changelist.get_query_string({self.lookup_kwarg: pk_val}, [self.lookup_kwarg_isnull]),
+                "display": val,
+                "count": count,
+            }
+
 
 FieldListFilter.register(lambda f: f.remote_field, RelatedFieldListFilter)
 
@@ -501,6 +630,13 @@ FieldListFilter.register(lambda f: isinstance(f, models.DateField), DateFieldLis
 # if a field is eligible to use the BooleanFieldListFilter, that'd be much
 # more appropriate, and the AllValuesFieldListFilter won't get used for it.
 class AllValuesFieldListFilter(FieldListFilter):
+    # The maximum number of values, when there are more distinct values only
+    # the most frequent ones are returned. Set to None to return every value.
+    max_values = 100
+    # Set values_cache to True to cache the values in the facet_cache_alias
+    # cache until the data of the model changes.
+    values_cache = False
+
     def __init__(self, field, request, params, model, model_admin, field_path):
         self.lookup_kwarg = field_path
         self.lookup_kwarg_isnull = "%s__isnull" % field_path
@@ -513,9 +649,82 @@ class AllValuesFieldListFilter(FieldListFilter):
             queryset = model_admin.get_queryset(request)
         else:
             queryset = parent_model._default_manager.all()
-        self.lookup_choices = queryset.distinct().order_by(field.name).values_list(field.name, flat=True)
+        if self.values_cache:
+            self.lookup_choices, self.has_more_choices = self.get_cached_values(field, parent_model, queryset)
+        else:
+            self.lookup_choices, self.has_more_choices = self.get_values(field, queryset)
+        if self.has_more_choices and self.lookup_val:
+            self.lookup_choices = self.get_selected_values(field, queryset, self.lookup_choices) + self.lookup_choices
         super().__init__(field, request, params, model, model_admin, field_path)
 
+    def get_values(self, field, queryset):
+        """
+        Return a tuple of (values, truncated) where values are the distinct
+        values of the field ordered by value. When there are more than
+        `max_values` values, the most frequent ones are counted with a single
+        GROUP BY query and truncated is True.
+        """
+        if self.max_values is None:
+            return list(queryset.distinct().order_by(field.name).values_list(field.name, flat=True)), False
+
+        values = list(
+            queryset.order_by()
+            .values(field.name)
+            .annotate(frequency=models.Count("*"))
+            .order_by("-frequency", field.name)
+            .values_list(field.name, flat=True)[: self.max_values + 1]
+        )
+        truncated = len(values) > self.max_values
+        values = values[: self.max_values]
+        # Order the values like the unbounded list, with the empty value last.
+        ordered_values = sorted(value for value in values if value is not None)
+        if None in values:
+            ordered_values.append(None)
+        return ordered_values, truncated
+
+    def get_selected_values(self, field, queryset, values):
+        """
+        Return the selected values that aren't among the truncated `values`,
+        ordered by value.
+        """
+        missing = set(self.lookup_val).difference(str(value) for value in values)
+        if not missing:
+            return []
+        try:
+            selected = queryset.filter(**{"%s__in" % field.name: missing})
+            return list(selected.distinct().order_by(field.name).values_list(field.name, flat=True))
+        except (ValueError, ValidationError) as e:
+            raise IncorrectLookupParameters(e)
+
+    def get_values_cache_key(self, model):
+        """
+        Return the cache key of the values of this filter. Override this to
+        add the user to the key if the ModelAdmin's get_queryset() returns
+        different objects for different users.
+        """
+        return "django_api_admin.values.%s.%s.%s.%s" % (
+            model._meta.label_lower,
+            self.__class__.__qualname__,
+            self.lookup_kwarg,
+            self.max_values,
+        )
+
+    def get_cached_values(self, field, model, queryset):
+        """
+        Return get_values() from the cache, the cached values are discarded
+        when the data of `model` changes.
+        """
+        watch_data_version(model)
+        cache = caches[self.facet_cache_alias]
+        key = self.get_values_cache_key(model)
+        version = get_model_data_version(model)
+        entry = cache.get(key)
+        if entry is not None and entry[0] == version:
+            return entry[1]
+        values = self.get_values(field, queryset)
+        cache.set(key, (version, values), self.facet_cache_timeout)
+        return values
+
     def expected_parameters(self):
         return [self.lookup_kwarg, self.lookup_kwarg_isnull]
 
@@ -567,10 +776,10 @@ FieldListFilter.register(lambda f: True, AllValuesFieldListFilter)
 
 
 class RelatedOnlyFieldListFilter(RelatedFieldListFilter):
-    def field_choices(self, field, request, model_admin):
-        pk_qs = model_admin.get_queryset(request).distinct().values_list("%s__pk" % self.field_path, flat=True)
-        ordering = self.field_admin_ordering(field, request, model_admin)
-        return field.get_choices(include_blank=False, limit_choices_to={"pk__in": pk_qs}, ordering=ordering)
+    def field_choices_queryset(self, field, request, model_admin):
+        # An IN subquery doesn't need its values to be distinct.
+        pk_qs = model_admin.get_queryset(request).order_by().values("%s__pk" % self.field_path)
+        return super().field_choices_queryset(field, request, model_admin).filter(pk__in=pk_qs)
 
 
 class EmptyFieldListFilter(FieldListFilter):
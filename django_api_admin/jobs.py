@@ -0,0 +1,318 @@
+"""
+Run the admin actions decorated with ``@action(background=True)`` outside of
+the request that selected their objects. The request queues an ActionJob,
+which is run by the thread pool of the admin site, or by the
+``run_action_jobs`` management command when the site has no job workers.
+The objects are processed in chunks, each in its own transaction, and the
+result of the job is recorded in a LogEntry of the model of the action.
+
+The objects are selected again when the job runs, with the changelist
+parameters of the request that queued it: the objects changed in the
+meantime are processed if they match the parameters then, and the objects
+added after the job was queued are left out.
+
+A running job reports its progress after each chunk. Jobs that stopped
+reporting it for longer than the timeout of their site, i.e because the
+process running them died, are queued again and resume after the last
+chunk they processed.
+"""
+
+import json
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from functools import partial
+
+from django.db import connections, router, transaction
+from django.http import HttpRequest, QueryDict
+from django.utils import timezone
+
+from rest_framework.request import Request
+
+from django_api_admin.exceptions import NotRegistered
+from django_api_admin.models import CHANGE, FAILED, QUEUED, RUNNING, SUCCEEDED, ActionJob, LogEntry
+from django_api_admin.signals import bump_data_version
+
+logger = logging.getLogger("django_api_admin.jobs")
+
+# The META keys of the request that queued a job that the request of the
+# job is built with, so that the action can build absolute URLs.
+JOB_REQUEST_META_KEYS = (
+    "HTTP_HOST",
+    "HTTP_X_FORWARDED_HOST",
+    "HTTP_X_FORWARDED_PORT",
+    "SERVER_NAME",
+    "SERVER_PORT",
+    "SCRIPT_NAME",
+)
+
+# {admin site: the thread pool running its jobs}
+_executors = {}
+_executors_lock = threading.Lock()
+
+
+class ActionFailed(Exception):
+    """
+    The action returned an error response for a chunk of objects.
+    """
+
+
+class JobHttpRequest(HttpRequest):
+    """
+    The request the action of a job is called with. Its scheme is the scheme
+    of the request that queued the job.
+    """
+
+    def _get_scheme(self):
+        return self.META.get("wsgi.url_scheme", super()._get_scheme())
+
+
+def get_executor(admin_site):
+    """
+    Return the thread pool of ``action_job_workers`` threads that runs the
+    jobs queued by ``admin_site``.
+    """
+    with _executors_lock:
+        executor = _executors.get(admin_site)
+        if executor is None:
+            executor = ThreadPoolExecutor(
+                max_workers=admin_site.action_job_workers,
+                thread_name_prefix="django_api_admin.jobs.%s" % admin_site.name,
+            )
+            _executors[admin_site] = executor
+        return executor
+
+
+def enqueue_job(job, admin_site):
+    """
+    Submit ``job`` to the thread pool once the transaction that queued it is
+    committed, unless the site leaves its jobs to ``run_action_jobs``.
+    """
+    if admin_site.action_job_workers:
+        executor = get_executor(admin_site)
+        transaction.on_commit(
+            partial(executor.submit, run_job_in_thread, job.pk, admin_site),
+            using=router.db_for_write(ActionJob),
+        )
+
+
+def run_job_in_thread(job_id, admin_site):
+    """
+    Run the job ``job_id``, then the jobs of ``admin_site`` that are queued,
+    including the ones queued again after their worker died.
+    """
+    try:
+        run_job(job_id)
+        run_pending_jobs(timeout=admin_site.action_job_timeout, site_name=admin_site.name)
+    except Exception:
+        logger.exception("Action job %s crashed.", job_id)
+    finally:
+        # The connections of the worker thread aren't closed by a request.
+        connections.close_all()
+
+
+def requeue_stale_jobs(timeout, site_name=None):
+    """
+    Queue the running jobs that didn't report their progress for the last
+    ``timeout`` seconds again, and return their number.
+    """
+    jobs = ActionJob.objects.filter(status=RUNNING, heartbeat_at__lt=timezone.now() - timedelta(seconds=timeout))
+    if site_name is not None:
+        jobs = jobs.filter(site_name=site_name)
+    count = jobs.update(status=QUEUED)
+    if count:
+        logger.warning("Queued %d stale action job(s) again.", count)
+    return count
+
+
+def run_pending_jobs(limit=None, timeout=None, site_name=None):
+    """
+    Run the queued jobs, oldest first, and return the number of jobs run.
+    With a ``timeout``, the stale running jobs are queued again first.
+    """
+    if timeout is not None:
+        requeue_stale_jobs(timeout, site_name)
+    count = 0
+    job_ids = ActionJob.objects.filter(status=QUEUED)
+    if site_name is not None:
+        job_ids = job_ids.filter(site_name=site_name)
+    job_ids = job_ids.order_by("created_at", "pk").values_list("pk", flat=True)
+    for job_id in job_ids[:limit] if limit else job_ids:
+        if run_job(job_id) is not None:
+            count += 1
+    return count
+
+
+def get_job_request_meta(request):
+    """
+    Return the host and scheme META of ``request`` to keep with the job it
+    queues.
+    """
+    meta = {key: request.META[key] for key in JOB_REQUEST_META_KEYS if key in request.META}
+    meta["wsgi.url_scheme"] = request.scheme
+    return meta
+
+
+def get_job_request(job):
+    """
+    Return the request the action of ``job`` is called with, made by the
+    user who queued the job with the changelist parameters, host and scheme
+    of the request that queued it.
+    """
+    http_request = JobHttpRequest()
+    http_request.method = "POST"
+    http_request.META.update(job.request_meta)
+    http_request.GET = QueryDict(mutable=True)
+    for key, values in job.query_params.items():
+        http_request.GET.setlist(key, values)
+    request = Request(http_request)
+    request.user = job.user
+    return request
+
+
+def get_job_action(job, request):
+    """
+    Return the model admin and the action function of ``job``, or raise
+    LookupError if they're no longer available to the user of the job.
+    """
+    from django_api_admin.sites import all_sites
+
+    for site in all_sites:
+        if site.name == job.site_name:
+            break
+    else:
+        raise LookupError("There is no admin site named %r." % job.site_name)
+
+    try:
+        model_admin = site.get_model_admin(job.content_type.model_class())
+    except NotRegistered as e:
+        raise LookupError(str(e))
+    try:
+        func = model_admin.get_actions(request)[job.action][0]
+    except KeyError:
+        raise LookupError("The action %r isn't available." % job.action)
+    return model_admin, func
+
+
+def get_job_queryset(job, model_admin, request):
+    """
+    Return the objects selected by ``job``: the objects of the changelist
+    filtered by the parameters of the request that queued the job, up to the
+    greatest primary key when it was queued. The parameters are applied
+    again, so the objects are the ones that match them now.
+    """
+    changelist = model_admin.get_changelist_instance(request, load_results=False)
+    queryset = changelist.get_queryset(request)
+    if not job.select_across:
+        queryset = queryset.filter(pk__in=job.selected_ids)
+    if job.max_pk is not None:
+        queryset = queryset.filter(pk__lte=job.max_pk)
+    return queryset.order_by("pk")
+
+
+def run_job(job_id):
+    """
+    Run the queued job ``job_id`` and return it, or return None if another
+    worker has claimed it.
+    """
+    now = timezone.now()
+    claimed = ActionJob.objects.filter(pk=job_id, status=QUEUED).update(status=RUNNING, started_at=now, heartbeat_at=now)
+    if not claimed:
+        return None
+
+    job = ActionJob.objects.select_related("user", "content_type").get(pk=job_id)
+    request = get_job_request(job)
+    try:
+        model_admin, func = get_job_action(job, request)
+        queryset = get_job_queryset(job, model_admin, request)
+    except Exception as e:
+        job.errors.append({"start": job.processed, "stop": job.total, "message": str(e)})
+    else:
+        run_job_chunks(job, model_admin, func, request, queryset)
+
+    job.status = FAILED if job.errors else SUCCEEDED
+    job.finished_at = timezone.now()
+    job.save(update_fields=["status", "processed", "succeeded", "failed", "errors", "last_pk", "finished_at"])
+    log_job(job)
+    return job
+
+
+def run_job_chunks(job, model_admin, func, request, queryset):
+    """
+    Call the action of ``job`` on the objects of ``queryset``,
+    ``actions_chunk_size`` objects at a time in the order of their primary
+    keys, starting after the last chunk it processed, and record its
+    progress and errors. A chunk fails when the action raises an exception
+    or returns an error response, its changes are rolled back.
+    """
+    objects = model_admin.get_queryset(request)
+    using = router.db_for_write(model_admin.model)
+    chunk_size = model_admin.actions_chunk_size
+    while True:
+        chunk_queryset = queryset if job.last_pk is None else queryset.filter(pk__gt=job.last_pk)
+        chunk = list(chunk_queryset.values_list("pk", flat=True)[:chunk_size])
+        if not chunk:
+            break
+
+        start = job.processed
+        try:
+            with transaction.atomic(using=using):
+                response = func(model_admin, request, objects.filter(pk__in=chunk))
+                status_code = getattr(response, "status_code", None)
+                if status_code is not None and not 200 <= status_code < 300:
+                    raise ActionFailed(get_response_message(response))
+        except Exception as e:
+            if not isinstance(e, ActionFailed):
+                logger.exception("Action job %s failed on objects %d to %d.", job.pk, start, start + len(chunk))
+            job.errors.append({"start": start, "stop": start + len(chunk), "message": str(e)})
+            job.failed += len(chunk)
+        else:
+            job.succeeded += len(chunk)
+        job.processed += len(chunk)
+        job.last_pk = chunk[-1]
+        ActionJob.objects.filter(pk=job.pk).update(
+            processed=job.processed,
+            succeeded=job.succeeded,
+            failed=job.failed,
+            errors=job.errors,
+            last_pk=job.last_pk,
+            heartbeat_at=timezone.now(),
+        )
+
+
+def get_response_message(response):
+    """
+    Return the message of the error ``response`` of an action.
+    """
+    data = getattr(response, "data", None)
+    if isinstance(data, dict) and "detail" in data:
+        return str(data["detail"])
+    return "The action responded with status %d." % response.status_code
+
+
+def log_job(job):
+    """
+    Log the result of ``job`` in a LogEntry of the model of its action.
+    """
+    change_message = [
+        {
+            "ran": {
+                "action": job.action,
+                "processed": job.processed,
+                "succeeded": job.succeeded,
+                "failed": job.failed,
+                "total": job.total,
+                "errors": job.errors,
+            }
+        }
+    ]
+    # The action may have changed the objects without logging it.
+    bump_data_version(job.content_type.model_class())
+    return LogEntry.objects.create(
+        user_id=job.user_id,
+        content_type_id=job.content_type_id,
+        object_repr=str(job)[:200],
+        action_flag=CHANGE,
+        change_message=json.dumps(change_message),
+    )
@@ -0,0 +1,52 @@
+from django.apps import apps
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management.base import BaseCommand, CommandError
+
+from django_api_admin.sites import all_sites
+
+
+class Command(BaseCommand):
+    help = "Build the full-text search indexes of the ModelAdmins that use a search_backend."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "models",
+            nargs="*",
+            metavar="app_label.ModelName",
+            help="Only build the indexes of these models.",
+        )
+        parser.add_argument(
+            "--rebuild",
+            action="store_true",
+            help="Drop the indexes and build them from scratch.",
+        )
+        parser.add_argument(
+            "--database",
+            help="The database to build the indexes in, defaults to the model's write database.",
+        )
+
+    def handle(self, *labels, **options):
+        try:
+            models = {apps.get_model(label) for label in labels}
+        except (LookupError, ValueError) as e:
+            raise CommandError(e)
+
+        built = 0
+        for site in all_sites:
+            for model, model_admin in site._registry.items():
+                search_backend = model_admin.get_search_backend()
+                if search_backend is None or (models and model not in models):
+                    continue
+                try:
+                    if options["rebuild"]:
+                        search_backend.rebuild_index(options["database"])
+                    else:
+                        search_backend.build_index(options["database"])
+                except ImproperlyConfigured as e:
+                    raise CommandError(e)
+                built += 1
+                if options["verbosity"] >= 1:
+                    self.stdout.write("Built the search index of %s (%s)." % (model._meta.label, site.name))
+
+        if not built and options["verbosity"] >= 1:
+            self.stdout.write("No ModelAdmin uses a search_backend.")
@@ -0,0 +1,42 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from django_api_admin.jobs import run_pending_jobs
+
+
+class Command(BaseCommand):
+    help = "Run the queued jobs of the background admin actions."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Run the queued jobs and exit instead of waiting for new jobs.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=5,
+            help="The number of seconds to wait between checks for new jobs.",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            help="The maximum number of jobs to run per check.",
+        )
+        parser.add_argument(
+            "--timeout",
+            type=float,
+            default=300,
+            help="The number of seconds after which a running job that stopped reporting its progress is queued again.",
+        )
+
+    def handle(self, **options):
+        while True:
+            count = run_pending_jobs(options["limit"], options["timeout"])
+            if count and options["verbosity"] >= 1:
+                self.stdout.write("Ran %d action job(s)." % count)
+            if options["once"]:
+                return
+            time.sleep(options["interval"])
@@ -0,0 +1,51 @@
+# Generated by Django 5.2.18 on 2026-10-16 22:58
+
+import django.core.serializers.json
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('django_api_admin', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ActionJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('site_name', models.CharField(max_length=100, verbose_name='site name')),
+                ('action', models.CharField(max_length=200, verbose_name='action')),
+                ('query_params', models.JSONField(default=dict, verbose_name='query parameters')),
+                ('request_meta', models.JSONField(default=dict, verbose_name='request meta')),
+                ('select_across', models.BooleanField(default=False, verbose_name='select across')),
+                ('selected_ids', models.JSONField(default=list, encoder=django.core.serializers.json.DjangoJSONEncoder, verbose_name='selected ids')),
+                ('max_pk', models.JSONField(blank=True, encoder=django.core.serializers.json.DjangoJSONEncoder, null=True, verbose_name='max pk')),
+                ('last_pk', models.JSONField(blank=True, encoder=django.core.serializers.json.DjangoJSONEncoder, null=True, verbose_name='last pk')),
+                ('status', models.CharField(choices=[('queued', 'Queued'), ('running', 'Running'), ('succeeded', 'Succeeded'), ('failed', 'Failed')], default='queued', max_length=20, verbose_name='status')),
+                ('total', models.PositiveIntegerField(default=0, verbose_name='total')),
+                ('processed', models.PositiveIntegerField(default=0, verbose_name='processed')),
+                ('succeeded', models.PositiveIntegerField(default=0, verbose_name='succeeded')),
+                ('failed', models.PositiveIntegerField(default=0, verbose_name='failed')),
+                ('errors', models.JSONField(default=list, verbose_name='errors')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now, editable=False, verbose_name='created at')),
+                ('started_at', models.DateTimeField(blank=True, null=True, verbose_name='started at')),
+                ('heartbeat_at', models.DateTimeField(blank=True, null=True, verbose_name='heartbeat at')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='finished at')),
+                ('content_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='django_api_admin_actionjob_jobs', to='contenttypes.contenttype', verbose_name='content type')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='django_api_admin_actionjob_user', to=settings.AUTH_USER_MODEL, verbose_name='user')),
+            ],
+            options={
+                'verbose_name': 'action job',
+                'verbose_name_plural': 'action jobs',
+                'db_table': 'django_api_admin_action_job',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
@@ -14,6 +14,7 @@ import json
 
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
 from django.urls import NoReverseMatch, reverse
 from django.utils import timezone
@@ -22,6 +23,7 @@ from django.utils.translation import gettext
 from django.utils.translation import gettext_lazy as _
 
 from django_api_admin.utils.quote import quote
+from django_api_admin.signals import bump_data_version
 
 ADDITION = 1
 CHANGE = 2
@@ -33,25 +35,52 @@ ACTION_FLAG_CHOICES = [
     (DELETION, _("Deletion")),
 ]
 
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+JOB_STATUS_CHOICES = [
+    (QUEUED, _("Queued")),
+    (RUNNING, _("Running")),
+    (SUCCEEDED, _("Succeeded")),
+    (FAILED, _("Failed")),
+]
+
 
 class LogEntryManager(models.Manager):
     use_in_migrations = True
 
     def log_actions(self, user_id, queryset, action_flag, change_message="", *, single_object=False):
-        if isinstance(change_message, list):
-            change_message = json.dumps(change_message)
-
-        log_entry_list = [
-            self.model(
-                user_id=user_id,
-                content_type_id=ContentType.objects.get_for_model(obj, for_concrete_model=False).id,
-                object_id=obj.pk,
-                object_repr=str(obj)[:200],
-                action_flag=action_flag,
-                change_message=change_message,
+        return self.log_messages(
+            user_id, ((obj, change_message) for obj in queryset), action_flag, single_object=single_object
+        )
+
+    def log_messages(self, user_id, messages, action_flag, *, single_object=False):
+        """
+        Log ``action_flag`` for each ``(obj, change_message)`` pair of
+        ``messages`` with a single INSERT.
+        """
+        log_entry_list = []
+        changed_models = set()
+        for obj, change_message in messages:
+            if isinstance(change_message, list):
+                change_message = json.dumps(change_message)
+            log_entry_list.append(
+                self.model(
+                    user_id=user_id,
+                    content_type_id=ContentType.objects.get_for_model(obj, for_concrete_model=False).id,
+                    object_id=obj.pk,
+                    object_repr=str(obj)[:200],
+                    action_flag=action_flag,
+                    change_message=change_message,
+                )
             )
-            for obj in queryset
-        ]
+            changed_models.add(type(obj))
+
+        # Invalidate the caches derived from the data of the changed models
+        for model in changed_models:
+            bump_data_version(model)
 
         if len(log_entry_list) == 1:
             instance = log_entry_list[0]
@@ -155,6 +184,15 @@ class LogEntry(models.Model):
                     sub_message["deleted"]["name"] = gettext(sub_message["deleted"]["name"])
                     messages.append(gettext("Deleted {name} “{object}”.").format(**sub_message["deleted"]))
 
+                elif "ran" in sub_message:
+                    messages.append(
+                        gettext("Ran the action “{action}” on {succeeded} of {total} objects.").format(**sub_message["ran"])
+                    )
+                    if sub_message["ran"]["failed"]:
+                        messages.append(gettext("It failed on {failed} objects.").format(**sub_message["ran"]))
+                    for error in sub_message["ran"].get("errors", []):
+                        messages.append(gettext("Failed on objects {start} to {stop}: {message}").format(**error))
+
             change_message = " ".join(msg[0].upper() + msg[1:] for msg in messages)
             return change_message or gettext("No fields changed.")
         else:
@@ -178,3 +216,56 @@ class LogEntry(models.Model):
             except NoReverseMatch:
                 pass
         return None
+
+
+class ActionJob(models.Model):
+    """
+    An admin action decorated with ``@action(background=True)``, queued to
+    run in the background over the objects selected when it was queued. The
+    selection is kept as the changelist parameters of the request and the
+    selected primary keys, or all the objects matching the parameters up to
+    ``max_pk`` with ``select_across``. The selection is evaluated again when
+    the job runs, so the objects changed in the meantime are selected if
+    they match the parameters then. ``request_meta`` keeps the host and
+    scheme of the request, for the URLs built by the action.
+    """
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, models.CASCADE, verbose_name=_("user"), related_name="django_api_admin_actionjob_user"
+    )
+    site_name = models.CharField(_("site name"), max_length=100)
+    content_type = models.ForeignKey(
+        ContentType,
+        models.CASCADE,
+        verbose_name=_("content type"),
+        related_name="django_api_admin_actionjob_jobs",
+    )
+    action = models.CharField(_("action"), max_length=200)
+    query_params = models.JSONField(_("query parameters"), default=dict)
+    request_meta = models.JSONField(_("request meta"), default=dict)
+    select_across = models.BooleanField(_("select across"), default=False)
+    selected_ids = models.JSONField(_("selected ids"), default=list, encoder=DjangoJSONEncoder)
+    max_pk = models.JSONField(_("max pk"), blank=True, null=True, encoder=DjangoJSONEncoder)
+    last_pk = models.JSONField(_("last pk"), blank=True, null=True, encoder=DjangoJSONEncoder)
+    status = models.CharField(_("status"), max_length=20, choices=JOB_STATUS_CHOICES, default=QUEUED)
+    total = models.PositiveIntegerField(_("total"), default=0)
+    processed = models.PositiveIntegerField(_("processed"), default=0)
+    succeeded = models.PositiveIntegerField(_("succeeded"), default=0)
+    failed = models.PositiveIntegerField(_("failed"), default=0)
+    errors = models.JSONField(_("errors"), default=list)
+    created_at = models.DateTimeField(_("created at"), default=timezone.now, editable=False)
+    started_at = models.DateTimeField(_("started at"), blank=True, null=True)
+    heartbeat_at = models.DateTimeField(_("heartbeat at"), blank=True, null=True)
+    finished_at = models.DateTimeField(_("finished at"), blank=True, null=True)
+
+    class Meta:
+        verbose_name = _("action job")
+        verbose_name_plural = _("action jobs")
+        db_table = "django_api_admin_action_job"
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return "%s (%s)" % (self.action, self.get_status_display())
+
+    def is_finished(self):
+        return self.status in (SUCCEEDED, FAILED)
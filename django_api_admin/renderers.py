@@ -0,0 +1,193 @@
+"""
+Renderers of the admin views. The export and streaming renderers produce
+large responses (changelist exports and pages) incrementally with stream(),
+the orjson and MessagePack renderers are faster alternatives to JSONRenderer
+for `APIAdminSite.renderer_classes`.
+"""
+
+import csv
+from collections.abc import Iterator
+
+from django.core.exceptions import ImproperlyConfigured
+
+from rest_framework.compat import LONG_SEPARATORS, SHORT_SEPARATORS
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+class _Echo:
+    """
+    A file-like object whose write() returns the value written instead of
+    buffering it, so csv.writer can produce each row as a string.
+    """
+
+    def write(self, value):
+        return value
+
+
+class ExportRenderer(BaseRenderer):
+    """
+    Base class of the export renderers, the rendered data is a dictionary
+    with a list of `columns` (dictionaries with the `field` and `headerName`
+    of each column) and an iterable of `rows` (lists of cell values).
+    """
+
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return b"".join(self.stream(data["columns"], data["rows"]))
+
+    def stream(self, columns, rows):
+        """
+        Yield the export of `rows` as bytestrings.
+        """
+        raise NotImplementedError("subclasses of ExportRenderer must provide a stream() method")
+
+
+class CSVRenderer(ExportRenderer):
+    """
+    Render a header of the column names, followed by a record per row.
+    """
+
+    media_type = "text/csv"
+    format = "csv"
+
+    def stream(self, columns, rows):
+        writer = csv.writer(_Echo())
+        yield writer.writerow([str(column["headerName"]) for column in columns]).encode(self.charset)
+        for row in rows:
+            yield writer.writerow(["" if value is None else str(value) for value in row]).encode(self.charset)
+
+
+class NDJSONRenderer(ExportRenderer):
+    """
+    Render a JSON object per row, mapping the field of each column to its
+    value.
+    """
+
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+    encoder_class = JSONEncoder
+
+    def stream(self, columns, rows):
+        fields = [column["field"] for column in columns]
+        encoder = self.encoder_class(ensure_ascii=False)
+        for row in rows:
+            yield (encoder.encode(dict(zip(fields, row))) + "\n").encode(self.charset)
+
+
+class StreamingJSONRenderer(JSONRenderer):
+    """
+    Render JSON incrementally, iterators (i.e generators) in the rendered
+    data are encoded as arrays one item at a time. stream() yields the
+    output in chunks of about `chunk_size` characters.
+    """
+
+    chunk_size = 64 * 1024
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return b"".join(self.stream(data))
+
+    def stream(self, data):
+        """
+        Yield the JSON encoding of `data` as bytestrings.
+        """
+        separators = SHORT_SEPARATORS if self.compact else LONG_SEPARATORS
+        encoder = self.encoder_class(ensure_ascii=self.ensure_ascii, allow_nan=not self.strict, separators=separators)
+        chunk, size = [], 0
+        for part in self.iterencode(data, encoder, separators):
+            chunk.append(part)
+            size += len(part)
+            if size >= self.chunk_size:
+                yield self.encode_chunk(chunk)
+                chunk, size = [], 0
+        if chunk:
+            yield self.encode_chunk(chunk)
+
+    def encode_chunk(self, chunk):
+        # Escape \u2028 and \u2029 like JSONRenderer does.
+        return "".join(chunk).replace("\u2028", "\\u2028").replace("\u2029", "\\u2029").encode()
+
+    def iterencode(self, data, encoder, separators):
+        item_separator, key_separator = separators
+        if isinstance(data, Iterator):
+            yield "["
+            for i, item in enumerate(data):
+                if i:
+                    yield item_separator
+                yield encoder.encode(item)
+            yield "]"
+        elif isinstance(data, dict) and self.has_iterator(data):
+            yield "{"
+            for i, (key, value) in enumerate(data.items()):
+                if i:
+                    yield item_separator
+                yield encoder.encode(str(key)) + key_separator
+                yield from self.iterencode(value, encoder, separators)
+            yield "}"
+        else:
+            # Values without iterators are encoded at once.
+            yield encoder.encode(data)
+
+    def has_iterator(self, data):
+        return any(
+            isinstance(value, Iterator) or (isinstance(value, dict) and self.has_iterator(value)) for value in data.values()
+        )
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    Render JSON with orjson, falling back to JSONRenderer when orjson isn't
+    installed. Values orjson doesn't support (i.e lazy translation strings
+    and Decimals) and datetimes are encoded the same way JSONRenderer
+    encodes them, so both renderers produce the same data, except for NaN
+    and infinite floats which orjson renders as null.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None:
+            return super().render(data, accepted_media_type, renderer_context)
+        if data is None:
+            return b""
+
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            option |= orjson.OPT_INDENT_2
+        ret = orjson.dumps(data, default=self.encoder_class().default, option=option)
+        # Escape \u2028 and \u2029 like JSONRenderer does.
+        return ret.replace("\u2028".encode(), b"\\u2028").replace("\u2029".encode(), b"\\u2029")
+
+
+class MessagePackRenderer(BaseRenderer):
+    """
+    Render MessagePack, requires the msgpack package. Values MessagePack
+    doesn't support (i.e lazy translation strings, Decimals and datetimes)
+    are encoded the same way JSONRenderer encodes them.
+    """
+
+    media_type = "application/msgpack"
+    format = "msgpack"
+    charset = None
+    render_style = "binary"
+    encoder_class = JSONEncoder
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if msgpack is None:
+            raise ImproperlyConfigured("%s requires the msgpack package." % self.__class__.__name__)
+        if data is None:
+            return b""
+        return msgpack.packb(data, default=self.encoder_class().default, use_bin_type=True)
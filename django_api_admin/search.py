@@ -0,0 +1,316 @@
+"""
+Full-text search backends for the `search_backend` ModelAdmin option.
+
+A backend replaces the `icontains` lookups of `get_search_results()` for
+the changelist `q` parameter and the autocomplete view. The backends index
+the model's `search_fields`, ignoring their `^`, `=` and `@` prefixes.
+"""
+
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
+from django.db import connections, models, router
+from django.db.backends.utils import truncate_name
+from django.db.models.expressions import RawSQL
+from django.db.models.constants import LOOKUP_SEP
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.utils.text import smart_split, unescape_string_literal
+
+from django_api_admin.exceptions import NotRelationField
+from django_api_admin.utils.get_fields_from_path import get_fields_from_path
+from django_api_admin.utils.lookup_spawns_duplicates import lookup_spawns_duplicates
+
+
+class SearchBackend:
+    """
+    Base class of search backends. Subclasses implement search(), and the
+    index management methods if they keep an index.
+    """
+
+    vendor = None
+
+    def __init__(self, model_admin):
+        self.model_admin = model_admin
+        self.model = model_admin.model
+        self.opts = model_admin.opts
+
+    def get_search_paths(self):
+        """
+        Return the field paths of `search_fields` without their prefixes and
+        lookups (i.e "^name" and "name__exact" become "name").
+        """
+        paths = []
+        for search_field in self.model_admin.search_fields:
+            path = str(search_field).lstrip("^=@")
+            parts = path.split(LOOKUP_SEP)
+            while parts:
+                try:
+                    get_fields_from_path(self.model, LOOKUP_SEP.join(parts))
+                    break
+                except (FieldDoesNotExist, NotRelationField):
+                    parts.pop()
+            if parts:
+                paths.append(LOOKUP_SEP.join(parts))
+        return paths
+
+    def get_search_terms(self, search_term):
+        terms = []
+        for bit in smart_split(search_term):
+            if bit.startswith(('"', "'")) and bit[0] == bit[-1]:
+                bit = unescape_string_literal(bit)
+            if bit:
+                terms.append(bit)
+        return terms
+
+    def is_available(self, using):
+        """
+        Return True if the backend can search the `using` database, else
+        get_search_results() falls back to `icontains` lookups.
+        """
+        return connections[using].vendor == self.vendor
+
+    def search(self, request, queryset, search_term):
+        """
+        Return a tuple containing a queryset to implement the search
+        and a boolean indicating if the results may contain duplicates.
+        """
+        raise NotImplementedError("subclasses of SearchBackend must provide a search() method")
+
+    def connect_signals(self):
+        """
+        Connect the signals that keep the index in sync with the model.
+        """
+
+    def build_index(self, using=None):
+        """
+        Create the index if it doesn't exist and fill it.
+        """
+
+    def rebuild_index(self, using=None):
+        """
+        Drop the index and build it again.
+        """
+        self.build_index(using)
+
+
+class PostgresSearchBackend(SearchBackend):
+    """
+    Search with PostgreSQL full-text search over a SearchVector of the
+    search fields. build_index() creates a GIN index on the same vector,
+    which requires all the search fields to be fields of the model.
+    """
+
+    vendor = "postgresql"
+    config = "english"
+    search_type = "websearch"
+
+    def get_search_vector(self):
+        from django.contrib.postgres.search import SearchVector
+
+        return SearchVector(*self.get_search_paths(), config=self.config)
+
+    def search(self, request, queryset, search_term):
+        from django.contrib.postgres.search import SearchQuery
+
+        query = SearchQuery(search_term, config=self.config, search_type=self.search_type)
+        queryset = queryset.alias(_search_vector=self.get_search_vector()).filter(_search_vector=query)
+        may_have_duplicates = any(lookup_spawns_duplicates(self.opts, path) for path in self.get_search_paths())
+        return queryset, may_have_duplicates
+
+    def get_index_name(self, connection):
+        return truncate_name("%s_search" % self.opts.db_table, connection.ops.max_name_length())
+
+    def build_index(self, using=None):
+        using = using or router.db_for_write(self.model)
+        if any(LOOKUP_SEP in path for path in self.get_search_paths()):
+            raise ImproperlyConfigured(
+                "%s can only index fields of %s." % (self.__class__.__name__, self.opts.label),
+            )
+        connection = connections[using]
+        query = self.model._default_manager.using(using).all().query
+        compiler = query.get_compiler(using)
+        sql, params = compiler.compile(self.get_search_vector().resolve_expression(query))
+        qn = connection.ops.quote_name
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS %s ON %s USING GIN ((%s))"
+                % (qn(self.get_index_name(connection)), qn(self.opts.db_table), sql),
+                params,
+            )
+
+    def rebuild_index(self, using=None):
+        using = using or router.db_for_write(self.model)
+        connection = connections[using]
+        with connection.cursor() as cursor:
+            cursor.execute("DROP INDEX IF EXISTS %s" % connection.ops.quote_name(self.get_index_name(connection)))
+        self.build_index(using)
+
+
+class SQLiteFTS5SearchBackend(SearchBackend):
+    """
+    Search with an SQLite FTS5 virtual table that shadows the search fields.
+    Rows are keyed by primary key, which must be an integer, and are kept in
+    sync by post_save and post_delete signals of the model and the models
+    its search fields span. Writes that don't send signals (i.e update())
+    require the index to be rebuilt.
+    """
+
+    vendor = "sqlite"
+    tokenize = "unicode61 remove_diacritics 2"
+    index_chunk_size = 1000
+
+    def __init__(self, model_admin):
+        super().__init__(model_admin)
+        # The databases the table exists in. A missing table isn't cached,
+        # the index may be built by another process at any time.
+        self._table_exists = set()
+
+    def get_table_name(self):
+        return "%s_fts" % self.opts.db_table
+
+    def table_exists(self, using):
+        if using in self._table_exists:
+            return True
+        connection = connections[using]
+        with connection.cursor() as cursor:
+            exists = self.get_table_name() in connection.introspection.table_names(cursor)
+        if exists:
+            self._table_exists.add(using)
+        return exists
+
+    def is_available(self, using):
+        return super().is_available(using) and self.table_exists(using)
+
+    def get_match_query(self, search_term):
+        # Every term must match the beginning of a token.
+        return " AND ".join('"%s"*' % term.replace('"', '""') for term in self.get_search_terms(search_term))
+
+    def search(self, request, queryset, search_term):
+        match_query = self.get_match_query(search_term)
+        if not match_query:
+            return queryset, False
+        table = connections[queryset.db].ops.quote_name(self.get_table_name())
+        rowids = RawSQL("SELECT rowid FROM %s WHERE %s MATCH %%s" % (table, table), [match_query])
+        return queryset.filter(pk__in=rowids), False
+
+    def get_index_rows(self, queryset):
+        """
+        Return a dictionary mapping the primary keys of `queryset` to the
+        text of each search field.
+        """
+        paths = self.get_search_paths()
+        rows = {pk: [[] for _ in paths] for pk in queryset.values_list("pk", flat=True)}
+        for i, path in enumerate(paths):
+            for pk, value in queryset.values_list("pk", path):
+                if value is not None:
+                    rows[pk][i].append(str(value))
+        return {pk: [" ".join(values) for values in columns] for pk, columns in rows.items()}
+
+    def index_objects(self, queryset, using):
+        rows = self.get_index_rows(queryset)
+        if not rows:
+            return
+        connection = connections[using]
+        table = connection.ops.quote_name(self.get_table_name())
+        columns = ", ".join(["rowid", *("c%d" % i for i in range(len(self.get_search_paths())))])
+        placeholders = ", ".join(["%s"] * (len(self.get_search_paths()) + 1))
+        with connection.cursor() as cursor:
+            cursor.executemany("DELETE FROM %s WHERE rowid = %%s" % table, [[pk] for pk in rows])
+            cursor.executemany(
+                "INSERT INTO %s (%s) VALUES (%s)" % (table, columns, placeholders),
+                [[pk, *columns] for pk, columns in rows.items()],
+            )
+
+    def build_index(self, using=None):
+        using = using or router.db_for_write(self.model)
+        if not isinstance(self.opts.pk, (models.AutoField, models.BigAutoField, models.IntegerField)):
+            raise ImproperlyConfigured(
+                "%s requires %s to have an integer primary key." % (self.__class__.__name__, self.opts.label),
+            )
+        connection = connections[using]
+        table = connection.ops.quote_name(self.get_table_name())
+        columns = ", ".join("c%d" % i for i in range(len(self.get_search_paths())))
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS %s USING fts5(%s, tokenize='%s')" % (table, columns, self.tokenize)
+            )
+            cursor.execute("DELETE FROM %s" % table)
+        # Index the objects in chunks, seeking past the last indexed pk.
+        queryset = self.model._default_manager.using(using).order_by("pk")
+        last_pk = None
+        while True:
+            chunk = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+            pks = list(chunk.values_list("pk", flat=True)[: self.index_chunk_size])
+            if not pks:
+                break
+            self.index_objects(queryset.filter(pk__in=pks), using)
+            last_pk = pks[-1]
+
+    def rebuild_index(self, using=None):
+        using = using or router.db_for_write(self.model)
+        connection = connections[using]
+        with connection.cursor() as cursor:
+            cursor.execute("DROP TABLE IF EXISTS %s" % connection.ops.quote_name(self.get_table_name()))
+        self._table_exists.discard(using)
+        self.build_index(using)
+
+    def connect_signals(self):
+        dispatch_uid = "django_api_admin.search.%s" % self.opts.label_lower
+        post_save.connect(self.handle_save, sender=self.model, weak=False, dispatch_uid=dispatch_uid)
+        post_delete.connect(self.handle_delete, sender=self.model, weak=False, dispatch_uid=dispatch_uid)
+        for path in self.get_search_paths():
+            fields = get_fields_from_path(self.model, path)
+            for i, field in enumerate(fields[:-1]):
+                # Index the objects again when an object they reach through
+                # their search fields is saved or deleted.
+                relation_path = LOOKUP_SEP.join(path.split(LOOKUP_SEP)[: i + 1])
+                related_dispatch_uid = "%s.%s" % (dispatch_uid, relation_path)
+                post_save.connect(
+                    self.get_related_save_handler(relation_path),
+                    sender=field.related_model,
+                    weak=False,
+                    dispatch_uid=related_dispatch_uid,
+                )
+                pre_delete_handler, post_delete_handler = self.get_related_delete_handlers(relation_path)
+                pre_delete.connect(
+                    pre_delete_handler, sender=field.related_model, weak=False, dispatch_uid=related_dispatch_uid
+                )
+                post_delete.connect(
+                    post_delete_handler, sender=field.related_model, weak=False, dispatch_uid=related_dispatch_uid
+                )
+
+    def handle_save(self, sender, instance, using, **kwargs):
+        if self.is_available(using):
+            self.index_objects(self.model._default_manager.using(using).filter(pk=instance.pk), using)
+
+    def handle_delete(self, sender, instance, using, **kwargs):
+        if self.is_available(using):
+            connection = connections[using]
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "DELETE FROM %s WHERE rowid = %%s" % connection.ops.quote_name(self.get_table_name()),
+                    [instance.pk],
+                )
+
+    def get_related_save_handler(self, relation_path):
+        def handle_related_save(sender, instance, using, **kwargs):
+            if self.is_available(using):
+                queryset = self.model._default_manager.using(using).filter(**{"%s__pk" % relation_path: instance.pk})
+                self.index_objects(queryset, using)
+
+        return handle_related_save
+
+    def get_related_delete_handlers(self, relation_path):
+        # The objects reaching the deleted object are looked up before it's
+        # deleted, and indexed again once it's gone.
+        attname = "_search_index_pks_%s" % relation_path
+
+        def handle_related_pre_delete(sender, instance, using, **kwargs):
+            if self.is_available(using):
+                queryset = self.model._default_manager.using(using).filter(**{"%s__pk" % relation_path: instance.pk})
+                setattr(instance, attname, list(queryset.values_list("pk", flat=True)))
+
+        def handle_related_post_delete(sender, instance, using, **kwargs):
+            pks = instance.__dict__.pop(attname, None)
+            if pks:
+                self.index_objects(self.model._default_manager.using(using).filter(pk__in=pks), using)
+
+        return handle_related_pre_delete, handle_related_post_delete
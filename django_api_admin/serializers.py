@@ -3,7 +3,7 @@ from django.utils.translation import gettext_lazy as _
 
 from rest_framework import serializers
 
-from django_api_admin.models import LogEntry
+from django_api_admin.models import ActionJob, LogEntry
 
 UserModel = get_user_model()
 
@@ -38,6 +38,48 @@ class LogEntrySerializer(serializers.ModelSerializer):
         }
 
 
+class ActionJobSerializer(serializers.ModelSerializer):
+    """
+    default ActionJob serializer.
+    """
+
+    class Meta:
+        model = ActionJob
+        exclude = ("query_params", "selected_ids", "max_pk", "last_pk")
+        extra_kwargs = {
+            "user": {"help_text": _("The user who queued the action.")},
+            "site_name": {"help_text": _("The name of the admin site of the action.")},
+            "content_type": {"help_text": _("The content type of the objects of the action.")},
+            "action": {"help_text": _("The name of the action.")},
+            "status": {"help_text": _("The status of the job.")},
+            "total": {"help_text": _("The number of selected objects.")},
+            "select_across": {"help_text": _("Whether all the objects matching the changelist filters are selected.")},
+            "processed": {"help_text": _("The number of objects the action ran on.")},
+            "succeeded": {"help_text": _("The number of objects the action succeeded on.")},
+            "failed": {"help_text": _("The number of objects the action failed on.")},
+            "errors": {"help_text": _("The errors of the chunks of objects the action failed on.")},
+            "created_at": {"help_text": _("The date and time the job was queued.")},
+            "started_at": {"help_text": _("The date and time the job started.")},
+            "heartbeat_at": {"help_text": _("The date and time the job last reported its progress.")},
+            "finished_at": {"help_text": _("The date and time the job finished.")},
+        }
+
+
+class ActionJobResponseSerializer(serializers.Serializer):
+    status = serializers.IntegerField(default=200, help_text=_("The status code of the response."))
+    data = ActionJobSerializer(required=True, help_text=_("The job of the background action."))
+
+
+class ActionJobQueuedSerializer(serializers.Serializer):
+    job_id = serializers.IntegerField(help_text=_("The ID of the queued job."))
+    url = serializers.CharField(help_text=_("The URL of the status of the job."))
+
+
+class ActionJobQueuedResponseSerializer(serializers.Serializer):
+    status = serializers.IntegerField(default=202, help_text=_("The status code of the response."))
+    data = ActionJobQueuedSerializer(required=True, help_text=_("The data of the response."))
+
+
 class PaginationSerializer(serializers.Serializer):
     num_pages = serializers.IntegerField(required=True, help_text=_("The total number of pages."))
     count = serializers.IntegerField(required=True, help_text=_("The total number of items."))
@@ -80,6 +122,34 @@ class ViewOnsiteViewResponseSerializer(serializers.Serializer):
     data = ViewOnsiteViewSerializer(required=True, help_text=_("The data of the response."))
 
 
+class SelectedIdsField(serializers.ListField):
+    """
+    A list of primary keys of objects in ``queryset``. The submitted keys are
+    checked with a single query instead of enumerating the objects as choices.
+    """
+
+    default_error_messages = {
+        "does_not_exist": _('Invalid pk "{pk_value}" - object does not exist.'),
+    }
+
+    def __init__(self, queryset=None, **kwargs):
+        self.queryset = queryset
+        super().__init__(**kwargs)
+
+    @property
+    def pk_type(self):
+        return type(self.child).__name__
+
+    def to_internal_value(self, data):
+        value = super().to_internal_value(data)
+        if value and self.queryset is not None:
+            found = set(self.queryset.filter(pk__in=value).values_list("pk", flat=True))
+            for pk in value:
+                if pk not in found:
+                    self.fail("does_not_exist", pk_value=pk)
+        return value
+
+
 class ActionSerializer(serializers.Serializer):
     """
     checks that a valid action is selected
@@ -90,7 +160,7 @@ class ActionSerializer(serializers.Serializer):
             ("", "---------"),
         ]
     )
-    selected_ids = serializers.MultipleChoiceField(required=False, choices=[("", "")])
+    selected_ids = SelectedIdsField(required=False)
     select_across = serializers.BooleanField(required=False, default=0)
 
 
@@ -123,6 +193,21 @@ class ChangeListSerializer(serializers.Serializer):
     pp = serializers.IntegerField(required=False, min_value=1, help_text=_("Number of rows per page."))
     all = serializers.BooleanField(required=False, help_text=_("Show all results."))
     o = serializers.CharField(required=False, help_text=_("The field(s) to use for ordering."))
+    cursor = serializers.CharField(
+        required=False, help_text=_("An opaque cursor returned by a previous page, used when cursor pagination is enabled.")
+    )
+    fields = serializers.CharField(
+        required=False,
+        help_text=_("A comma separated list of the list_display fields to include, all of them by default."),
+    )
+    layout = serializers.ChoiceField(
+        choices=["objects", "arrays", "columns"],
+        required=False,
+        help_text=_(
+            "The layout of the rows: objects mapping field names to values (the default), "
+            "arrays of values ordered like the columns, or an array of values per column."
+        ),
+    )
 
 
 class ModelSerializer(serializers.Serializer):
@@ -188,6 +273,12 @@ class AutoCompleteResponseSerializer(serializers.Serializer):
     data = AutocompleteDataSerializer(required=True, help_text=_("The data of the response."))
 
 
+class FilterChoicesSerializer(serializers.Serializer):
+    _field_path = serializers.CharField(required=True, help_text=_("The field path of the related field filter."))
+    _term = serializers.CharField(required=False, default="", help_text=_("The search term to filter the choices."))
+    _page = serializers.IntegerField(required=False, min_value=1, help_text=_("Page number."))
+
+
 class FormatsSerializer(serializers.Serializer):
     DATE_FORMAT = serializers.CharField(allow_blank=False)
     DATETIME_FORMAT = serializers.CharField(allow_blank=False)
@@ -528,6 +619,33 @@ class FilterChoiceSerializer(serializers.Serializer):
 class FilterSerializer(serializers.Serializer):
     title = serializers.CharField(help_text=_("The title of the filter."))
     choices = FilterChoiceSerializer(many=True, help_text=_("The list of available choices for this filter."))
+    facets_stale = serializers.BooleanField(
+        help_text=_("Whether the facet counts were served from a cache that predates the latest changes.")
+    )
+    more = serializers.BooleanField(
+        help_text=_(
+            "Whether the filter has more choices than it returned, the choices of related field filters "
+            "are paged through with the filter choices endpoint."
+        )
+    )
+    field_path = serializers.CharField(
+        allow_null=True, help_text=_("The field path of the filter, null for filters that don't filter a field.")
+    )
+
+
+class FilterChoicesDataSerializer(serializers.Serializer):
+    choices = FilterChoiceSerializer(many=True, help_text=_("A page of the filter choices."))
+    pagination = AutocompletePaginationSerializer(help_text=_("Pagination information."))
+
+
+class FilterChoicesResponseSerializer(serializers.Serializer):
+    status = serializers.IntegerField(default=200, help_text=_("The status code of the response."))
+    data = FilterChoicesDataSerializer(help_text=_("The data of the response."))
+
+
+class CountStrategySerializer(serializers.Serializer):
+    full_count = serializers.CharField(allow_null=True, help_text=_("The strategy that produced full_count."))
+    result_count = serializers.CharField(allow_null=True, help_text=_("The strategy that produced result_count."))
 
 
 class EditingFieldSerializer(serializers.Serializer):
@@ -540,6 +658,9 @@ class ConfigSerializer(serializers.Serializer):
     actions_on_top = serializers.BooleanField(help_text=_("Whether to display actions at the top of the list."))
     actions_on_bottom = serializers.BooleanField(help_text=_("Whether to display actions at the bottom of the list."))
     actions_selection_counter = serializers.BooleanField(help_text=_("Whether to show a counter for selected items."))
+    actions_max_selected = serializers.IntegerField(
+        help_text=_("The maximum number of items that can be selected for an action.")
+    )
     empty_value_display = serializers.CharField(help_text=_("The string to display for empty values."))
     list_display = serializers.ListField(child=serializers.CharField(), help_text=_("The fields to display in the list."))
     list_display_links = serializers.ListField(
@@ -554,6 +675,9 @@ class ConfigSerializer(serializers.Serializer):
     list_max_show_all = serializers.IntegerField(
         help_text=_("The maximum number of items to show when 'Show all' is clicked.")
     )
+    changelist_pagination = serializers.ChoiceField(
+        choices=["offset", "cursor"], help_text=_("The pagination mode used by the changelist.")
+    )
     date_hierarchy = serializers.CharField(help_text=_("The field to use for date-based navigation."))
     search_help_text = serializers.CharField(allow_null=True, help_text=_("The help text to display for the search box."))
     sortable_by = serializers.ListField(
@@ -561,10 +685,25 @@ class ConfigSerializer(serializers.Serializer):
     )
     search_fields = serializers.ListField(child=serializers.CharField(), help_text=_("The fields to include in the search."))
     preserve_filters = serializers.BooleanField(help_text=_("Whether to preserve filters after saving an object."))
-    full_count = serializers.IntegerField(help_text=_("The total number of objects in the database."))
-    result_count = serializers.IntegerField(help_text=_("The number of objects matching the current filters."))
-    page_count = serializers.IntegerField(help_text=_("The number of pages."))
+    full_count = serializers.IntegerField(allow_null=True, help_text=_("The total number of objects in the database."))
+    result_count = serializers.IntegerField(
+        allow_null=True, help_text=_("The number of objects matching the current filters.")
+    )
+    count_strategy = CountStrategySerializer(
+        help_text=_("Which count strategy (exact, estimated, or cached) produced each count.")
+    )
+    page_count = serializers.IntegerField(allow_null=True, help_text=_("The number of pages."))
+    next_cursor = serializers.CharField(
+        allow_null=True, help_text=_("The cursor of the next page when using cursor pagination.")
+    )
+    prev_cursor = serializers.CharField(
+        allow_null=True, help_text=_("The cursor of the previous page when using cursor pagination.")
+    )
     action_choices = ActionChoiceSerializer(many=True, help_text=_("The list of available actions."))
+    background_actions = serializers.ListField(
+        child=serializers.CharField(),
+        help_text=_("The names of the actions that run in the background and respond with a job."),
+    )
     filters = FilterSerializer(many=True, help_text=_("The list of available filters."))
     list_display_fields = serializers.ListField(
         child=serializers.CharField(), help_text=_("The list of fields available for list display.")
@@ -588,7 +727,24 @@ class ChangelistDataSerializer(serializers.Serializer):
     action_form = serializers.ListField(child=FieldSerializer(required=True), help_text=_("The fields of the action form."))
     config = ConfigSerializer(help_text=_("Configuration metadata for the changelist."))
     columns = ColumnSerializer(many=True, help_text=_("A list of column definitions for the table."))
-    rows = RowSerializer(many=True, help_text=_("The actual data rows to be displayed."))
+    rows = RowSerializer(
+        many=True,
+        help_text=_(
+            "The actual data rows to be displayed. With the `arrays` layout a list of the cell values of each row, "
+            "with the `columns` layout a list of the values of each column."
+        ),
+    )
+    ids = serializers.ListField(
+        required=False, help_text=_("The primary key of each row, when using the `arrays` or `columns` layout.")
+    )
+    dictionaries = serializers.DictField(
+        required=False,
+        child=serializers.ListField(),
+        help_text=_(
+            "The distinct values of the dictionary encoded columns (foreign keys and fields with choices), "
+            "mapped by field name. The cells of these columns are indices into this list."
+        ),
+    )
     list_editing_formset = serializers.ListField(
         required=False,
         child=FieldSerializer(many=True, required=True),
@@ -608,6 +764,30 @@ class ResponseMessageSerializer(serializers.Serializer):
     detail = serializers.CharField(help_text=_("A detailed description of the response message."))
 
 
+class DeletePreviewSerializer(serializers.Serializer):
+    deleted_objects = serializers.ListField(
+        child=serializers.JSONField(),
+        help_text=_("The nested list of the objects that would be deleted."),
+    )
+    model_count = serializers.DictField(
+        child=serializers.IntegerField(),
+        help_text=_("The number of objects that would be deleted per model."),
+    )
+    perms_needed = serializers.ListField(
+        child=serializers.CharField(),
+        help_text=_("The models of the related objects the user isn't allowed to delete."),
+    )
+    protected = serializers.ListField(
+        child=serializers.JSONField(),
+        help_text=_("The protected objects that prevent the deletion."),
+    )
+
+
+class DeletePreviewResponseSerializer(serializers.Serializer):
+    status = serializers.IntegerField(default=200, help_text=_("The status code of the response."))
+    data = DeletePreviewSerializer(required=True, help_text=_("The preview of the deletion."))
+
+
 class OKResponseSerializer(serializers.Serializer):
     status = serializers.IntegerField(
         default=200,
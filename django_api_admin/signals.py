@@ -0,0 +1,73 @@
+import threading
+
+from django.apps import apps
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models.signals import post_delete, post_save
+
+from django_api_admin.utils.model_data_version import bump_model_data_version
+
+# {concrete model: {concrete models whose cached data is derived from it}}
+_watched_models = {}
+_watched_models_lock = threading.Lock()
+
+
+def bump_data_version(sender, **kwargs):
+    """
+    Invalidate the caches derived from the data of ``sender``, and of the
+    models whose cached data depends on it, whenever one of its objects is
+    saved or deleted.
+    """
+    concrete_model = sender._meta.concrete_model
+    bump_model_data_version(concrete_model)
+    for dependent in _watched_models.get(concrete_model, ()):
+        bump_model_data_version(dependent)
+
+
+def watch_data_version(model, dependents=()):
+    """
+    Bump the data version of ``model`` and of its ``dependents`` whenever an
+    object of ``model`` (or of one of its proxies) is saved or deleted.
+    """
+    concrete_model = model._meta.concrete_model
+    dependents = {dependent._meta.concrete_model for dependent in dependents} - {concrete_model}
+    watched = _watched_models.get(concrete_model)
+    if watched is not None and dependents <= watched:
+        return
+
+    with _watched_models_lock:
+        if concrete_model not in _watched_models:
+            for sender in apps.get_models():
+                if sender._meta.concrete_model is concrete_model:
+                    dispatch_uid = "django_api_admin.bump_data_version.%s" % sender._meta.label_lower
+                    post_save.connect(bump_data_version, sender=sender, dispatch_uid=dispatch_uid)
+                    post_delete.connect(bump_data_version, sender=sender, dispatch_uid=dispatch_uid)
+        # Replaced rather than updated, bump_data_version() may be iterating it.
+        _watched_models[concrete_model] = _watched_models.get(concrete_model, set()) | dependents
+
+
+def watch_model_admin(model_admin):
+    """
+    Watch the data version of the model of ``model_admin`` and of the related
+    models its ``list_filter`` spans, so that writes from any process bump
+    the versions the facet and values caches are checked against. Called
+    when the model is registered, i.e when the admin modules are discovered
+    at startup.
+    """
+    from django_api_admin.exceptions import NotRelationField
+    from django_api_admin.utils.get_fields_from_path import get_fields_from_path
+
+    model = model_admin.model
+    watch_data_version(model)
+    for list_filter in model_admin.list_filter:
+        if isinstance(list_filter, (tuple, list)):
+            list_filter = list_filter[0]
+        if not isinstance(list_filter, str):
+            continue
+        try:
+            fields = get_fields_from_path(model, list_filter)
+        except (FieldDoesNotExist, NotRelationField):
+            # Invalid paths are reported by the system checks.
+            continue
+        for field in fields:
+            if field.related_model is not None:
+                watch_data_version(field.related_model, dependents=[model])
@@ -27,6 +27,7 @@ from django.utils.translation import gettext_lazy, gettext as _
 from django_api_admin import actions
 from django_api_admin.admins.model_admin import APIModelAdmin
 from django_api_admin.exceptions import AlreadyRegistered, NotRegistered, admin_exception_handler
+from django_api_admin.signals import watch_model_admin
 
 from rest_framework.exceptions import NotFound
 from rest_framework.renderers import JSONRenderer
@@ -85,6 +86,14 @@ class APIAdminSite:
     # The renderer classes used by the site's views
     renderer_classes = [JSONRenderer]
 
+    # The number of threads running the background actions, 0 leaves them
+    # to the `run_action_jobs` management command
+    action_job_workers = 2
+
+    # The number of seconds after which a running background action that
+    # stopped reporting its progress is queued again
+    action_job_timeout = 300
+
     def __init__(self, include_auth=True, name="api_admin"):
         from django.contrib.auth.models import Group
         from django_api_admin import serializers as api_serializers
@@ -155,6 +164,7 @@ class APIAdminSite:
 
                 # Instantiate the admin class to save in the registry
                 self._registry[model] = admin_class(model, self)
+                watch_model_admin(self._registry[model])
 
     def unregister(self, model_or_iterable):
         """
@@ -337,6 +347,7 @@ class APIAdminSite:
             path("site_context/", self.get_site_context_view(), name="site_context"),
             path("history/", self.get_history_view(), name="history"),
             path("permissions/", self.get_permissions_view(), name="permissions"),
+            path("jobs/<int:job_id>/", self.get_action_job_view(), name="action_job"),
             path(
                 "r/<path:content_type_id>/<path:object_id>/",
                 self.get_view_on_site_view(),
@@ -462,6 +473,19 @@ class APIAdminSite:
         }
         return PermissionsView.as_view(**defaults)
 
+    def get_action_job_view(self):
+        from django_api_admin.admin_views.admin_site_views.action_job import ActionJobView
+        from django_api_admin.serializers import ActionJobSerializer
+
+        defaults = {
+            "serializer_class": ActionJobSerializer,
+            "authentication_classes": self.get_authentication_classes(),
+            "permission_classes": self.get_permission_classes(),
+            "admin_site": self,
+            "renderer_classes": self.renderer_classes,
+        }
+        return ActionJobView.as_view(**defaults)
+
     def get_schema_view(self, urlconf):
         from drf_spectacular.views import SpectacularAPIView
 
@@ -0,0 +1,158 @@
+from collections import defaultdict
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db import connections, models, router
+
+from rest_framework import serializers
+from rest_framework.utils import model_meta
+
+from django_api_admin.signals import bump_data_version
+from django_api_admin.utils.bulk_set_m2m import bulk_set_m2m, can_bulk_set_m2m
+
+
+def get_update_fields(serializer, changed_data):
+    """
+    Return the names of the concrete fields and a dictionary mapping the
+    names of the many-to-many fields to their values that saving the
+    ``changed_data`` of the change ``serializer`` writes, or None if it
+    writes attributes that bulk_update() can't save (i.e properties or
+    reverse relations).
+    """
+    opts = serializer.instance._meta
+    sources = {serializer.fields[field_name].source for field_name in changed_data}
+    if sources & {"*", "."}:
+        sources = set(serializer.validated_data)
+
+    update_fields, m2m_values = set(), {}
+    for source in sources:
+        try:
+            field = opts.get_field(source)
+        except FieldDoesNotExist:
+            return None
+        if field.many_to_many and not field.auto_created:
+            m2m_values[field.name] = serializer.validated_data[source]
+        elif field.concrete and not field.primary_key:
+            update_fields.add(field.name)
+        else:
+            return None
+    return update_fields, m2m_values
+
+
+def can_bulk_save(serializer):
+    """
+    Return True if the ``serializer`` saves its model instance with the
+    ModelSerializer defaults and the model doesn't override save().
+    """
+    serializer_class = type(serializer)
+    model = serializer_class.Meta.model
+    return (
+        serializer_class.save is serializers.ModelSerializer.save
+        and serializer_class.create is serializers.ModelSerializer.create
+        and serializer_class.update is serializers.ModelSerializer.update
+        and model.save is models.Model.save
+        and not model._meta.parents
+    )
+
+
+def bulk_update_objects(model, objs, update_fields):
+    """
+    Update the ``update_fields`` of the ``objs`` of ``model`` with a single
+    bulk_update(). Like save(), the fields with ``auto_now`` are set to the
+    current time and updated too.
+    """
+    auto_now_fields = [field for field in model._meta.concrete_fields if getattr(field, "auto_now", False)]
+    for field in auto_now_fields:
+        for obj in objs:
+            field.pre_save(obj, add=False)
+    update_fields = {*update_fields, *(field.name for field in auto_now_fields)}
+    model._default_manager.bulk_update(objs, sorted(update_fields))
+
+
+def bulk_set_m2m_values(model, m2m_values):
+    """
+    Set the values of ``m2m_values``, a dictionary mapping the names of the
+    many-to-many relations of ``model`` to dictionaries of objects and their
+    values, in bulk when possible.
+    """
+    for field_name, values_by_object in m2m_values.items():
+        field = model._meta.get_field(field_name)
+        if field.many_to_many and not field.auto_created and can_bulk_set_m2m(field):
+            bulk_set_m2m(field, values_by_object)
+        else:
+            for obj, values in values_by_object.items():
+                getattr(obj, field_name).set(values)
+
+
+def bulk_create_serializers(model, add_serializers):
+    """
+    Create the instances of the valid ``add_serializers`` of ``model`` with a
+    single bulk_create() and set their many-to-many fields in bulk. Like
+    bulk_create(), the save() method of the model isn't called and the
+    pre_save and post_save signals aren't sent; serializers that can't be
+    saved in bulk are saved one at a time.
+    """
+    db = router.db_for_write(model)
+    if not connections[db].features.can_return_rows_from_bulk_insert:
+        add_serializers, rows = [], add_serializers
+    else:
+        add_serializers, rows = (
+            [serializer for serializer in add_serializers if can_bulk_save(serializer)],
+            [serializer for serializer in add_serializers if not can_bulk_save(serializer)],
+        )
+
+    info = model_meta.get_field_info(model)
+    instances, m2m_values = [], defaultdict(dict)
+    for serializer in add_serializers:
+        validated_data = {**serializer.validated_data}
+        many_to_many = {}
+        for field_name, relation_info in info.relations.items():
+            if relation_info.to_many and field_name in validated_data:
+                many_to_many[field_name] = validated_data.pop(field_name)
+        serializer.instance = model(**validated_data)
+        instances.append(serializer.instance)
+        for field_name, values in many_to_many.items():
+            m2m_values[field_name][serializer.instance] = values
+
+    if instances:
+        model._default_manager.using(db).bulk_create(instances)
+        bulk_set_m2m_values(model, m2m_values)
+        bump_data_version(model)
+    for serializer in rows:
+        serializer.save()
+
+
+def bulk_update_serializers(model, change_results):
+    """
+    Save the ``(serializer, changed_data)`` pairs of the changed instances of
+    ``model`` with a bulk_update() of the changed fields per group of
+    instances that changed the same fields and set their many-to-many fields
+    in bulk. Like bulk_update(), the save() method of the model isn't called
+    and the pre_save and post_save signals aren't sent; serializers that
+    can't be saved in bulk are saved one at a time.
+    """
+    info = model_meta.get_field_info(model)
+    update_groups, m2m_values, rows = defaultdict(list), defaultdict(dict), []
+    for serializer, changed_data in change_results:
+        if not changed_data:
+            continue
+        fields = get_update_fields(serializer, changed_data) if can_bulk_save(serializer) else None
+        if fields is None:
+            rows.append(serializer)
+            continue
+
+        update_fields, row_m2m_values = fields
+        for attr, value in serializer.validated_data.items():
+            if not (attr in info.relations and info.relations[attr].to_many):
+                setattr(serializer.instance, attr, value)
+        if update_fields:
+            update_groups[frozenset(update_fields)].append(serializer.instance)
+        for field_name, values in row_m2m_values.items():
+            m2m_values[field_name][serializer.instance] = values
+
+    for update_fields, instances in update_groups.items():
+        bulk_update_objects(model, instances, update_fields)
+    bulk_set_m2m_values(model, m2m_values)
+    if update_groups or m2m_values:
+        bump_data_version(model)
+    for serializer in rows:
+        serializer.save()
@@ -0,0 +1,56 @@
+from django.db import models, router
+
+
+def can_bulk_set_m2m(field):
+    """
+    Return True if bulk_set_m2m() writes the same rows as the ``set()`` of
+    the related manager of the many-to-many ``field``, i.e. the field has an
+    auto-created intermediate model and isn't symmetrical.
+    """
+    remote_field = field.remote_field
+    return remote_field.through._meta.auto_created and not remote_field.symmetrical
+
+
+def bulk_set_m2m(field, values_by_object):
+    """
+    Set the values of the many-to-many ``field`` of several objects, like
+    calling ``getattr(obj, field.name).set(values)`` on each of them, with a
+    query to read the current relations, a deletion of the removed ones and
+    a query to insert the added ones. The m2m_changed signal isn't sent.
+
+    ``values_by_object`` maps the objects to their new related objects or
+    primary keys.
+    """
+    through = field.remote_field.through
+    source = through._meta.get_field(field.m2m_field_name())
+    target = through._meta.get_field(field.m2m_reverse_field_name())
+    source_attname = field.model._meta.get_field(field.m2m_target_field_name()).attname
+    target_attname = field.related_model._meta.get_field(field.m2m_reverse_target_field_name()).attname
+    db = router.db_for_write(through)
+
+    missing = {}
+    for obj, values in values_by_object.items():
+        missing[getattr(obj, source_attname)] = {
+            getattr(value, target_attname) if isinstance(value, models.Model) else target.target_field.to_python(value)
+            for value in values
+        }
+    if not missing:
+        return
+
+    removed = []
+    relations = through._base_manager.using(db).filter(**{"%s__in" % source.attname: list(missing)})
+    for pk, source_value, target_value in relations.values_list("pk", source.attname, target.attname):
+        if target_value in missing[source_value]:
+            missing[source_value].discard(target_value)
+        else:
+            removed.append(pk)
+
+    if removed:
+        through._base_manager.using(db).filter(pk__in=removed).delete()
+    added = [
+        through(**{source.attname: source_value, target.attname: target_value})
+        for source_value, target_values in missing.items()
+        for target_value in target_values
+    ]
+    if added:
+        through._base_manager.using(db).bulk_create(added)
@@ -0,0 +1,103 @@
+from operator import attrgetter
+
+from django.db.models import Model
+from django.core.exceptions import FieldDoesNotExist, ObjectDoesNotExist
+
+from django_api_admin.utils._get_non_gfk_field import _get_non_gfk_field
+from django_api_admin.utils.get_display_attr import get_display_attr
+from django_api_admin.exceptions import FieldIsAForeignKeyColumnName
+
+
+def _model_attribute_getter(name):
+    def getter(obj):
+        attr = getattr(obj, name)
+        return attr() if callable(attr) else attr
+
+    return getter
+
+
+def _annotated_getter(annotation_name, getter):
+    def annotated_getter(obj):
+        try:
+            return getattr(obj, annotation_name)
+        except AttributeError:
+            return getter(obj)
+
+    return annotated_getter
+
+
+def _display_value(value):
+    return str(value) if value and isinstance(value, Model) else value
+
+
+def compile_column_plan(model, fields_list, model_admin):
+    """
+    Resolve how each changelist column is read from a result once, instead of
+    for every cell. Return a tuple of (field_name, getter, to_repr) where
+    getter(obj) returns the value of the column and to_repr(value), when not
+    None, turns a value that isn't None into its display representation.
+
+    The columns are resolved the same way `lookup_field` resolves them: model
+    fields, foreign keys (displayed with `__str__`), fields with choices
+    (displayed with the choice label), callables, `model_admin` callables and
+    model attributes or methods, reading the values annotated by
+    `@display(annotate=...)` instead of calling them.
+    """
+    opts = model._meta
+    plan = []
+
+    for field_name in fields_list:
+        try:
+            field = _get_non_gfk_field(opts, field_name)
+        except (FieldDoesNotExist, FieldIsAForeignKeyColumnName):
+            field = None
+            if callable(field_name):
+                getter = field_name
+            elif hasattr(model_admin, field_name) and field_name != "__str__":
+                getter = getattr(model_admin, field_name)
+            else:
+                getter = _model_attribute_getter(field_name)
+            # Read the value annotated by @display(annotate=...)
+            annotation_name = getattr(get_display_attr(field_name, model, model_admin), "annotation_name", None)
+            if annotation_name is not None:
+                getter = _annotated_getter(annotation_name, getter)
+            to_repr = _display_value
+        else:
+            getter = attrgetter(field_name)
+            to_repr = str if field.is_relation else None
+
+        # If there are choices display the choice description string instead of the value
+        try:
+            choices = getattr(opts.get_field(field_name), "flatchoices", None)
+        except FieldDoesNotExist:
+            choices = None
+        if choices:
+            to_repr = dict(choices).get
+
+        plan.append((field_name, getter, to_repr))
+
+    return tuple(plan)
+
+
+def get_cell_values(column_plan, result, empty_value_display):
+    """
+    Return the list of the display values of the columns of `column_plan`,
+    as returned by `compile_column_plan`, for `result`. Null values and
+    missing related objects are displayed as `empty_value_display`.
+    """
+    values = []
+    for field_name, getter, to_repr in column_plan:
+        try:
+            value = getter(result)
+        except ObjectDoesNotExist:
+            values.append(empty_value_display)
+            continue
+
+        # If the value is null set the cell to empty_value_display
+        if value is None:
+            values.append(empty_value_display)
+        elif to_repr is None:
+            values.append(value)
+        else:
+            values.append(to_repr(value))
+    return values
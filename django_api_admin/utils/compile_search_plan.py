@@ -0,0 +1,68 @@
+from django.db import models
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models.constants import LOOKUP_SEP
+
+from django_api_admin.utils.lookup_spawns_duplicates import lookup_spawns_duplicates
+
+
+def _construct_search(opts, field_name):
+    """
+    Return a tuple of (lookup, field_to_validate).
+
+    field_to_validate is set for non-text exact lookups so that
+    invalid search terms can be skipped (preserving index usage).
+    """
+    if field_name.startswith("^"):
+        return "%s__istartswith" % field_name.removeprefix("^"), None
+    elif field_name.startswith("="):
+        return "%s__iexact" % field_name.removeprefix("="), None
+    elif field_name.startswith("@"):
+        return "%s__search" % field_name.removeprefix("@"), None
+    # Use field_name if it includes a lookup.
+    lookup_fields = field_name.split(LOOKUP_SEP)
+    # Go through the fields, following all relations.
+    prev_field = None
+    for path_part in lookup_fields:
+        if path_part == "pk":
+            path_part = opts.pk.name
+        try:
+            field = opts.get_field(path_part)
+        except FieldDoesNotExist:
+            # Use valid query lookups.
+            if prev_field and prev_field.get_lookup(path_part):
+                if path_part == "exact" and not isinstance(prev_field, (models.CharField, models.TextField)):
+                    # Use prev_field to validate the search term.
+                    return field_name, prev_field
+                return field_name, None
+        else:
+            prev_field = field
+            if hasattr(field, "path_infos"):
+                # Update opts to follow the relation.
+                opts = field.path_infos[-1].to_opts
+    # Otherwise, use the field with icontains.
+    return "%s__icontains" % field_name, None
+
+
+def compile_search_plan(model, search_fields):
+    """
+    Resolve the ORM lookups of `search_fields` once, instead of for every
+    search. Return a tuple of (lookups, may_have_duplicates) where lookups
+    is a tuple of (lookup, to_python) and to_python, when not None, converts
+    a search term to the value of an exact lookup on a non-text field,
+    raising ValidationError for terms that aren't valid for the field.
+    """
+    opts = model._meta
+    lookups = []
+
+    for search_field in search_fields:
+        lookup, validate_field = _construct_search(opts, str(search_field))
+        if validate_field is None:
+            to_python = None
+        else:
+            formfield = validate_field.formfield()
+            # Fields like AutoField lack a form field.
+            to_python = validate_field.to_python if formfield is None else formfield.to_python
+        lookups.append((lookup, to_python))
+
+    may_have_duplicates = any(lookup_spawns_duplicates(opts, lookup) for lookup, _ in lookups)
+    return tuple(lookups), may_have_duplicates
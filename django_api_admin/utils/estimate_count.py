@@ -0,0 +1,42 @@
+import json
+
+from django.db import DatabaseError, connections, transaction
+
+
+def estimate_count(queryset):
+    """
+    Return the query planner's estimate of the number of rows in ``queryset``,
+    or None if the database can't provide one.
+
+    PostgreSQL uses ``pg_class.reltuples`` for unfiltered querysets and the
+    ``EXPLAIN`` row estimate otherwise. SQLite uses ``sqlite_stat1``, which is
+    only populated after ``ANALYZE`` and only describes whole tables.
+    """
+    query = queryset.query
+    connection = connections[queryset.db]
+    unfiltered = not query.where and not query.distinct and query.combinator is None
+    db_table = queryset.model._meta.db_table
+
+    try:
+        # Run inside a savepoint so a failure doesn't break an outer transaction.
+        with transaction.atomic(using=queryset.db):
+            if connection.vendor == "postgresql":
+                if unfiltered:
+                    with connection.cursor() as cursor:
+                        cursor.execute("SELECT reltuples FROM pg_class WHERE oid = %s::regclass", [db_table])
+                        row = cursor.fetchone()
+                    # reltuples is -1 for tables that were never vacuumed or analyzed.
+                    return int(row[0]) if row and row[0] >= 0 else None
+                plan = json.loads(queryset.explain(format="json"))
+                return int(plan[0]["Plan"]["Plan Rows"])
+            elif connection.vendor == "sqlite" and unfiltered:
+                with connection.cursor() as cursor:
+                    cursor.execute("SELECT stat FROM sqlite_stat1 WHERE tbl = %s", [db_table])
+                    row = cursor.fetchone()
+                # The first number of each stat is the number of rows in the table.
+                return int(row[0].split()[0]) if row else None
+    except (DatabaseError, KeyError, IndexError, TypeError, ValueError):
+        # sqlite_stat1 doesn't exist until ANALYZE runs, and EXPLAIN output
+        # may not have the expected shape.
+        return None
+    return None
@@ -1,3 +1,5 @@
+from django.core.exceptions import FieldDoesNotExist
+
 from rest_framework import relations
 
 
@@ -28,14 +30,37 @@ def get_changed_data(serializer):
         if field_name in validated_data:
             model_attr = field.source or field_name
             new_value = validated_data[field_name]
-            old_value = getattr(instance, model_attr, None)
+            foreign_key = get_foreign_key(instance, model_attr) if isinstance(field, relations.RelatedField) else None
 
-            if does_not_equal(field, old_value, new_value):
-                changed_fields.append(field_name)
+            if foreign_key is not None:
+                # Compare the raw values, so the current related object isn't fetched.
+                old_value = getattr(instance, foreign_key.attname)
+                if new_value is not None:
+                    new_value = getattr(new_value, foreign_key.target_field.attname)
+                if old_value != new_value:
+                    changed_fields.append(field_name)
+            else:
+                old_value = getattr(instance, model_attr, None)
+                if does_not_equal(field, old_value, new_value):
+                    changed_fields.append(field_name)
 
     return changed_fields
 
 
+def get_foreign_key(instance, model_attr):
+    """
+    Return the concrete foreign key or one-to-one field of ``instance``
+    named ``model_attr``, or None.
+    """
+    try:
+        field = instance._meta.get_field(model_attr)
+    except FieldDoesNotExist:
+        return None
+    if field.concrete and (field.many_to_one or field.one_to_one):
+        return field
+    return None
+
+
 def does_not_equal(field, old_value, new_value):
     many = False
 
@@ -5,17 +5,27 @@
 # Licensed under the BSD 3-Clause License.
 # -----------------------------------------------------------------------------
 
+from itertools import islice
+
 from django.db import router
 from django_api_admin.utils.nested_objects import NestedObjects
 
+# The maximum number of protected objects listed by a summary.
+SUMMARY_PROTECTED_LIMIT = 100
+
 
-def get_deleted_objects(objs, request, admin_site):
+def get_deleted_objects(objs, request, admin_site, summary=False):
     """
     Find all objects related to ``objs`` that should also be deleted. ``objs``
     must be a homogeneous iterable of objects (e.g. a QuerySet).
 
     Return a nested list of strings suitable for display in the
     template with the ``unordered_list`` filter.
+
+    With ``summary=True`` the nested list is empty, the related objects are
+    counted with aggregate queries where possible, the permissions are
+    checked per model and at most ``SUMMARY_PROTECTED_LIMIT`` protected
+    objects are returned.
     """
     try:
         obj = objs[0]
@@ -23,18 +33,19 @@ def get_deleted_objects(objs, request, admin_site):
         return [], {}, set(), []
     else:
         using = router.db_for_write(obj._meta.model)
-    collector = NestedObjects(using=using, origin=objs)
+    collector = NestedObjects(using=using, origin=objs, summary=summary)
     collector.collect(objs)
     perms_needed = set()
 
+    def check_permission(model):
+        if model in admin_site._registry:
+            if not admin_site._registry[model].has_delete_permission(request):
+                perms_needed.add(model._meta.verbose_name)
+
     def format_callback(obj):
         model = obj.__class__
         has_admin = model in admin_site._registry
-        opts = obj._meta
-
-        if has_admin:
-            if not admin_site._registry[model].has_delete_permission(request):
-                perms_needed.add(opts.verbose_name)
+        check_permission(model)
 
         return {
             "model": model._meta.model_name,
@@ -43,9 +54,15 @@ def get_deleted_objects(objs, request, admin_site):
             "has_admin": has_admin,
         }
 
-    to_delete = collector.nested(format_callback)
-
-    protected = [format_callback(obj) for obj in collector.protected]
-    model_count = {model._meta.verbose_name_plural: len(objs) for model, objs in collector.model_objs.items()}
+    model_count = collector.get_model_count()
+    if summary:
+        to_delete = []
+        for model in model_count:
+            check_permission(model)
+        protected = [format_callback(obj) for obj in islice(collector.protected, SUMMARY_PROTECTED_LIMIT)]
+    else:
+        to_delete = collector.nested(format_callback)
+        protected = [format_callback(obj) for obj in collector.protected]
+    model_count = {model._meta.verbose_name_plural: count for model, count in model_count.items()}
 
     return to_delete, model_count, perms_needed, protected
@@ -0,0 +1,31 @@
+from django.core.exceptions import FieldDoesNotExist
+
+from django_api_admin.utils._get_non_gfk_field import _get_non_gfk_field
+from django_api_admin.exceptions import FieldIsAForeignKeyColumnName
+
+
+def get_display_attr(name, model, model_admin=None):
+    """
+    Return the function that displays the `list_display` item `name`, a
+    callable, a `model_admin` method or a model method or property, resolved
+    the same way `lookup_field` resolves it. The attributes set by the
+    `@display` decorator can be read from it. Return None if `name` is a
+    model field or if it doesn't resolve to a function.
+    """
+    try:
+        _get_non_gfk_field(model._meta, name)
+        return None
+    except FieldIsAForeignKeyColumnName:
+        return None
+    except FieldDoesNotExist:
+        pass
+
+    if callable(name):
+        attr = name
+    elif hasattr(model_admin, name) and name != "__str__":
+        attr = getattr(model_admin, name)
+    else:
+        attr = getattr(model, name, None)
+    if isinstance(attr, property):
+        attr = attr.fget
+    return attr if callable(attr) else None
@@ -7,6 +7,7 @@
 
 from django.core.exceptions import FieldDoesNotExist
 from django_api_admin.utils._get_non_gfk_field import _get_non_gfk_field
+from django_api_admin.utils.get_display_attr import get_display_attr
 from django_api_admin.exceptions import FieldIsAForeignKeyColumnName
 
 
@@ -17,7 +18,13 @@ def lookup_field(name, obj, model_admin=None):
     except (FieldDoesNotExist, FieldIsAForeignKeyColumnName):
         # For non-field values, the value is either a method, property or
         # returned via a callable.
-        if callable(name):
+        display_attr = get_display_attr(name, obj.__class__, model_admin)
+        annotation_name = getattr(display_attr, "annotation_name", None)
+        if annotation_name is not None and hasattr(obj, annotation_name):
+            # The queryset was annotated by @display(annotate=...)
+            attr = display_attr
+            value = getattr(obj, annotation_name)
+        elif callable(name):
             attr = name
             value = attr(obj)
         elif hasattr(model_admin, name) and name != "__str__":
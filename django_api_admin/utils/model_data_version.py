@@ -0,0 +1,31 @@
+from uuid import uuid4
+
+from django.core.cache import caches
+
+DATA_VERSION_CACHE_ALIAS = "default"
+
+
+def get_model_data_version_key(model):
+    # Proxy models share the version of the model they proxy.
+    return "django_api_admin.data_version.%s" % model._meta.concrete_model._meta.label_lower
+
+
+def get_model_data_version(model):
+    """
+    Return a token that changes whenever objects of `model` are written
+    through the admin or saved and deleted with signals enabled. Caches
+    derived from the model's data include it to tell stale entries apart.
+    """
+    cache = caches[DATA_VERSION_CACHE_ALIAS]
+    key = get_model_data_version_key(model)
+    version = cache.get(key)
+    if version is None:
+        # A random token is used instead of a counter so that a version
+        # evicted from the cache can't be recreated with an old value.
+        cache.add(key, uuid4().hex, None)
+        version = cache.get(key)
+    return version
+
+
+def bump_model_data_version(model):
+    caches[DATA_VERSION_CACHE_ALIAS].delete(get_model_data_version_key(model))
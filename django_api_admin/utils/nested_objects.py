@@ -12,8 +12,18 @@ from django.db.models.deletion import Collector
 
 
 class NestedObjects(Collector):
-    def __init__(self, *args, **kwargs):
+    """
+    Collect the objects to delete and the graph of their relations. With
+    ``summary=True`` the graph isn't built, and the related objects that the
+    deletion doesn't cascade from are counted with aggregate queries instead
+    of being fetched, see get_model_count(); such a collector skips the
+    signals of the models, so it must not be used to delete the objects.
+    """
+
+    def __init__(self, *args, summary=False, **kwargs):
         super().__init__(*args, **kwargs)
+        self.summary = summary
+        self.fast_delete_fields = []
         self.edges = {}  # {from_instance: [to_instances]}
         self.protected = set()
         self.model_objs = defaultdict(set)
@@ -22,7 +32,7 @@ class NestedObjects(Collector):
         self.edges.setdefault(source, []).append(target)
 
     def collect(self, objs, source=None, source_attr=None, **kwargs):
-        for obj in objs:
+        for obj in () if self.summary else objs:
             if source_attr and not source_attr.endswith("+"):
                 related_name = source_attr % {
                     "class": source._meta.model_name,
@@ -32,17 +42,47 @@ class NestedObjects(Collector):
             else:
                 self.add_edge(None, obj)
             self.model_objs[obj._meta.model].add(obj)
+        fast_delete_fields, self.fast_delete_fields = self.fast_delete_fields, []
         try:
             return super().collect(objs, source_attr=source_attr, **kwargs)
         except models.ProtectedError as e:
             self.protected.update(e.protected_objects)
+            # Collector.collect() raises before it adds the related objects
+            # that can be fast-deleted, they still have to be counted. Like
+            # collect(), the fields of a model are looked up with a single
+            # query so that rows referencing objs through several of them
+            # are counted once.
+            model_fields = defaultdict(list)
+            for field in self.fast_delete_fields:
+                model_fields[field.model].append(field)
+            for model, fields in model_fields.items():
+                self.fast_deletes.append(self.related_objects(model, fields, objs))
         except models.RestrictedError as e:
             self.protected.update(e.restricted_objects)
+        finally:
+            self.fast_delete_fields = fast_delete_fields
 
     def related_objects(self, related_model, related_fields, objs):
         qs = super().related_objects(related_model, related_fields, objs)
+        if self.summary:
+            return qs
         return qs.select_related(*[related_field.name for related_field in related_fields])
 
+    def get_model_count(self):
+        """
+        Return a dictionary mapping the collected models to the number of
+        their objects to delete.
+        """
+        if not self.summary:
+            return {model: len(objs) for model, objs in self.model_objs.items()}
+
+        model_count = defaultdict(int)
+        for model, instances in self.data.items():
+            model_count[model] += len(instances)
+        for qs in self.fast_deletes:
+            model_count[qs.model] += qs.count()
+        return {model: count for model, count in model_count.items() if count}
+
     def _nested(self, obj, seen, format_callback):
         if obj in seen:
             return []
@@ -68,9 +108,21 @@ class NestedObjects(Collector):
             roots.extend(self._nested(root, seen, format_callback))
         return roots
 
-    def can_fast_delete(self, *args, **kwargs):
+    def can_fast_delete(self, objs, from_field=None):
         """
         We always want to load the objects into memory so that we can display
-        them to the user in confirm page.
+        them to the user in confirm page, unless only their number is needed.
         """
-        return False
+        if not self.summary:
+            return False
+        can_fast_delete = super().can_fast_delete(objs, from_field=from_field)
+        if can_fast_delete and from_field is not None:
+            self.fast_delete_fields.append(from_field)
+        return can_fast_delete
+
+    def _has_signal_listeners(self, model):
+        # Nothing is deleted when summarizing, so the signals of the models
+        # don't change which objects have to be fetched to be counted.
+        if self.summary:
+            return False
+        return super()._has_signal_listeners(model)
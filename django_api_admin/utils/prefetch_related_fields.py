@@ -0,0 +1,79 @@
+from collections.abc import Hashable
+
+from django.core.exceptions import ValidationError
+
+from rest_framework import relations
+
+
+class PrefetchedQuerySet:
+    """
+    Stand in for the queryset of a PrimaryKeyRelatedField, get(pk=...)
+    returns the objects of ``queryset`` with the primary keys ``pks``, which
+    are fetched with a single query.
+    """
+
+    def __init__(self, queryset, pks):
+        self.model = queryset.model
+        self.to_python = self.model._meta.pk.to_python
+        valid_pks = set()
+        for pk in pks:
+            try:
+                valid_pks.add(self.to_python(pk))
+            except ValidationError:
+                continue
+        self.objects = queryset.in_bulk(valid_pks)
+
+    def get(self, pk):
+        try:
+            pk = self.to_python(pk)
+        except ValidationError as e:
+            # Raise the same error as QuerySet.get() for invalid values.
+            raise ValueError(e.messages[0])
+        try:
+            return self.objects[pk]
+        except (KeyError, TypeError):
+            raise self.model.DoesNotExist
+
+
+def get_prefetchable_relation(field):
+    """
+    Return the PrimaryKeyRelatedField that validates the values of ``field``
+    (its child relation if it's a ManyRelatedField) if its queryset can be
+    prefetched, or None.
+    """
+    if field.read_only:
+        return None
+    if isinstance(field, relations.ManyRelatedField):
+        field = field.child_relation
+    if (
+        isinstance(field, relations.PrimaryKeyRelatedField)
+        and field.pk_field is None
+        and type(field).get_queryset is relations.RelatedField.get_queryset
+    ):
+        return field
+    return None
+
+
+def prefetch_related_fields(serializers):
+    """
+    Fetch the related objects that validating ``serializers``, instances of
+    the same serializer class with data, looks up with their primary key
+    related fields, with a query per field instead of a query per field and
+    serializer.
+    """
+    if not serializers:
+        return
+
+    for field_name, field in serializers[0].fields.items():
+        relation = get_prefetchable_relation(field)
+        if relation is None:
+            continue
+
+        pks = []
+        for serializer in serializers:
+            value = serializer.initial_data.get(field_name)
+            values = value if isinstance(value, list) else [value]
+            pks.extend(pk for pk in values if pk is not None and not isinstance(pk, bool) and isinstance(pk, Hashable))
+        queryset = PrefetchedQuerySet(relation.get_queryset(), pks)
+        for serializer in serializers:
+            get_prefetchable_relation(serializer.fields[field_name]).queryset = queryset
@@ -5,7 +5,7 @@
 # Licensed under the BSD 3-Clause License.
 # -----------------------------------------------------------------------------
 
-from django_api_admin.utils import get_model_from_relation
+from django_api_admin.utils.get_model_from_relation import get_model_from_relation
 from django_api_admin.exceptions import NotRelationField
 from django.db.models.constants import LOOKUP_SEP
 
@@ -0,0 +1,106 @@
+from django.db.models.expressions import Col
+from django.db.models.fields.reverse_related import ForeignObjectRel
+from django.db.models.sql.datastructures import Join
+from django.db.models.sql.where import AND, WhereNode
+
+
+def get_multivalued_aliases(query):
+    """
+    Return the aliases of the joins of ``query`` that span multi-valued
+    relations (reverse foreign keys, many-to-many and generic relations), and
+    of the joins that follow them.
+    """
+    aliases = set()
+    # Joins are set up in the order of their lookup path, parents come first.
+    for alias, join in query.alias_map.items():
+        if not isinstance(join, Join):
+            continue
+        join_field = join.join_field
+        if join.parent_alias in aliases or (isinstance(join_field, ForeignObjectRel) and join_field.multiple):
+            aliases.add(alias)
+    return aliases
+
+
+def get_expression_aliases(expressions):
+    """
+    Return the set of the aliases the columns of ``expressions`` refer to, or
+    None if they can't be known (i.e raw SQL conditions).
+    """
+    aliases = set()
+    for expression in expressions:
+        if isinstance(expression, WhereNode):
+            children_aliases = get_expression_aliases(expression.children)
+            if children_aliases is None:
+                return None
+            aliases |= children_aliases
+        elif hasattr(expression, "flatten"):
+            aliases.update(node.alias for node in expression.flatten() if isinstance(node, Col))
+        else:
+            return None
+    return aliases
+
+
+def split_multivalued_conditions(queryset):
+    """
+    Split the conditions of ``queryset`` in the ones that span multi-valued
+    relations, which spawn duplicate rows, and the others. Return a tuple of
+    (queryset, multivalued_queryset), copies of ``queryset`` filtered by each
+    group of conditions that only join the tables they need. The second item
+    is None if no condition spans a multi-valued relation.
+
+    Return None if the conditions can't be split, i.e they're ORed at the top
+    level or use raw SQL.
+    """
+    query = queryset.query
+    where = query.where
+    if where.connector != AND or where.negated or query.extra or query.combinator:
+        return None
+
+    multivalued_aliases = get_multivalued_aliases(query)
+    conditions, multivalued_conditions = [], []
+    for condition in where.children:
+        aliases = get_expression_aliases([condition])
+        if aliases is None:
+            return None
+        if aliases & multivalued_aliases:
+            multivalued_conditions.append(condition)
+        else:
+            conditions.append(condition)
+    if not multivalued_conditions:
+        return queryset, None
+
+    # The joins the selected columns and annotations need are always kept.
+    # Aliased annotations only need their joins where they're ordered by.
+    expressions = [*query.select, *query.annotation_select.values()]
+    expressions.extend(
+        annotation
+        for name, annotation in query.annotations.items()
+        if name not in query.annotation_select and any(str(field).lstrip("-") == name for field in query.order_by)
+    )
+    if isinstance(query.group_by, tuple):
+        expressions.extend(query.group_by)
+    selected_aliases = get_expression_aliases(expressions)
+    if selected_aliases is None:
+        return None
+    return (
+        _filter_conditions(queryset, conditions, selected_aliases),
+        _filter_conditions(queryset, multivalued_conditions, selected_aliases),
+    )
+
+
+def _filter_conditions(queryset, conditions, aliases):
+    queryset = queryset.all()
+    query = queryset.query
+    query.where = WhereNode(conditions, connector=AND)
+    aliases = aliases | get_expression_aliases(conditions)
+    # Keep the joins leading to the tables the columns refer to.
+    needed_aliases = set()
+    for alias in aliases:
+        while alias is not None and alias not in needed_aliases:
+            needed_aliases.add(alias)
+            alias = getattr(query.alias_map.get(alias), "parent_alias", None)
+    # Unreferenced joins are left out of the FROM clause.
+    for alias, join in query.alias_map.items():
+        if isinstance(join, Join) and alias not in needed_aliases:
+            query.alias_refcount[alias] = 0
+    return queryset
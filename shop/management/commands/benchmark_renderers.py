@@ -0,0 +1,61 @@
+import timeit
+
+from django.core.management.base import BaseCommand
+from django.contrib.auth import get_user_model
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIRequestFactory
+
+from django_api_admin.admin_views.model_admin_views.changelist import ChangelistView
+from django_api_admin.renderers import MessagePackRenderer, ORJSONRenderer, msgpack, orjson
+
+from shop.admin import site
+from shop.models import Product
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = "Compare the admin renderers on the product changelist and form description"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--per-page", type=int, default=500, help="Number of changelist rows to render.")
+        parser.add_argument("--number", type=int, default=20, help="Number of times each renderer renders the data.")
+
+    def handle(self, *args, **options):
+        model_admin = site._registry[Product]
+        request = APIRequestFactory().get("/", {"pp": options["per_page"]})
+        request.user = User.objects.filter(is_superuser=True).first()
+        if request.user is None:
+            self.stderr.write("Run populate_db first, there is no superuser.")
+            return
+
+        view = ChangelistView(model_admin=model_admin, admin_site=site)
+        request = view.initialize_request(request)
+        cl = model_admin.get_changelist_instance(request)
+        data = {
+            "changelist": {
+                "columns": view.get_columns(request, cl),
+                "config": view.get_config(request, cl),
+                "rows": view.get_rows(request, cl),
+            },
+            "form_description": model_admin.get_form_description(request),
+        }
+
+        renderers = [JSONRenderer()]
+        if orjson is not None:
+            renderers.append(ORJSONRenderer())
+        else:
+            self.stdout.write("orjson isn't installed, skipping ORJSONRenderer.")
+        if msgpack is not None:
+            renderers.append(MessagePackRenderer())
+        else:
+            self.stdout.write("msgpack isn't installed, skipping MessagePackRenderer.")
+
+        self.stdout.write("Rendering %d rows %d times..." % (len(data["changelist"]["rows"]), options["number"]))
+        for renderer in renderers:
+            size = len(renderer.render(data))
+            seconds = timeit.timeit(lambda: renderer.render(data), number=options["number"])
+            self.stdout.write(
+                "%-20s %8.2f ms/render %10d bytes" % (renderer.__class__.__name__, seconds * 1000 / options["number"], size)
+            )
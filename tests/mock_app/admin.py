@@ -100,7 +100,7 @@ class ProductAdmin(APIModelAdmin):
 
     show_facets = ShowFacets.ALWAYS
 
-    @display(description="Average Rating")
+    @display(description="Average Rating", annotate=models.Avg("reviews__rating"))
     def average_rating(self, obj, context=None) -> float:
         ratings = obj.reviews.values_list("rating", flat=True)
         return sum(ratings) / len(ratings) if ratings else None
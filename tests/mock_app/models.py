@@ -54,6 +54,7 @@ class Product(models.Model):
     description = models.TextField()
     related_products = models.ManyToManyField("self", blank=True)
     date_created = models.DateTimeField(auto_now_add=True)
+    date_updated = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return self.name
@@ -10,24 +10,43 @@
 # This file includes both Django code and your my own contributions.
 # -----------------------------------------------------------------------------
 
+import gc
 import json
-from datetime import datetime
-
+import threading
+import weakref
+from datetime import datetime, timedelta
+from decimal import Decimal
+from unittest import mock, skipUnless
+
+from django.core.cache import caches
+from django.core.management import call_command
+from django.db import DatabaseError, connection
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.test.utils import CaptureQueriesContext
 from django.urls import path
 from django.contrib.auth import get_user_model
 from django.urls import reverse
 from django.contrib.contenttypes.models import ContentType
+from django.utils.translation import gettext_lazy as _
 
 from rest_framework.test import APITestCase, URLPatternsTestCase, APIRequestFactory
 from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
 
 from django_api_admin import APIModelAdmin, site
 from django_api_admin.admins.model_admin import TO_FIELD_VAR
-from django_api_admin.models import LogEntry
-
-from .models import Product, Trademark, Category, Review, Customer, Contract
+from django_api_admin.bulk import ChangelistBulkOperation, InlineBulkOperation
+from django_api_admin.filters import AllValuesFieldListFilter, ChoicesFieldListFilter, RelatedFieldListFilter, SimpleListFilter
+from django_api_admin import jobs
+from django_api_admin.models import ActionJob, LogEntry
+from django_api_admin.utils.bulk_set_m2m import bulk_set_m2m, can_bulk_set_m2m
+from django_api_admin.utils.model_data_version import get_model_data_version
+from django_api_admin.renderers import MessagePackRenderer, ORJSONRenderer, msgpack, orjson
+
+from .models import Product, Trademark, Category, Review, Customer, Contract, Order, Location
+from .actions import apply_ten_percent_discount
 from .views import ProductDetailView
-from .admin import ProductAdmin
+from .admin import ProductAdmin, ReviewInline
 
 UserModel = get_user_model()
 renderer = JSONRenderer()
@@ -281,12 +300,118 @@ class ModelAdminTestCase(APITestCase, URLPatternsTestCase):
         response = self.client.post(url, data=action_dict)
         self.assertEqual(response.status_code, 200)
 
+    def test_delete_selected_in_chunks(self):
+        url = reverse("api_admin:%s_%s_changelist" % self.product_info)
+        action_dict = {"action": "delete_selected", "selected_ids": [], "select_across": True}
+        # Only the last product is protected.
+        self.product_contract_1.product = self.jordan_product
+        self.product_contract_1.save()
+        pks = list(Product.objects.order_by("pk").values_list("pk", flat=True))
+        self.assertEqual(pks[-1], self.jordan_product.pk)
+        reviews = Review.objects.exclude(product=self.jordan_product).count()
+
+        with mock.patch.object(site._registry[Product], "delete_selected_chunk_size", 2):
+            response = self.client.post(url, data=action_dict)
+        self.assertEqual(response.status_code, 409)
+        # The message is counted from the protected chunk.
+        self.assertEqual(response.data["detail"], "Cannot delete product because they have protected related objects.")
+        summary = response.data["data"]
+        self.assertEqual(summary["deleted"], len(pks) - 1)
+        self.assertEqual(summary["model_count"]["products"], len(pks) - 1)
+        self.assertEqual(summary["model_count"]["reviews"], reviews)
+        self.assertEqual(summary["protected"][0]["model"], "contract")
+        self.assertEqual(list(Product.objects.values_list("pk", flat=True)), [self.jordan_product.pk])
+        self.assertEqual(
+            LogEntry.objects.filter(action_flag=3, content_type=ContentType.objects.get_for_model(Product)).count(),
+            len(pks) - 1,
+        )
+
+        # The chunks are deleted with a bounded number of queries.
+        self.product_contract_1.delete()
+        products = [
+            Product(
+                name="Product %d" % i,
+                price=10,
+                stock_status="in_stock",
+                trademark=self.nike_trademark,
+                category=self.footwear_category,
+            )
+            for i in range(8)
+        ]
+        Product.objects.bulk_create(products)
+        with (
+            mock.patch.object(site._registry[Product], "delete_selected_chunk_size", 3),
+            CaptureQueriesContext(connection) as queries,
+        ):
+            response = self.client.post(url, data=action_dict)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["data"]["deleted"], 9)
+        self.assertEqual(response.data["data"]["protected"], [])
+        self.assertFalse(Product.objects.exists())
+        chunk_queries = [query for query in queries if 'ORDER BY "mock_app_product"."id"' in query["sql"]]
+        self.assertEqual(len(chunk_queries), 4)
+
+        # A chunk that fails is rolled back and reported, the others stay deleted.
+        Product.objects.bulk_create(products)
+        pks = list(Product.objects.order_by("pk").values_list("pk", flat=True))
+        product_admin = site._registry[Product]
+        delete_queryset = product_admin.delete_queryset
+        deletions = LogEntry.objects.filter(action_flag=3).count()
+
+        def fail_second_chunk(request, queryset):
+            if pks[2] in {obj.pk for obj in queryset}:
+                raise DatabaseError("The database is busy.")
+            delete_queryset(request, queryset)
+
+        with (
+            mock.patch.object(product_admin, "delete_selected_chunk_size", 2),
+            mock.patch.object(product_admin, "delete_queryset", side_effect=fail_second_chunk),
+            self.assertLogs("django_api_admin.actions", "ERROR"),
+        ):
+            response = self.client.post(url, data=action_dict)
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(response.data["detail"], "Deleted 6 products, failed to delete 2 products.")
+        self.assertEqual(response.data["data"]["deleted"], 6)
+        self.assertEqual(response.data["data"]["failed"], [{"start": 2, "stop": 4, "message": "The database is busy."}])
+        self.assertEqual(list(Product.objects.order_by("pk").values_list("pk", flat=True)), pks[2:4])
+        # The deletion of the failed chunk isn't logged.
+        self.assertEqual(LogEntry.objects.filter(action_flag=3).count(), deletions + 6)
+
     def test_performing_actions_with_select_across(self):
         action_dict = {"action": "apply_ten_percent_discount", "selected_ids": [], "select_across": True}
         url = reverse("api_admin:%s_%s_changelist" % self.product_info)
         response = self.client.post(url, data=action_dict)
         self.assertEqual(response.status_code, 200)
 
+    def test_action_selected_ids_validation(self):
+        url = reverse("api_admin:%s_%s_changelist" % self.product_info)
+        response = self.client.get(url)
+        selected_ids = next(f for f in response.data["data"]["action_form"] if f["name"] == "selected_ids")
+        self.assertEqual(selected_ids["type"], "SelectedIdsField")
+        self.assertEqual(selected_ids["attrs"]["pk_type"], "IntegerField")
+        self.assertEqual(selected_ids["attrs"]["max_length"], 1000)
+        self.assertNotIn("choices", selected_ids["attrs"])
+
+        # Unknown primary keys are rejected.
+        missing_pk = Product.objects.order_by("-pk").first().pk + 1
+        action_dict = {"action": "mark_out_of_stock", "selected_ids": [1, missing_pk], "select_across": False}
+        response = self.client.post(url, data=action_dict)
+        self.assertEqual(response.status_code, 400)
+
+        # So is selecting more than actions_max_selected items.
+        with mock.patch.object(site._registry[Product], "actions_max_selected", 1):
+            action_dict = {"action": "mark_out_of_stock", "selected_ids": [1, 2], "select_across": False}
+            response = self.client.post(url, data=action_dict)
+        self.assertEqual(response.status_code, 400)
+
+    def test_check_actions_max_selected(self):
+        self.assertEqual(ProductAdmin(Product, site).check(), [])
+        for value in (True, False, 0, -1, 1.5, "10"):
+            with self.subTest(value=value), mock.patch.object(ProductAdmin, "actions_max_selected", value, create=True):
+                errors = ProductAdmin(Product, site).check()
+                self.assertEqual([error.id for error in errors], ["api_admin.E133"])
+                self.assertEqual(errors[0].msg, "The value of 'actions_max_selected' must be a positive integer.")
+
     def test_performing_invalid_actions(self):
         action_dict = {
             "action": "some_weird_action",
@@ -296,6 +421,229 @@ class ModelAdminTestCase(APITestCase, URLPatternsTestCase):
         response = self.client.post(url, data=action_dict)
         self.assertEqual(response.status_code, 400)
 
+    def test_background_actions(self):
+        url = reverse("api_admin:%s_%s_changelist" % self.product_info)
+        product_admin = site._registry[Product]
+        total = Product.objects.count()
+        action_dict = {"action": "apply_ten_percent_discount", "selected_ids": [], "select_across": True}
+        with (
+            mock.patch.object(apply_ten_percent_discount, "background", True, create=True),
+            mock.patch.object(site, "action_job_workers", 0),
+            mock.patch.object(product_admin, "actions_chunk_size", 2),
+        ):
+            response = self.client.get(url)
+            self.assertEqual(response.data["data"]["config"]["background_actions"], ["apply_ten_percent_discount"])
+
+            # The action is queued instead of being run by the request.
+            response = self.client.post(url, data=action_dict)
+            self.assertEqual(response.status_code, 202)
+            job_id, job_url = response.data["data"]["job_id"], response.data["data"]["url"]
+            self.assertEqual(job_url, reverse("api_admin:action_job", kwargs={"job_id": job_id}))
+            self.assertFalse(Product.objects.filter(discount=Decimal("10.00")).exists())
+            response = self.client.get(job_url)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.data["data"]["status"], "queued")
+            self.assertEqual(response.data["data"]["total"], total)
+            # The job keeps the selection instead of the primary keys of the objects.
+            job = ActionJob.objects.get(pk=job_id)
+            self.assertTrue(job.select_across)
+            self.assertEqual(job.selected_ids, [])
+            self.assertEqual(job.max_pk, Product.objects.order_by("pk").last().pk)
+
+            # The objects added after the job was queued aren't selected.
+            added_product = Product.objects.create(
+                name="Samba",
+                price=90,
+                stock_status="in_stock",
+                trademark=self.adidas_trademark,
+                category=self.footwear_category,
+            )
+            call_command("run_action_jobs", "--once", verbosity=0)
+
+        self.assertEqual(Product.objects.filter(discount=Decimal("10.00")).count(), total)
+        added_product.refresh_from_db()
+        self.assertEqual(added_product.discount, 0)
+        added_product.delete()
+        response = self.client.get(job_url)
+        self.assertEqual(response.data["data"]["status"], "succeeded")
+        self.assertEqual(response.data["data"]["processed"], total)
+        self.assertEqual(response.data["data"]["succeeded"], total)
+        self.assertEqual(response.data["data"]["failed"], 0)
+        self.assertEqual(response.data["data"]["errors"], [])
+        entry = LogEntry.objects.get(object_repr__startswith="apply_ten_percent_discount")
+        self.assertEqual(
+            entry.get_change_message(), "Ran the action “apply_ten_percent_discount” on %d of %d objects." % (total, total)
+        )
+
+        # The jobs of other users aren't visible.
+        other_user = UserModel.objects.create_user(username="staff", is_staff=True)
+        self.client.force_authenticate(user=other_user)
+        self.assertEqual(self.client.get(job_url).status_code, 404)
+        self.client.force_authenticate(user=self.user)
+
+        # The chunks that fail are rolled back and recorded in the job.
+        with (
+            mock.patch.object(apply_ten_percent_discount, "background", True, create=True),
+            mock.patch.object(site, "action_job_workers", 0),
+            mock.patch.object(product_admin, "actions_chunk_size", 2),
+        ):
+            response = self.client.post(url, data=action_dict)
+            job_url = response.data["data"]["url"]
+            with (
+                mock.patch.object(Product, "save", side_effect=ValueError("Out of discounts")),
+                self.assertLogs("django_api_admin.jobs", "ERROR"),
+            ):
+                call_command("run_action_jobs", "--once", verbosity=0)
+
+        response = self.client.get(job_url)
+        self.assertEqual(response.data["data"]["status"], "failed")
+        self.assertEqual(response.data["data"]["processed"], total)
+        self.assertEqual(response.data["data"]["succeeded"], 0)
+        self.assertEqual(response.data["data"]["failed"], total)
+        self.assertEqual(response.data["data"]["errors"][0], {"start": 0, "stop": 2, "message": "Out of discounts"})
+
+        # The chunks the action responds to with an error are failures too.
+        first_pk = Product.objects.order_by("pk").first().pk
+
+        def refuse_first_chunk(modeladmin, request, queryset):
+            if queryset.filter(pk=first_pk).exists():
+                queryset.update(discount=Decimal("50.00"))
+                return Response({"detail": "Not allowed."}, status=409)
+            return apply_ten_percent_discount(modeladmin, request, queryset)
+
+        with (
+            mock.patch.object(apply_ten_percent_discount, "background", True, create=True),
+            mock.patch.object(site, "action_job_workers", 0),
+            mock.patch.object(product_admin, "actions_chunk_size", 2),
+        ):
+            response = self.client.post(url, data=action_dict)
+            job_id = response.data["data"]["job_id"]
+            actions = {"apply_ten_percent_discount": (refuse_first_chunk, "apply_ten_percent_discount", "")}
+            with mock.patch.object(product_admin, "get_actions", return_value=actions):
+                call_command("run_action_jobs", "--once", verbosity=0)
+
+        job = ActionJob.objects.get(pk=job_id)
+        self.assertEqual((job.status, job.processed, job.succeeded, job.failed), ("failed", total, total - 2, 2))
+        self.assertEqual(job.errors, [{"start": 0, "stop": 2, "message": "Not allowed."}])
+        # The changes of the failed chunk are rolled back.
+        self.assertFalse(Product.objects.filter(discount=Decimal("50.00")).exists())
+        entry = LogEntry.objects.filter(object_repr__startswith="apply_ten_percent_discount").order_by("pk").last()
+        self.assertEqual(
+            entry.get_change_message(),
+            "Ran the action “apply_ten_percent_discount” on %d of %d objects. It failed on 2 objects. "
+            "Failed on objects 0 to 2: Not allowed." % (total - 2, total),
+        )
+
+    def test_background_actions_recovery(self):
+        url = reverse("api_admin:%s_%s_changelist" % self.product_info)
+        product_admin = site._registry[Product]
+        pks = list(Product.objects.order_by("pk").values_list("pk", flat=True))
+        action_dict = {"action": "apply_ten_percent_discount", "selected_ids": pks[1:], "select_across": False}
+        with (
+            mock.patch.object(apply_ten_percent_discount, "background", True, create=True),
+            mock.patch.object(site, "action_job_workers", 0),
+            mock.patch.object(product_admin, "actions_chunk_size", 2),
+        ):
+            response = self.client.post(url, data=action_dict, format="json")
+            job_id = response.data["data"]["job_id"]
+            self.assertEqual(ActionJob.objects.get(pk=job_id).selected_ids, pks[1:])
+
+            # A job whose worker died after its first chunk is queued again,
+            # and resumes after the last chunk it processed.
+            ActionJob.objects.filter(pk=job_id).update(
+                status="running",
+                processed=2,
+                succeeded=2,
+                last_pk=pks[2],
+                heartbeat_at=datetime.now() - timedelta(hours=1),
+            )
+            with self.assertLogs("django_api_admin.jobs", "WARNING"):
+                call_command("run_action_jobs", "--once", verbosity=0)
+            self.assertEqual(ActionJob.objects.get(pk=job_id).status, "succeeded")
+
+            # Running jobs that report their progress aren't queued again.
+            response = self.client.post(url, data=action_dict, format="json")
+            running_job_id = response.data["data"]["job_id"]
+            ActionJob.objects.filter(pk=running_job_id).update(status="running", heartbeat_at=datetime.now())
+            call_command("run_action_jobs", "--once", verbosity=0)
+            self.assertEqual(ActionJob.objects.get(pk=running_job_id).status, "running")
+
+        job = ActionJob.objects.get(pk=job_id)
+        self.assertEqual((job.processed, job.succeeded, job.failed), (len(pks) - 1, len(pks) - 1, 0))
+        discounted = set(Product.objects.filter(discount=Decimal("10.00")).values_list("pk", flat=True))
+        self.assertEqual(discounted, set(pks[3:]))
+
+    def test_background_actions_selection(self):
+        url = reverse("api_admin:%s_%s_changelist" % self.product_info)
+        action_dict = {"action": "apply_ten_percent_discount", "selected_ids": [], "select_across": True}
+        with (
+            mock.patch.object(apply_ten_percent_discount, "background", True, create=True),
+            mock.patch.object(site, "action_job_workers", 0),
+        ):
+            response = self.client.post(url + "?stock_status=in_stock", data=action_dict, format="json", secure=True)
+            job = ActionJob.objects.get(pk=response.data["data"]["job_id"])
+            self.assertEqual(job.total, 4)
+
+            # The request of the job has the host and scheme of the request that queued it.
+            request = jobs.get_job_request(job)
+            self.assertEqual(request.GET.getlist("stock_status"), ["in_stock"])
+            self.assertEqual(request.build_absolute_uri("/products/"), "https://testserver/products/")
+
+            # The selection is evaluated again when the job runs, the objects
+            # changed in the meantime are processed if they match it then.
+            self.air_max_product.stock_status = "out_of_stock"
+            self.air_max_product.save()
+            self.air_force_product.stock_status = "in_stock"
+            self.air_force_product.save()
+            call_command("run_action_jobs", "--once", verbosity=0)
+
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.processed), ("succeeded", 4))
+        discounted = set(Product.objects.filter(discount=Decimal("10.00")).values_list("pk", flat=True))
+        products = (self.stan_smith_product, self.air_force_product, self.timberland_product, self.jordan_product)
+        self.assertEqual(discounted, {product.pk for product in products})
+
+    def test_background_actions_threads(self):
+        url = reverse("api_admin:%s_%s_changelist" % self.product_info)
+        action_dict = {"action": "apply_ten_percent_discount", "selected_ids": [1], "select_across": False}
+        threads, done = [], threading.Event()
+
+        def run_job(job_id):
+            threads.append(threading.current_thread().name)
+
+        def run_pending_jobs(**kwargs):
+            done.set()
+
+        with (
+            mock.patch.object(apply_ten_percent_discount, "background", True, create=True),
+            mock.patch.object(site, "action_job_workers", 1),
+            mock.patch("django_api_admin.jobs.run_job", side_effect=run_job),
+            mock.patch("django_api_admin.jobs.run_pending_jobs", side_effect=run_pending_jobs) as pending_jobs,
+        ):
+            self.addCleanup(jobs._executors.pop, site, None)
+            # The job is submitted to the thread pool of the site once committed.
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client.post(url, data=action_dict, format="json")
+            self.assertEqual(response.status_code, 202)
+            self.assertTrue(done.wait(5))
+            executor = jobs.get_executor(site)
+            self.addCleanup(executor.shutdown)
+
+        self.assertEqual(len(threads), 1)
+        self.assertTrue(threads[0].startswith("django_api_admin.jobs.api_admin"))
+        # Then the queued jobs of the site are run, including the stale ones.
+        pending_jobs.assert_called_once_with(timeout=site.action_job_timeout, site_name=site.name)
+
+        # Each site has its own thread pool, of its own size.
+        other_site = mock.Mock(action_job_workers=3)
+        other_site.name = "other_api_admin"
+        self.addCleanup(jobs._executors.pop, other_site, None)
+        other_executor = jobs.get_executor(other_site)
+        self.addCleanup(other_executor.shutdown)
+        self.assertIsNot(other_executor, executor)
+        self.assertIs(jobs.get_executor(other_site), other_executor)
+        self.assertEqual(other_executor._max_workers, 3)
+
     def test_delete_view(self):
         url = reverse("api_admin:%s_%s_delete" % self.product_info, kwargs={"object_id": 4})
         response = self.client.delete(url)
@@ -309,6 +657,50 @@ class ModelAdminTestCase(APITestCase, URLPatternsTestCase):
         self.assertEqual(response.status_code, 409)
         self.assertEqual(response.data, {"status": 409})
 
+    def test_delete_view_preview(self):
+        url = reverse("api_admin:%s_%s_delete" % self.product_info, kwargs={"object_id": self.air_max_product.pk})
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        data = response.data["data"]
+        self.assertEqual(data["deleted_objects"][0]["pk"], self.air_max_product.pk)
+        self.assertEqual(data["model_count"], {"products": 1, "reviews": self.air_max_product.reviews.count()})
+        self.assertEqual(data["perms_needed"], [])
+        self.assertEqual(data["protected"][0]["pk"], self.product_contract_1.pk)
+        self.assertTrue(Product.objects.filter(pk=self.air_max_product.pk).exists())
+
+    def test_get_deleted_objects_summary(self):
+        product_admin = site._registry[Product]
+        request = self.factory.get("/")
+        request.user = self.user
+        objs = [self.air_max_product]
+        to_delete, model_count, perms_needed, protected = product_admin.get_deleted_objects(objs, request)
+        self.assertEqual(len(to_delete), 2)
+
+        # The reviews are counted instead of being fetched.
+        with CaptureQueriesContext(connection) as queries:
+            summary = product_admin.get_deleted_objects(objs, request, summary=True)
+        self.assertEqual(summary, ([], model_count, perms_needed, protected))
+        review_queries = [query["sql"] for query in queries if '"mock_app_review"' in query["sql"]]
+        self.assertEqual(len(review_queries), 1)
+        self.assertIn("COUNT(", review_queries[0])
+
+        # The protected objects are capped.
+        Contract.objects.create(product=self.air_max_product, name="Air Max Contract 2")
+        with mock.patch("django_api_admin.utils.get_deleted_objects.SUMMARY_PROTECTED_LIMIT", 1):
+            _to_delete, _model_count, _perms_needed, protected = product_admin.get_deleted_objects(objs, request, summary=True)
+        self.assertEqual(len(protected), 1)
+
+        # Rows referencing the objects through several fields are counted once.
+        self.air_max_product.related_products.add(self.air_max_product, self.stan_smith_product)
+        through = Product.related_products.through
+        _to_delete, model_count, _perms_needed, _protected = product_admin.get_deleted_objects(objs, request, summary=True)
+        self.assertEqual(model_count[through._meta.verbose_name_plural], 3)
+
+        # The permissions are checked per model.
+        with mock.patch.object(product_admin, "has_delete_permission", return_value=False):
+            _to_delete, _model_count, perms_needed, _protected = product_admin.get_deleted_objects(objs, request, summary=True)
+        self.assertEqual(perms_needed, {"product"})
+
     def test_delete_view_bad_to_field(self):
         url = reverse("api_admin:%s_%s_delete" % self.product_info, kwargs={"object_id": 1}) + f"?{TO_FIELD_VAR}=name"
         response = self.client.delete(url)
@@ -531,6 +923,729 @@ class ModelAdminTestCase(APITestCase, URLPatternsTestCase):
         self.assertEqual(response.data["status"], 200)
         self.assertEqual(response.data["data"][0]["stock_status"], "out_of_stock")
 
+    def test_bulk_operations_are_request_scoped(self):
+        url = reverse("api_admin:%s_%s_changelist" % self.product_info)
+        change_url = reverse("api_admin:%s_%s_change" % self.product_info, kwargs={"object_id": 1})
+
+        # The errors of a request don't leak into the next requests.
+        response = self.client.put(url, {"data": [{"pk": 1, "stock_status": "sold"}]}, format="json")
+        self.assertEqual(response.status_code, 400)
+        response = self.client.put(url, {"data": [{"pk": 2, "stock_status": "out_of_stock"}]}, format="json")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(list(response.data["data"]), [0])
+        response = self.client.patch(change_url, {"data": {}, "inlines": {"mock_app.unknown": {}}}, format="json")
+        self.assertEqual(response.status_code, 400)
+        response = self.client.patch(change_url, {"data": {}, "inlines": {"mock_app.review": {}}}, format="json")
+        self.assertEqual(response.status_code, 200)
+
+        # Operations validated concurrently only see their own data.
+        model_admin = site._registry[Product]
+        request = self.factory.put(url)
+        request.user = self.user
+        serializer_class = model_admin.get_changelist_serializer_class(request)
+        instances = list(Product.objects.all())
+        barrier = threading.Barrier(8)
+        failures, serializers = [], []
+
+        def validate(n):
+            barrier.wait()
+            for i in range(50):
+                instance = instances[(n + i) % len(instances)]
+                stock_status = "in_stock" if n % 2 else "sold"
+                data = [{"pk": instance.pk, "stock_status": stock_status}]
+                operation = ChangelistBulkOperation(request, model_admin, instances, data, serializer_class)
+                valid = operation.is_valid()
+                if valid != bool(n % 2) or set(operation.errors) | set(operation.result) != {0}:
+                    failures.append((n, operation.errors, operation.result))
+                serializers.extend(weakref.ref(serializer) for serializer, _ in operation.result.values())
+
+                operation = InlineBulkOperation(request, model_admin, instance, {"mock_app.thread%d" % n: {}})
+                if operation.is_valid() or set(operation.errors) != {"mock_app.thread%d" % n}:
+                    failures.append((n, operation.errors))
+
+        threads = [threading.Thread(target=validate, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(failures, [])
+
+        # Nothing holds on to the serializers once the operations are gone.
+        gc.collect()
+        self.assertEqual(len(serializers), 200)
+        self.assertFalse(any(ref() is not None for ref in serializers))
+
+    def test_changelist_bulk_save(self):
+        url = reverse("api_admin:%s_%s_changelist" % self.product_info)
+        model_admin = site._registry[Product]
+        products = [self.air_max_product, self.stan_smith_product, self.air_force_product, self.timberland_product]
+        data = [{"pk": product.pk, "stock_status": "pre_order", "price": "100.00"} for product in products[:3]]
+        data.append({"pk": products[3].pk, "stock_status": "pre_order", "price": "250.00"})
+        data.append({"pk": self.jordan_product.pk, "stock_status": "in_stock", "price": "150.00"})
+
+        date_updated = Product.objects.get(pk=products[3].pk).date_updated
+        with mock.patch.multiple(model_admin, list_editable=("stock_status", "price"), list_editable_bulk_save=True):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.put(url, {"data": data}, format="json")
+        self.assertEqual(response.status_code, 200)
+        # The auto_now fields are updated like save() does.
+        self.assertGreater(Product.objects.get(pk=products[3].pk).date_updated, date_updated)
+        self.assertEqual(len(response.data["data"]), 5)
+        sql = [query["sql"] for query in queries.captured_queries]
+        # A query per group of changed fields and one for the log entries.
+        self.assertEqual(len([query for query in sql if query.startswith("UPDATE")]), 2)
+        self.assertEqual(len([query for query in sql if query.startswith('INSERT INTO "django_api_admin_log"')]), 1)
+        self.assertEqual(
+            set(Product.objects.filter(stock_status="pre_order").values_list("pk", flat=True)), {p.pk for p in products}
+        )
+        self.assertEqual(Product.objects.get(pk=products[3].pk).price, Decimal("250.00"))
+        log_entries = LogEntry.objects.filter(object_id__in=[str(product.pk) for product in products]).order_by("object_id")
+        self.assertEqual(len(log_entries), 4)
+        self.assertEqual(log_entries[3].get_change_message(), "Changed Stock status and Price.")
+
+        # Rows with an unknown pk are reported without saving the others.
+        with mock.patch.object(model_admin, "list_editable_bulk_save", True):
+            response = self.client.put(url, {"data": [{"pk": 1, "stock_status": "in_stock"}, {"pk": [1]}]}, format="json")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(list(response.data["errors"]), [1])
+
+        # An overridden save_model() is called for each row.
+        saved = []
+
+        def save_model(self, request, obj, serializer, change):
+            saved.append(obj.pk)
+            obj.save()
+
+        data = [{"pk": product.pk, "stock_status": "in_stock"} for product in products[:2]]
+        with (
+            mock.patch.object(model_admin, "list_editable_bulk_save", True),
+            mock.patch.object(ProductAdmin, "save_model", save_model),
+        ):
+            response = self.client.put(url, {"data": data}, format="json")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(saved, [products[0].pk, products[1].pk])
+
+        # Rows whose model overrides save() are saved one at a time too.
+        saved = []
+
+        def save(self, *args, **kwargs):
+            saved.append(self.pk)
+            super(Product, self).save(*args, **kwargs)
+
+        data = [{"pk": product.pk, "stock_status": "pre_order"} for product in products[:2]]
+        with mock.patch.object(model_admin, "list_editable_bulk_save", True), mock.patch.object(Product, "save", save):
+            response = self.client.put(url, {"data": data}, format="json")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(saved, [products[0].pk, products[1].pk])
+        self.assertEqual(Product.objects.filter(stock_status="pre_order", pk__in=saved).count(), 2)
+
+    def test_bulk_set_m2m(self):
+        order = Order.objects.create(customer=self.customer)
+        other_order = Order.objects.create(customer=self.customer)
+        order.products.set([self.air_max_product, self.stan_smith_product])
+        other_order.products.set([self.jordan_product])
+        field = Order._meta.get_field("products")
+        self.assertTrue(can_bulk_set_m2m(field))
+        self.assertFalse(can_bulk_set_m2m(Product._meta.get_field("related_products")))
+
+        with CaptureQueriesContext(connection) as queries:
+            bulk_set_m2m(
+                field,
+                {
+                    order: [self.stan_smith_product, self.timberland_product],
+                    other_order: [str(self.jordan_product.pk), self.air_force_product.pk],
+                },
+            )
+        # The deletion runs a SELECT first when delete signals are connected.
+        self.assertLessEqual(len(queries), 4)
+        self.assertEqual(set(order.products.all()), {self.stan_smith_product, self.timberland_product})
+        self.assertEqual(set(other_order.products.all()), {self.jordan_product, self.air_force_product})
+
+    def test_changelist_stages_run_once(self):
+        url = reverse("api_admin:%s_%s_changelist" % self.product_info)
+        model_admin = site._registry[Product]
+        get_changelist_instance = model_admin.get_changelist_instance
+        changelists = []
+
+        def record_changelist_instance(request):
+            changelists.append(get_changelist_instance(request))
+            return changelists[-1]
+
+        with mock.patch.object(model_admin, "get_changelist_instance", record_changelist_instance):
+            response = self.client.get(url, {"stock_status__exact": "in_stock", "q": "Adidas"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            dict(changelists[0].state.runs),
+            {"filters": 1, "queryset": 1, "results": 1, "result_count": 1, "full_result_count": 1, "facets": 1},
+        )
+
+    def test_changelist_facets_share_aggregate_queries(self):
+        url = reverse("api_admin:%s_%s_changelist" % self.product_info)
+        Category.objects.create(name="Apparel", slug="apparel", description="apparel products")
+
+        # Filters that aren't in use are counted together over the changelist queryset.
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        facet_queries = [q for q in queries.captured_queries if '"f0_' in q["sql"]]
+        self.assertEqual(len(facet_queries), 1)
+        category_filter, stock_status_filter = response.data["data"]["config"]["filters"]
+        footwear = next(choice for choice in category_filter["choices"] if choice["display"].startswith("Footwear"))
+        self.assertEqual(footwear["count"], Product.objects.filter(category__name="Footwear").count())
+
+        # An active filter's facets exclude its own parameters.
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, {"stock_status__exact": "in_stock"})
+        facet_queries = [q for q in queries.captured_queries if '"f0_' in q["sql"]]
+        self.assertEqual(len(facet_queries), 2)
+        stock_status_filter = response.data["data"]["config"]["filters"][1]
+        out_of_stock = next(choice for choice in stock_status_filter["choices"] if choice["display"].startswith("Out"))
+        self.assertEqual(out_of_stock["count"], Product.objects.filter(stock_status="out_of_stock").count())
+
+    def test_changelist_facet_cache(self):
+        url = reverse("api_admin:%s_%s_changelist" % self.product_info)
+        caches["default"].clear()
+
+        def get_stock_status_filter():
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(url)
+            facet_queries = [q for q in queries.captured_queries if '"f0_' in q["sql"]]
+            return response.data["data"]["config"]["filters"][0], len(facet_queries)
+
+        with mock.patch.multiple(ChoicesFieldListFilter, facet_cache=True):
+            stock_status_filter, facet_queries = get_stock_status_filter()
+            self.assertEqual(facet_queries, 1)
+            self.assertEqual(get_stock_status_filter(), (stock_status_filter, 0))
+
+            # Saving a product invalidates the cached counts.
+            self.air_max_product.stock_status = "out_of_stock"
+            self.air_max_product.save()
+            stock_status_filter, facet_queries = get_stock_status_filter()
+            self.assertEqual(facet_queries, 1)
+            self.assertFalse(stock_status_filter["facets_stale"])
+
+            # Unless stale counts may be served.
+            self.jordan_product.delete()
+            with mock.patch.object(ChoicesFieldListFilter, "facet_cache_serve_stale", True):
+                stale_filter, facet_queries = get_stock_status_filter()
+            self.assertEqual(facet_queries, 0)
+            self.assertTrue(stale_filter["facets_stale"])
+            self.assertEqual(stale_filter["choices"], stock_status_filter["choices"])
+
+    def test_all_values_filter_max_values(self):
+        url = reverse("api_admin:%s_%s_changelist" % self.product_info)
+        model_admin = site._registry[Product]
+        caches["default"].clear()
+
+        def get_price_filter():
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(url)
+            values_queries = [q for q in queries.captured_queries if "ORDER BY COUNT(*) DESC" in q["sql"]]
+            return response.data["data"]["config"]["filters"][0], len(values_queries)
+
+        with (
+            mock.patch.object(model_admin, "list_filter", ("price",)),
+            mock.patch.multiple(AllValuesFieldListFilter, max_values=2, values_cache=True),
+        ):
+            # The two most frequent prices, ordered by price.
+            price_filter, values_queries = get_price_filter()
+            self.assertEqual(values_queries, 1)
+            self.assertTrue(price_filter["more"])
+            self.assertEqual([choice["display"] for choice in price_filter["choices"]], ["All", "100.00 (3)", "150.00 (1)"])
+            self.assertEqual(get_price_filter(), (price_filter, 0))
+
+            # The selected price is a choice even when it isn't among the most frequent ones.
+            response = self.client.get(url, {"price": "200.00"})
+            price_filter = response.data["data"]["config"]["filters"][0]
+            self.assertEqual(
+                [(choice["display"], choice["selected"]) for choice in price_filter["choices"]],
+                [("All", False), ("200.00 (1)", True), ("100.00 (3)", False), ("150.00 (1)", False)],
+            )
+
+            # Saving a product invalidates the cached values.
+            self.timberland_product.price = 100
+            self.timberland_product.save()
+            price_filter, values_queries = get_price_filter()
+            self.assertEqual(values_queries, 1)
+            self.assertEqual([choice["display"] for choice in price_filter["choices"]], ["All", "100.00 (4)", "150.00 (1)"])
+            self.assertFalse(price_filter["more"])
+
+    def test_data_version_receivers(self):
+        url = reverse("api_admin:%s_%s_changelist" % self.product_info)
+        model_admin = site._registry[Product]
+        caches["default"].clear()
+        # The receivers are connected when the models are registered, for the
+        # registered models and the related models of their list_filter, so
+        # that writes bump the versions in processes that don't read the caches.
+        self.assertTrue(post_save.has_listeners(Product))
+        self.assertTrue(post_delete.has_listeners(Category))
+        self.assertFalse(post_save.has_listeners(Location))
+        version = get_model_data_version(Product)
+        category = Category.objects.create(name="Apparel", slug="apparel", description="apparel products")
+        self.assertNotEqual(get_model_data_version(Product), version)
+        version = get_model_data_version(Product)
+        category.delete()
+        self.assertNotEqual(get_model_data_version(Product), version)
+
+        def get_category_names():
+            response = self.client.get(url)
+            return [choice["display"] for choice in response.data["data"]["config"]["filters"][0]["choices"]]
+
+        # The values of a field of an unregistered related model are cached
+        # until the data of that model changes.
+        with (
+            mock.patch.object(model_admin, "list_filter", ("category__name",)),
+            mock.patch.object(AllValuesFieldListFilter, "values_cache", True),
+        ):
+            self.assertEqual(get_category_names(), ["All", "Footwear (5)"])
+            self.footwear_category.name = "Shoes"
+            self.footwear_category.save()
+            self.assertEqual(get_category_names(), ["All", "Shoes (5)"])
+        self.assertFalse(post_save.has_listeners(Location))
+
+    def test_changelist_loads_only_displayed_columns(self):
+        url = reverse("api_admin:%s_%s_changelist" % self.product_info)
+        model_admin = site._registry[Product]
+
+        def loads_description():
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            return any('"mock_app_product"."description"' in q["sql"] for q in queries.captured_queries)
+
+        self.assertFalse(loads_description())
+        # Callables that don't declare the fields they read load every column.
+        with mock.patch.object(model_admin, "list_display", ("__str__", "price")):
+            self.assertTrue(loads_description())
+        with mock.patch.object(model_admin, "list_only", False):
+            self.assertTrue(loads_description())
+
+    def test_changelist_display_annotations(self):
+        url = reverse("api_admin:%s_%s_changelist" % self.product_info)
+        model_admin = site._registry[Product]
+        with mock.patch.object(model_admin, "list_display", ("name", "average_rating")):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(url, {"o": "-1"})
+        self.assertEqual(response.status_code, 200)
+        # The ratings are annotated instead of being queried for each row.
+        self.assertFalse(any('FROM "mock_app_review" WHERE' in q["sql"] for q in queries.captured_queries))
+        first_row = response.data["data"]["rows"][0]["cells"]
+        self.assertEqual(first_row["name"], "Air Max")
+        self.assertAlmostEqual(first_row["average_rating"], 8 / 3)
+        self.assertEqual(response.data["data"]["config"]["ordering_field_columns"], {1: "desc"})
+
+        # Unless the ordering sorts by them, the values are only annotated
+        # on the displayed page, not on the count and facet queries.
+        with mock.patch.object(model_admin, "list_display", ("name", "average_rating")):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(url, {"o": "0"})
+        self.assertEqual(response.status_code, 200)
+        avg_queries = [q["sql"] for q in queries.captured_queries if "AVG(" in q["sql"]]
+        self.assertEqual(len(avg_queries), 1)
+        self.assertNotIn("COUNT(", avg_queries[0])
+        rows = {row["cells"]["name"]: row["cells"]["average_rating"] for row in response.data["data"]["rows"]}
+        self.assertAlmostEqual(rows["Air Max"], 8 / 3)
+
+    def test_changelist_sparse_fields(self):
+        url = reverse("api_admin:%s_%s_changelist" % self.product_info)
+        model_admin = site._registry[Product]
+        with mock.patch.object(model_admin, "list_display", ("__str__", "name", "average_rating", "price")):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(url, {"fields": "price,name", "o": "-1"})
+        self.assertEqual(response.status_code, 200)
+        data = response.data["data"]
+        self.assertEqual([column["field"] for column in data["columns"]], ["name", "price"])
+        self.assertEqual(set(data["rows"][0]["cells"]), {"name", "price"})
+        # The callables that aren't requested are neither annotated nor
+        # read, and don't load every column.
+        sql = " ".join(q["sql"] for q in queries.captured_queries)
+        self.assertNotIn('"mock_app_review"', sql)
+        self.assertNotIn('"mock_app_product"."description"', sql)
+        # The ordering indices refer to the requested columns.
+        self.assertEqual(data["config"]["ordering_field_columns"], {1: "desc"})
+        expected = list(Product.objects.order_by("-price", "-pk").values_list("name", flat=True))
+        self.assertEqual([row["cells"]["name"] for row in data["rows"]], expected[: model_admin.list_per_page])
+
+        response = self.client.get(url, {"fields": "name,description"})
+        self.assertEqual(response.status_code, 400)
+
+    def test_related_filter_choices(self):
+        url = reverse("api_admin:%s_%s_changelist" % self.product_info)
+        choices_url = reverse("api_admin:%s_%s_filter_choices" % self.product_info)
+        model_admin = site._registry[Product]
+
+        def get_choices(data):
+            return [(choice["display"], choice["selected"]) for choice in data["choices"]]
+
+        Category.objects.create(name="Apparel", slug="apparel", description="apparel products")
+
+        with (
+            mock.patch.object(model_admin, "list_filter", ("category", "trademark")),
+            mock.patch.object(RelatedFieldListFilter, "choices_limit", 2),
+        ):
+            # The first choices in the trademark admin's ordering, preceded
+            # by the selected choice.
+            response = self.client.get(url, {"trademark__id__exact": self.adidas_trademark.pk})
+            self.assertEqual(response.status_code, 200)
+            trademark_filter = next(f for f in response.data["data"]["config"]["filters"] if f["field_path"] == "trademark")
+            self.assertTrue(trademark_filter["more"])
+            self.assertEqual(
+                get_choices(trademark_filter),
+                [("All", False), ("Adidas (1)", True), ("Timberland (1)", False), ("Nike (3)", False)],
+            )
+
+            # The other choices are paged through, and counted, by the filter
+            # choices view.
+            response = self.client.get(choices_url, {"_field_path": "trademark", "_page": 2, "price__gt": 150})
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(get_choices(response.data["data"]), [("Adidas (0)", False)])
+            self.assertFalse(response.data["data"]["pagination"]["more"])
+            choice = response.data["data"]["choices"][0]
+            self.assertIn("price__gt=150", choice["query_string"])
+            self.assertNotIn("_page", choice["query_string"])
+
+            # And searched with the related model admin's search_fields.
+            response = self.client.get(choices_url, {"_field_path": "trademark", "_term": "nik"})
+            self.assertEqual(get_choices(response.data["data"]), [("Nike (3)", False)])
+
+            # Categories aren't registered, and can't be searched.
+            response = self.client.get(choices_url, {"_field_path": "category", "_term": "foot"})
+            self.assertEqual(response.status_code, 409)
+            response = self.client.get(choices_url, {"_field_path": "stock_status"})
+            self.assertEqual(response.status_code, 404)
+
+    def test_changelist_cursor_pagination(self):
+        url = reverse("api_admin:%s_%s_changelist" % self.product_info)
+        model_admin = site._registry[Product]
+        with mock.patch.object(model_admin, "changelist_pagination", "cursor"):
+            # Walk forward through the pages ordering by price, which has ties.
+            names, cursor, pages = [], None, []
+            while True:
+                params = {"o": "2", "pp": 2, **({"cursor": cursor} if cursor else {})}
+                with CaptureQueriesContext(connection) as queries:
+                    response = self.client.get(url, params)
+                # Facet counts aside, no COUNT(*) nor OFFSET queries are issued.
+                self.assertFalse(any('"__count"' in q["sql"] or "OFFSET" in q["sql"] for q in queries.captured_queries))
+                self.assertEqual(response.status_code, 200)
+                config = response.data["data"]["config"]
+                self.assertIsNone(config["result_count"])
+                self.assertIsNone(config["page_count"])
+                page = [row["cells"]["name"] for row in response.data["data"]["rows"]]
+                pages.append((page, config["prev_cursor"]))
+                names.extend(page)
+                cursor = config["next_cursor"]
+                if cursor is None:
+                    break
+
+            expected = list(Product.objects.order_by("price", "-pk").values_list("name", flat=True))
+            self.assertEqual(names, expected)
+            self.assertEqual(len(pages), 3)
+
+            # Going back from the last page returns the previous page.
+            response = self.client.get(url, {"o": "2", "pp": 2, "cursor": pages[-1][1]})
+            self.assertEqual([row["cells"]["name"] for row in response.data["data"]["rows"]], pages[-2][0])
+
+            # A tampered cursor is rejected.
+            response = self.client.get(url, {"o": "2", "pp": 2, "cursor": "tampered"})
+            self.assertEqual(response.status_code, 400)
+
+    def test_changelist_count_strategy(self):
+        url = reverse("api_admin:%s_%s_changelist" % self.product_info)
+        model_admin = site._registry[Product]
+        total = Product.objects.count()
+
+        # Estimates come from the planner statistics, which only describe whole tables.
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+        with mock.patch.multiple(model_admin, count_strategy="estimated", count_estimate_threshold=0):
+            response = self.client.get(url, {"stock_status__exact": "in_stock"})
+        config = response.data["data"]["config"]
+        self.assertEqual(config["count_strategy"], {"full_count": "estimated", "result_count": "exact"})
+        self.assertEqual(config["full_count"], total)
+
+        # Cached counts are reused until they expire.
+        caches["default"].clear()
+        with mock.patch.object(model_admin, "count_strategy", "cached"):
+            self.client.get(url)
+            Product.objects.create(name="Cached", category_id=1, trademark_id=1, price=1, description="")
+            response = self.client.get(url)
+        config = response.data["data"]["config"]
+        self.assertEqual(config["count_strategy"], {"full_count": "cached", "result_count": "cached"})
+        self.assertEqual(config["result_count"], total)
+
+        # The full count and the result count are cached apart, even when a
+        # list filter filters the results without any parameter.
+        class InStockFilter(SimpleListFilter):
+            title = "stock"
+            parameter_name = "stock"
+
+            def lookups(self, request, model_admin):
+                return [("all", "All")]
+
+            def queryset(self, request, queryset):
+                if self.value() != "all":
+                    return queryset.filter(stock_status="in_stock")
+                return queryset
+
+        caches["default"].clear()
+        with mock.patch.multiple(model_admin, count_strategy="cached", list_filter=[InStockFilter]):
+            response = self.client.get(url)
+        config = response.data["data"]["config"]
+        self.assertEqual(config["result_count"], Product.objects.filter(stock_status="in_stock").count())
+        self.assertEqual(config["full_count"], Product.objects.count())
+
+    def test_changelist_column_plan(self):
+        model_admin = ProductAdmin(Product, site)
+        fields_list = ("name", "category", "stock_status", "average_rating")
+        plan = model_admin.get_column_plan(fields_list)
+        self.assertIs(model_admin.get_column_plan(list(fields_list)), plan)
+
+        # Only the most recently used plans are kept.
+        with mock.patch("django_api_admin.admins.model_admin.COLUMN_PLAN_CACHE_SIZE", 2):
+            model_admin.get_column_plan(("name",))
+            model_admin.get_column_plan(fields_list)
+            model_admin.get_column_plan(("price",))
+        self.assertEqual(list(model_admin._column_plan_cache), [fields_list, ("price",)])
+        self.assertIs(model_admin.get_column_plan(fields_list), plan)
+
+        product = Product.objects.get(pk=1)
+        cells = {name: getter(product) if to_repr is None else to_repr(getter(product)) for name, getter, to_repr in plan}
+        self.assertEqual(cells["name"], product.name)
+        self.assertEqual(cells["category"], str(product.category))
+        self.assertEqual(cells["stock_status"], product.get_stock_status_display())
+        self.assertEqual(cells["average_rating"], model_admin.average_rating(product))
+
+    def test_changelist_streaming(self):
+        url = reverse("api_admin:%s_%s_changelist" % self.product_info)
+        model_admin = site._registry[Product]
+        params = {"stock_status__exact": "in_stock", "pp": 3}
+        expected = json.loads(self.client.get(url, params).content)
+
+        with mock.patch.object(model_admin, "changelist_streaming", True):
+            response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        content = b"".join(response.streaming_content)
+        self.assertEqual(json.loads(content), expected)
+        # The rows are streamed after the columns and config.
+        self.assertGreater(content.index(b'"rows"'), content.index(b'"config"'))
+        self.assertEqual(len(expected["data"]["rows"]), 3)
+
+    def test_changelist_compact_layouts(self):
+        url = reverse("api_admin:%s_%s_changelist" % self.product_info)
+        params = {"o": "0"}
+        expected = self.client.get(url, params).data["data"]["rows"]
+        fields = [column["field"] for column in self.client.get(url, params).data["data"]["columns"]]
+
+        def decode(data, rows):
+            tables = data["dictionaries"]
+            return [
+                {
+                    "id": pk,
+                    "cells": {
+                        field: tables[field][value] if field in tables else value for field, value in zip(fields, values)
+                    },
+                }
+                for pk, values in zip(data["ids"], rows)
+            ]
+
+        data = self.client.get(url, {**params, "layout": "arrays"}).data["data"]
+        self.assertIn("category", data["dictionaries"])
+        self.assertNotIn("name", data["dictionaries"])
+        self.assertEqual(len(data["dictionaries"]["category"]), len({row["cells"]["category"] for row in expected}))
+        self.assertEqual(decode(data, data["rows"]), expected)
+
+        data = self.client.get(url, {**params, "layout": "columns"}).data["data"]
+        self.assertEqual(len(data["rows"]), len(fields))
+        self.assertEqual(decode(data, zip(*data["rows"])), expected)
+
+        response = self.client.get(url, {"layout": "rows"})
+        self.assertEqual(response.status_code, 400)
+
+    @skipUnless(orjson and msgpack, "requires orjson and msgpack")
+    def test_fast_renderers(self):
+        url = reverse("api_admin:%s_%s_changelist" % self.product_info)
+        changelist = self.client.get(url).data
+        url = reverse("api_admin:%s_%s_add" % self.product_info)
+        form_description = self.client.get(url).data
+        data = {
+            "changelist": changelist,
+            "form_description": form_description,
+            "values": [Decimal("10.50"), _("Lazy"), datetime(2026, 1, 2, 3, 4, 5, 6000), {1: "desc"}],
+        }
+        expected = json.loads(renderer.render(data))
+        self.assertEqual(json.loads(ORJSONRenderer().render(data)), expected)
+        # MessagePack keeps integer keys, which JSON turns into strings.
+        unpacked = msgpack.unpackb(MessagePackRenderer().render(data), strict_map_key=False)
+        self.assertEqual(unpacked["values"][3], {1: "desc"})
+        self.assertEqual(json.loads(json.dumps(unpacked)), expected)
+
+    def test_export_view(self):
+        url = reverse("api_admin:%s_%s_export" % self.product_info)
+        model_admin = site._registry[Product]
+
+        response = self.client.get(url, {"format": "csv", "stock_status__exact": "in_stock", "o": "0"})
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Disposition"], 'attachment; filename="product.csv"')
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual(lines[0], "name,category,price,stock status")
+        self.assertEqual(
+            lines[1:],
+            [
+                "Air Max,Footwear,100.00,In Stock",
+                "Jordan,Footwear,150.00,In Stock",
+                "Stan Smith,Footwear,100.00,In Stock",
+                "Timberland,Footwear,200.00,In Stock",
+            ],
+        )
+
+        # Rows are read in chunks rather than all at once.
+        with mock.patch.multiple(model_admin, export_fields=("name", "average_rating"), export_chunk_size=2):
+            response = self.client.get(url, {"q": "Air Max"}, HTTP_ACCEPT="application/x-ndjson")
+            self.assertEqual(response["Content-Type"], "application/x-ndjson; charset=utf-8")
+            rows = [json.loads(line) for line in b"".join(response.streaming_content).splitlines()]
+        self.assertEqual(rows, [{"name": "Air Max", "average_rating": 8 / 3}])
+
+        # Errors are rendered as JSON.
+        response = self.client.get(url, {"format": "csv", "not_a_field": "1"})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response["Content-Type"], "application/json")
+
+    def test_search_plan(self):
+        model_admin = ProductAdmin(Product, site)
+        request = self.factory.get("/")
+        request.user = self.user
+        plan = model_admin.get_search_plan(model_admin.search_fields)
+        self.assertIs(model_admin.get_search_plan(list(model_admin.search_fields)), plan)
+        self.assertFalse(plan[1])
+
+        # Exact lookups on non-text fields skip the terms that aren't valid for the field.
+        with mock.patch.object(model_admin, "search_fields", ("=name", "price__exact")):
+            self.assertIsNot(model_admin.get_search_plan(model_admin.search_fields), plan)
+            (_, name_to_python), (_, price_to_python) = model_admin.get_search_plan(model_admin.search_fields)[0]
+            self.assertIsNone(name_to_python)
+            self.assertIsNotNone(price_to_python)
+            queryset, _ = model_admin.get_search_results(request, Product.objects.all(), "200")
+            self.assertEqual(set(queryset.values_list("name", flat=True)), {"Timberland"})
+            queryset, _ = model_admin.get_search_results(request, Product.objects.all(), "jordan")
+            self.assertEqual(set(queryset.values_list("name", flat=True)), {"Jordan"})
+
+    def test_changelist_removes_duplicates_with_exists(self):
+        url = reverse("api_admin:%s_%s_changelist" % self.product_info)
+        model_admin = site._registry[Product]
+        self.air_max_product.related_products.add(self.air_force_product, self.jordan_product)
+        self.stan_smith_product.related_products.add(self.air_max_product)
+
+        def search(term):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(url, {"q": term})
+            self.assertEqual(response.status_code, 200)
+            names = [row["cells"]["name"] for row in response.data["data"]["rows"]]
+            sql = next(q["sql"] for q in queries.captured_queries if '"mock_app_product"."name"' in q["sql"])
+            return names, response.data["data"]["config"]["result_count"], sql
+
+        with mock.patch.object(model_admin, "search_fields", ("name", "related_products__name")):
+            names, result_count, sql = search("Air")
+            self.assertEqual(sorted(names), ["Air Force", "Air Max", "Jordan", "Stan Smith"])
+            self.assertEqual(result_count, 4)
+            self.assertIn("EXISTS", sql)
+            self.assertNotIn("DISTINCT", sql)
+
+            with mock.patch.object(model_admin, "use_distinct", True):
+                distinct_names, result_count, sql = search("Air")
+            self.assertEqual(distinct_names, names)
+            self.assertEqual(result_count, 4)
+            self.assertIn("DISTINCT", sql)
+            self.assertNotIn("EXISTS", sql)
+
+        # Only the conditions spanning multi-valued relations are in the subquery.
+        request = self.factory.get("/")
+        request.user = self.user
+        queryset = Product.objects.filter(stock_status="in_stock").filter(related_products__name__icontains="air")
+        names = sorted(queryset.distinct().values_list("name", flat=True))
+        queryset = model_admin.remove_duplicates(request, queryset)
+        self.assertEqual(sorted(queryset.values_list("name", flat=True)), names)
+        outer_sql, subquery_sql = str(queryset.query).split("EXISTS", 1)
+        self.assertIn('"mock_app_product"."stock_status" =', outer_sql)
+        self.assertNotIn("JOIN", outer_sql)
+        self.assertNotIn("stock_status", subquery_sql)
+        self.assertIn("JOIN", subquery_sql)
+
+        # Without conditions on multi-valued relations the queryset is unchanged.
+        queryset = Product.objects.filter(trademark__name="Nike")
+        self.assertIs(model_admin.remove_duplicates(request, queryset), queryset)
+
+    def test_search_backend_postgres_multivalued(self):
+        from django_api_admin.search import PostgresSearchBackend
+
+        class PostgresProductAdmin(ProductAdmin):
+            search_fields = ("name", "reviews__review_title")
+
+        model_admin = PostgresProductAdmin(Product, site)
+        request = self.factory.get("/")
+        request.user = self.user
+        queryset, may_have_duplicates = PostgresSearchBackend(model_admin).search(request, Product.objects.all(), "stan")
+        self.assertTrue(may_have_duplicates)
+        self.assertNotIn("_search_vector", queryset.query.annotation_select)
+
+        # The vector isn't selected and its multi-valued join only stays in the EXISTS subquery.
+        outer_sql, subquery_sql = str(model_admin.remove_duplicates(request, queryset).query).split("EXISTS", 1)
+        self.assertNotIn("to_tsvector", outer_sql)
+        self.assertNotIn("JOIN", outer_sql)
+        self.assertIn("to_tsvector", subquery_sql)
+        self.assertIn('JOIN "mock_app_review"', subquery_sql)
+
+    def test_search_backend_sqlite_fts5(self):
+        class FTSProductAdmin(ProductAdmin):
+            search_backend = "django_api_admin.search.SQLiteFTS5SearchBackend"
+            search_fields = ("name", "description", "trademark__name", "reviews__review_title")
+
+        model_admin = FTSProductAdmin(Product, site)
+        dispatch_uid = "django_api_admin.search.mock_app.product"
+        self.addCleanup(post_save.disconnect, sender=Product, dispatch_uid=dispatch_uid)
+        self.addCleanup(post_delete.disconnect, sender=Product, dispatch_uid=dispatch_uid)
+        for model, relation_path in ((Trademark, "trademark"), (Review, "reviews")):
+            for signal in (post_save, pre_delete, post_delete):
+                self.addCleanup(signal.disconnect, sender=model, dispatch_uid="%s.%s" % (dispatch_uid, relation_path))
+        request = self.factory.get("/")
+        request.user = self.user
+
+        def search(term):
+            queryset, may_have_duplicates = model_admin.get_search_results(request, Product.objects.all(), term)
+            return set(queryset.values_list("name", flat=True)), may_have_duplicates, str(queryset.query)
+
+        # Without an index the search falls back to icontains lookups.
+        self.assertNotIn("MATCH", search("stan")[2])
+
+        # The index is picked up when it's built by another process.
+        with mock.patch.dict(site._registry, {Product: FTSProductAdmin(Product, site)}):
+            call_command("build_search_index", "mock_app.Product", verbosity=0)
+        names, may_have_duplicates, sql = search("stan")
+        self.assertEqual(names, {"Stan Smith"})
+        self.assertFalse(may_have_duplicates)
+        self.assertIn("MATCH", sql)
+        self.assertEqual(search("adid")[0], {"Stan Smith"})
+
+        # The index follows saves of the model and of the related models.
+        Product.objects.create(
+            name="Samba", price=90, stock_status="in_stock", trademark=self.adidas_trademark, category=self.footwear_category
+        )
+        self.assertEqual(search("samba")[0], {"Samba"})
+        self.adidas_trademark.name = "Originals"
+        self.adidas_trademark.save()
+        self.assertEqual(search("originals")[0], {"Stan Smith", "Samba"})
+        review = Review.objects.create(
+            product=self.stan_smith_product, customer=self.customer, review_title="Squeaky", review_content="", rating=2
+        )
+        self.assertEqual(search("squeaky")[0], {"Stan Smith"})
+        review.delete()
+        self.assertEqual(search("squeaky")[0], set())
+
+        # Once the index exists, it's only introspected once per database.
+        with mock.patch.object(connection.introspection, "table_names") as table_names:
+            self.assertEqual(search("stan")[0], {"Stan Smith"})
+        table_names.assert_not_called()
+
     def test_get_serializer_class(self):
         request = self.factory.get("/")
         request.user = self.user
@@ -654,6 +1769,73 @@ class InlineAdminTestCase(APITestCase, URLPatternsTestCase):
         self.assertEqual(len(response.data["data"]["inlines"]["mock_app.review"]["delete"]), 1)
         self.assertEqual(response.data["data"]["inlines"]["mock_app.review"]["delete"][0]["review_title"], "Not bad product")
 
+    def test_inline_bulk_save(self):
+        url = reverse("api_admin:%s_%s_change" % self.product_info, kwargs={"object_id": self.jordan_product.pk})
+
+        def edit_reviews(count):
+            reviews = Review.objects.bulk_create(
+                Review(
+                    product=self.jordan_product,
+                    customer=self.customer,
+                    review_title="Review %d" % i,
+                    review_content="Content",
+                    rating=3,
+                )
+                for i in range(2 * count)
+            )
+            inline_data = {
+                "add": [
+                    {"rating": 5, "review_title": "New %d" % i, "review_content": "New", "customer": self.customer.pk}
+                    for i in range(count)
+                ],
+                "change": [
+                    {
+                        "pk": review.pk,
+                        "rating": 4,
+                        "review_title": review.review_title,
+                        "review_content": "Changed",
+                        "customer": self.customer.pk,
+                    }
+                    for review in reviews[:count]
+                ],
+                "delete": [review.pk for review in reviews[count:]],
+            }
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.patch(url, {"data": {}, "inlines": {"mock_app.review": inline_data}}, format="json")
+            self.assertEqual(response.status_code, 200)
+            return len(queries)
+
+        # The number of queries doesn't depend on the number of inline rows.
+        with mock.patch.multiple(ReviewInline, max_num=None, bulk_save=True):
+            edit_reviews(2)
+            self.assertEqual(edit_reviews(4), edit_reviews(40))
+        reviews = Review.objects.filter(product=self.jordan_product)
+        self.assertEqual(reviews.count(), 92)
+        self.assertEqual(reviews.filter(review_content="Changed", rating=4).count(), 46)
+        self.assertEqual(reviews.filter(review_title__startswith="New").count(), 46)
+
+        # Models overriding delete() are deleted one at a time.
+        review = reviews.first()
+        with (
+            mock.patch.object(ReviewInline, "bulk_save", True),
+            mock.patch.object(Review, "delete", autospec=True) as delete,
+        ):
+            response = self.client.patch(
+                url, {"data": {}, "inlines": {"mock_app.review": {"delete": [review.pk]}}}, format="json"
+            )
+        self.assertEqual(response.status_code, 200)
+        delete.assert_called_once_with(review)
+
+        # Without bulk_save the objects are deleted one at a time.
+        review = reviews.last()
+        with mock.patch("django_api_admin.admins.model_admin.Collector") as collector:
+            response = self.client.patch(
+                url, {"data": {}, "inlines": {"mock_app.review": {"delete": [review.pk]}}}, format="json"
+            )
+        self.assertEqual(response.status_code, 200)
+        collector.assert_not_called()
+        self.assertFalse(Review.objects.filter(pk=review.pk).exists())
+
     def test_updating_unrelated_inlines(self):
         url = reverse("api_admin:%s_%s_add" % self.product_info)
         data = {